@@ -0,0 +1,117 @@
+"""Solve one day for many input files in parallel
+
+    python -m batch day12 inputs/day12-*.txt --workers 8 --chunksize 4
+    python -m batch day16 many/*.txt --part 2 --json
+
+Input files are handed to a pool of worker processes in chunks of --chunksize
+paths; every worker imports the day module once and reuses it for all the
+chunks it gets. Results are printed as soon as each chunk finishes, so the
+output is in completion order rather than argument order. A file that fails to
+solve is reported with its error and doesn't stop the batch.
+"""
+
+import json
+import os
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, Union
+
+from runner import PhaseResult, load_solver, run_solver
+
+
+@dataclass
+class BatchResult:
+    path: str
+    phases: list[PhaseResult] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def answers(self) -> dict[str, object]:
+        return {p.phase: p.answer for p in self.phases if p.phase != "parse"}
+
+    @property
+    def elapsed_ns(self) -> int:
+        return sum(p.elapsed_ns for p in self.phases)
+
+
+def solve_file(day: str, path: str, parts: tuple[int, ...] = (1, 2)) -> BatchResult:
+    try:
+        data = Path(path).read_text()
+        phases = run_solver(load_solver(day), data, parts=parts, trace_memory=False)
+    except Exception as e:
+        return BatchResult(path=path, error=f"{type(e).__name__}: {e}")
+    return BatchResult(path=path, phases=phases)
+
+
+def solve_chunk(
+    day: str, paths: Sequence[str], parts: tuple[int, ...] = (1, 2)
+) -> list[BatchResult]:
+    return [solve_file(day, path, parts) for path in paths]
+
+
+def run_batch(
+    day: str,
+    paths: Sequence[Union[str, Path]],
+    *,
+    parts: tuple[int, ...] = (1, 2),
+    workers: Optional[int] = None,
+    chunksize: int = 1,
+) -> Iterator[BatchResult]:
+    """solve day for every path, yielding results in completion order
+
+    workers defaults to the number of CPUs. Bigger chunks mean less
+    inter-process traffic but coarser load balancing.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    # fail fast on an unknown day instead of once per file in the workers
+    load_solver(day)
+
+    names = [str(path) for path in paths]
+    chunks = [names[i : i + chunksize] for i in range(0, len(names), chunksize)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(solve_chunk, day, chunk, parts) for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def format_batch_result(result: BatchResult) -> str:
+    if result.error is not None:
+        return f"{result.path}  ERROR {result.error}"
+    answers = "  ".join(str(answer) for answer in result.answers.values())
+    return f"{result.path}  {result.elapsed_ns / 1e6:>10.3f} ms  {answers}"
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("day", help="day module to run, e.g. day05")
+    parser.add_argument("inputs", nargs="+", type=Path)
+    parser.add_argument("--part", type=int, choices=(1, 2), action="append")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count(), help="default one per CPU"
+    )
+    parser.add_argument(
+        "--chunksize", type=int, default=1, help="input files per worker task"
+    )
+    parser.add_argument("--json", action="store_true", help="emit JSON lines")
+    args = parser.parse_args()
+
+    parts = tuple(args.part) if args.part else (1, 2)
+    results = run_batch(
+        args.day,
+        args.inputs,
+        parts=parts,
+        workers=args.workers,
+        chunksize=args.chunksize,
+    )
+    for result in results:
+        if args.json:
+            print(json.dumps(asdict(result), default=str), flush=True)
+        else:
+            print(format_batch_result(result), flush=True)
+
+
+if __name__ == "__main__":
+    main()
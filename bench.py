@@ -0,0 +1,530 @@
+"""Scaling benchmarks and a benchmark regression gate on synthetic inputs
+
+    python -m bench ladder                   # every day, default size ladder
+    python -m bench ladder day14 day16 --scales 0.25 0.5 1 2 4
+    python -m bench record                   # write bench_baseline.json
+    python -m bench check --threshold 0.2    # exit 1 on regressions
+    python -m bench parsers day02            # alternative parsers, side by side
+    python -m bench points                   # lib.Point against a dataclass
+
+ladder runs each solver over a ladder of generated inputs (see generators). For
+every phase the runner reports, the empirical complexity exponent is the slope
+of log(time) against log(input size); an exponent well above 1 points at a
+superlinear hot spot.
+
+record and check time every phase on one fixed-scale input per day, repeated to
+get a median and interquartile range, plus the peak traced memory from one
+extra run. check fails when a phase got slower (or hungrier) than the baseline
+by more than the threshold and by more than the run-to-run noise.
+
+parsers times the alternative parsers a day module registers in its own PARSERS
+dict against each other over the same ladder of generated inputs.
+
+points times lib.Point's common operations and measures its size against the
+frozen dataclass it used to be. For the grid days it also counts the Points each
+solve builds, and from that estimates the time and bytes the change saves.
+"""
+
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from argparse import ArgumentParser
+from dataclasses import asdict, dataclass, field
+from importlib import import_module
+from math import log
+from pathlib import Path
+from statistics import median, quantiles
+from time import perf_counter_ns
+from types import FrameType
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+from generators import generate
+from lib import Point, neighborhood
+from runner import DAYS, load_solver, run_solver
+
+DEFAULT_SCALES = (0.125, 0.25, 0.5, 1.0)
+PHASES = ("parse", "part1", "part2")
+SUPERLINEAR = 1.5
+
+BASELINE_VERSION = 1
+DEFAULT_BASELINE = Path(__file__).parent / "bench_baseline.json"
+# differences below these are never reported, however large relatively
+MIN_TIME_DELTA_NS = 1_000_000
+MIN_MEMORY_DELTA = 64 * 1024
+
+
+@dataclass
+class LadderStep:
+    scale: float
+    input_size: int
+    elapsed_ns: dict[str, int]
+
+
+@dataclass
+class Ladder:
+    day: str
+    steps: list[LadderStep] = field(default_factory=list)
+
+    def exponent(self, phase: str) -> Optional[float]:
+        points = [
+            (s.input_size, s.elapsed_ns[phase])
+            for s in self.steps
+            if s.elapsed_ns.get(phase, 0) > 0
+        ]
+        if len(points) < 2:
+            return None
+        return fit_exponent([n for n, _ in points], [t for _, t in points])
+
+
+def fit_exponent(sizes: Sequence[float], times: Sequence[float]) -> float:
+    """least squares slope of log(times) against log(sizes)"""
+    xs = [log(n) for n in sizes]
+    ys = [log(t) for t in times]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    if var_x == 0:
+        raise ValueError("Need at least two distinct input sizes")
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x
+
+
+def run_ladder(
+    day: str,
+    scales: Sequence[float] = DEFAULT_SCALES,
+    *,
+    repeat: int = 1,
+    seed: int = 0,
+    max_seconds: Optional[float] = None,
+) -> Ladder:
+    """time every phase of day's solver on inputs of increasing scale
+
+    The fastest of `repeat` runs counts. If max_seconds is given, the ladder
+    stops after the first step that takes longer than that.
+    """
+    solver = load_solver(day)
+    ladder = Ladder(day=day)
+    for scale in sorted(scales):
+        data = generate(day, scale, seed)
+        best: dict[str, int] = {}
+        for _ in range(repeat):
+            for phase in run_solver(solver, data, trace_memory=False):
+                best[phase.phase] = min(
+                    best.get(phase.phase, phase.elapsed_ns), phase.elapsed_ns
+                )
+        ladder.steps.append(LadderStep(scale, len(data), best))
+        if max_seconds is not None and sum(best.values()) > max_seconds * 1e9:
+            break
+    return ladder
+
+
+def load_parsers(day: str) -> dict[str, Callable[[str], Any]]:
+    """the interchangeable parsers a day module registers as PARSERS"""
+    load_solver(day)
+    parsers = getattr(import_module(day), "PARSERS", None)
+    if not parsers:
+        raise ValueError(f"No alternative parsers registered for '{day}'")
+    return parsers
+
+
+def compare_parsers(
+    day: str, scales: Sequence[float] = DEFAULT_SCALES, *, repeat: int = 3, seed=0
+) -> Ladder:
+    """time every parser registered for day on a ladder of generated inputs
+
+    The ladder's phases are the parser names. Parsers have to agree on every
+    input, or this raises ValueError.
+    """
+    parsers = load_parsers(day)
+    ladder = Ladder(day=day)
+    for scale in sorted(scales):
+        data = generate(day, scale, seed)
+        best: dict[str, int] = {}
+        results: dict[str, Any] = {}
+        for name, parse in parsers.items():
+            for _ in range(repeat):
+                start = perf_counter_ns()
+                results[name] = parse(data)
+                elapsed = perf_counter_ns() - start
+                best[name] = min(best.get(name, elapsed), elapsed)
+        first, *others = results.values()
+        if any(other != first for other in others):
+            raise ValueError(f"Parsers for {day} disagree at scale {scale}")
+        ladder.steps.append(LadderStep(scale, len(data), best))
+    return ladder
+
+
+def format_ladder(ladder: Ladder, phases: Sequence[str] = PHASES) -> str:
+    lines: list[str] = []
+    for phase in phases:
+        exponent = ladder.exponent(phase)
+        timings = " ".join(f"{s.elapsed_ns[phase] / 1e6:>10.2f}" for s in ladder.steps)
+        if exponent is None:
+            verdict = "     n/a"
+        else:
+            flag = " !" if exponent >= SUPERLINEAR else ""
+            verdict = f"{exponent:>6.2f}{flag}"
+        lines.append(f"{ladder.day} {phase:<6} {verdict:<9} {timings}")
+    return "\n".join(lines)
+
+
+@dataclass
+class PhaseStats:
+    median_ns: float
+    iqr_ns: float
+    peak_memory: int
+
+
+@dataclass
+class Regression:
+    day: str
+    phase: str
+    metric: str
+    baseline: float
+    current: float
+
+    def __str__(self) -> str:
+        change = self.current / self.baseline - 1 if self.baseline else float("inf")
+        return (
+            f"{self.day} {self.phase} {self.metric}: "
+            f"{self.baseline:.0f} -> {self.current:.0f} ({change:+.0%})"
+        )
+
+
+def measure_day(
+    day: str, *, scale: float, seed: int = 0, repeat: int = 5
+) -> dict[str, PhaseStats]:
+    solver = load_solver(day)
+    data = generate(day, scale, seed)
+
+    timings: dict[str, list[int]] = {}
+    for _ in range(repeat):
+        for result in run_solver(solver, data, trace_memory=False):
+            timings.setdefault(result.phase, []).append(result.elapsed_ns)
+    # tracemalloc slows everything down, so memory gets a run of its own
+    memory = {p.phase: p.peak_memory for p in run_solver(solver, data)}
+
+    stats: dict[str, PhaseStats] = {}
+    for phase, times in timings.items():
+        q1, _, q3 = quantiles(times, n=4) if len(times) > 1 else (0, 0, 0)
+        stats[phase] = PhaseStats(
+            median_ns=median(times), iqr_ns=q3 - q1, peak_memory=memory[phase] or 0
+        )
+    return stats
+
+
+def record_baseline(
+    days: Sequence[str], *, scale: float, seed: int = 0, repeat: int = 5
+) -> dict:
+    return {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "scale": scale,
+        "seed": seed,
+        "repeat": repeat,
+        "days": {
+            day: {
+                phase: asdict(stats)
+                for phase, stats in measure_day(
+                    day, scale=scale, seed=seed, repeat=repeat
+                ).items()
+            }
+            for day in days
+        },
+    }
+
+
+def load_baseline(path: Path) -> dict:
+    if not path.exists():
+        raise ValueError(
+            f"No baseline at {path}; record one with `python -m bench record`"
+        )
+    baseline = json.loads(path.read_text())
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(
+            f"Baseline {path} has version {baseline.get('version')}, "
+            f"expected {BASELINE_VERSION}; record a new one"
+        )
+    return baseline
+
+
+def compare_phase(
+    day: str,
+    phase: str,
+    baseline: PhaseStats,
+    current: PhaseStats,
+    threshold: float,
+) -> list[Regression]:
+    regressions: list[Regression] = []
+
+    noise = max(baseline.iqr_ns + current.iqr_ns, MIN_TIME_DELTA_NS)
+    if (
+        current.median_ns > baseline.median_ns * (1 + threshold)
+        and current.median_ns - baseline.median_ns > noise
+    ):
+        regressions.append(
+            Regression(day, phase, "median_ns", baseline.median_ns, current.median_ns)
+        )
+
+    if (
+        current.peak_memory > baseline.peak_memory * (1 + threshold)
+        and current.peak_memory - baseline.peak_memory > MIN_MEMORY_DELTA
+    ):
+        regressions.append(
+            Regression(
+                day, phase, "peak_memory", baseline.peak_memory, current.peak_memory
+            )
+        )
+
+    return regressions
+
+
+def check_baseline(
+    baseline: dict, days: Optional[Sequence[str]] = None, *, threshold: float = 0.2
+) -> list[Regression]:
+    regressions: list[Regression] = []
+    for day in days or baseline["days"]:
+        if day not in baseline["days"]:
+            raise ValueError(f"No baseline recorded for {day}")
+        current = measure_day(
+            day,
+            scale=baseline["scale"],
+            seed=baseline["seed"],
+            repeat=baseline["repeat"],
+        )
+        for phase, recorded in baseline["days"][day].items():
+            regressions.extend(
+                compare_phase(
+                    day, phase, PhaseStats(**recorded), current[phase], threshold
+                )
+            )
+    return regressions
+
+
+# grid days whose hot loops build Points, measured by `bench points`
+POINT_DAYS = ("day10", "day16", "day17", "day21")
+
+
+@dataclass(eq=True, frozen=True)
+class DataclassPoint:
+    """lib.Point as it was before it became a NamedTuple, as the reference"""
+
+    x: int
+    y: int
+
+    def __add__(self, rhs: "DataclassPoint") -> "DataclassPoint":
+        return DataclassPoint(x=self.x + rhs.x, y=self.y + rhs.y)
+
+    def __mul__(self, rhs: int) -> "DataclassPoint":
+        return DataclassPoint(x=self.x * rhs, y=self.y * rhs)
+
+    def __lt__(self, rhs: "DataclassPoint") -> bool:
+        return (self.x, self.y) < (rhs.x, rhs.y)
+
+
+def dataclass_neighborhood(p: DataclassPoint) -> Iterable[DataclassPoint]:
+    # the directions used to be built anew on every call
+    directions = [
+        DataclassPoint(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy
+    ]
+    return (p + d for d in directions)
+
+
+@dataclass
+class PointCost:
+    ns_per_op: dict[str, float]
+    bytes_per_point: float
+
+
+def point_operations(
+    cls: Callable[[int, int], Any], neighbors: Callable[[Any], Iterable[Any]]
+) -> dict[str, Callable[[], Any]]:
+    p, q = cls(3, 4), cls(-1, 2)
+    return {
+        "new": lambda: cls(3, 4),
+        "add": lambda: p + q,
+        "mul": lambda: p * 3,
+        "hash": lambda: hash(p),
+        "eq": lambda: p == q,
+        "lt": lambda: p < q,
+        "neighbors": lambda: list(neighbors(p)),
+    }
+
+
+def measure_point_cost(
+    cls: Callable[[int, int], Any],
+    neighbors: Callable[[Any], Iterable[Any]],
+    *,
+    number: int = 100_000,
+) -> PointCost:
+    """time per operation, and traced bytes per live point in a list"""
+    ns_per_op = {
+        name: timeit.timeit(op, number=number) / number * 1e9
+        for name, op in point_operations(cls, neighbors).items()
+    }
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        # small ints are shared, so only the points and the list slots count
+        points = [cls(7, 11) for _ in range(number)]
+        size = tracemalloc.get_traced_memory()[0] - before
+        del points
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+    return PointCost(ns_per_op=ns_per_op, bytes_per_point=size / number)
+
+
+def count_points(day: str, data: str) -> int:
+    """Points constructed while solving both parts of day for data"""
+    new_point = Point.__new__.__code__
+    built = 0
+
+    def profile(frame: FrameType, event: str, arg: Any) -> None:
+        nonlocal built
+        if event == "call" and frame.f_code is new_point:
+            built += 1
+
+    solver = load_solver(day)
+    sys.setprofile(profile)
+    try:
+        parsed = solver.parse(data)
+        solver.part1(parsed)
+        solver.part2(parsed)
+    finally:
+        sys.setprofile(None)
+    return built
+
+
+def format_point_costs(reference: PointCost, current: PointCost) -> str:
+    lines = [f"{'operation':<10} {'dataclass':>12} {'Point':>12} {'speedup':>8}"]
+    for name, before in reference.ns_per_op.items():
+        after = current.ns_per_op[name]
+        lines.append(
+            f"{name:<10} {before:>9.1f} ns {after:>9.1f} ns {before / after:>7.2f}x"
+        )
+    lines.append(
+        f"{'bytes':<10} {reference.bytes_per_point:>12.1f} "
+        f"{current.bytes_per_point:>12.1f}"
+    )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.split("\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ladder_parser = commands.add_parser("ladder", help="fit complexity exponents")
+    ladder_parser.add_argument("days", nargs="*", help="default all")
+    ladder_parser.add_argument(
+        "--scales", type=float, nargs="+", default=DEFAULT_SCALES
+    )
+    ladder_parser.add_argument("--repeat", type=int, default=1)
+    ladder_parser.add_argument("--seed", type=int, default=0)
+    ladder_parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=60,
+        help="stop climbing a day's ladder once a step takes longer than this",
+    )
+
+    record_parser = commands.add_parser("record", help="record a new baseline")
+    record_parser.add_argument("days", nargs="*", help="default all")
+    record_parser.add_argument("--scale", type=float, default=0.25)
+    record_parser.add_argument("--repeat", type=int, default=5)
+    record_parser.add_argument("--seed", type=int, default=0)
+    record_parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+
+    check_parser = commands.add_parser("check", help="compare against the baseline")
+    check_parser.add_argument("days", nargs="*", help="default all in the baseline")
+    check_parser.add_argument("--threshold", type=float, default=0.2)
+    check_parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+
+    parsers_parser = commands.add_parser("parsers", help="compare parsers of a day")
+    parsers_parser.add_argument(
+        "days", nargs="*", help="default every day with PARSERS"
+    )
+    parsers_parser.add_argument(
+        "--scales", type=float, nargs="+", default=(1, 10, 100, 1000)
+    )
+    parsers_parser.add_argument("--repeat", type=int, default=3)
+    parsers_parser.add_argument("--seed", type=int, default=0)
+
+    points_parser = commands.add_parser("points", help="lib.Point micro-benchmark")
+    points_parser.add_argument("days", nargs="*", help="default the grid days")
+    points_parser.add_argument("--scale", type=float, default=0.25)
+    points_parser.add_argument("--seed", type=int, default=0)
+    points_parser.add_argument("--number", type=int, default=100_000)
+
+    args = parser.parse_args()
+
+    if args.command == "ladder":
+        print(f"{'day':<5} {'phase':<6} {'exponent':<9} milliseconds per scale")
+        for day in args.days or DAYS:
+            ladder = run_ladder(
+                day,
+                args.scales,
+                repeat=args.repeat,
+                seed=args.seed,
+                max_seconds=args.max_seconds,
+            )
+            print(format_ladder(ladder), flush=True)
+    elif args.command == "record":
+        baseline = record_baseline(
+            args.days or DAYS, scale=args.scale, seed=args.seed, repeat=args.repeat
+        )
+        args.baseline.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"Recorded {len(baseline['days'])} days to {args.baseline}")
+    elif args.command == "check":
+        regressions = check_baseline(
+            load_baseline(args.baseline), args.days, threshold=args.threshold
+        )
+        for regression in regressions:
+            print("REGRESSION", regression)
+        if regressions:
+            sys.exit(1)
+        print("No regressions")
+    elif args.command == "parsers":
+        print(f"{'day':<5} {'parser':<6} {'exponent':<9} milliseconds per scale")
+        days = args.days or [
+            day for day in DAYS if hasattr(import_module(day), "PARSERS")
+        ]
+        for day in days:
+            ladder = compare_parsers(
+                day, args.scales, repeat=args.repeat, seed=args.seed
+            )
+            print(format_ladder(ladder, list(load_parsers(day))), flush=True)
+    elif args.command == "points":
+        reference = measure_point_cost(
+            DataclassPoint, dataclass_neighborhood, number=args.number
+        )
+        current = measure_point_cost(Point, neighborhood, number=args.number)
+        print(format_point_costs(reference, current))
+
+        saved_ns = reference.ns_per_op["new"] - current.ns_per_op["new"]
+        saved_bytes = reference.bytes_per_point - current.bytes_per_point
+        print()
+        print(
+            f"{'day':<5} {'points':>10} {'solve ms':>10} "
+            f"{'saved ms':>10} {'saved MB':>10}  (estimated from construction)"
+        )
+        for day in args.days or POINT_DAYS:
+            data = generate(day, args.scale, args.seed)
+            built = count_points(day, data)
+            solve_ns = sum(
+                p.elapsed_ns
+                for p in run_solver(load_solver(day), data, trace_memory=False)
+            )
+            print(
+                f"{day:<5} {built:>10} {solve_ns / 1e6:>10.1f} "
+                f"{built * saved_ns / 1e6:>10.1f} {built * saved_bytes / 2**20:>10.1f}",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
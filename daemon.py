@@ -0,0 +1,249 @@
+"""Keep every solver loaded in a long-lived process and serve solve requests
+
+    python -m daemon serve &
+    python -m daemon solve day05 inputs/day05.txt
+    python -m daemon solve day12 - --part 2 < inputs/day12.txt
+
+The server imports all day modules once and then answers requests over a Unix
+domain socket, so callers skip interpreter startup and imports, and anything a
+solver caches between calls (compiled regexes, functools caches) stays warm.
+
+The protocol is one JSON object per line in both directions. A request names
+the day, optionally the parts to solve, and either a "path" the server reads
+itself or the input "data" inline:
+
+    {"day": "day05", "parts": [1], "path": "/abs/path/to/input.txt"}
+
+The response carries the answers and per-phase timings in the runner's format,
+or an error message:
+
+    {"ok": true, "day": "day05", "phases": [{"phase": "parse", ...}, ...]}
+    {"ok": false, "error": "Unknown day 'day99'"}
+"""
+
+import json
+import os
+import socket
+import sys
+import threading
+from argparse import ArgumentParser
+from contextlib import contextmanager
+from pathlib import Path
+from socketserver import StreamRequestHandler, ThreadingUnixStreamServer
+from tempfile import gettempdir
+from typing import Any, Iterator, Optional, Sequence, Union
+
+from lib import Solver
+from runner import (
+    DAYS,
+    RunResult,
+    default_input,
+    format_result,
+    load_solver,
+    run_solver,
+)
+
+DEFAULT_SOCKET = Path(
+    os.environ.get("AOC_SOCKET", Path(gettempdir()) / f"aoc2023-{os.getuid()}.sock")
+)
+
+
+class TracingLock:
+    """lets untraced requests run side by side, but a traced one only alone
+
+    tracemalloc is process-wide, so anything else running while a request is
+    traced would show up in its peak. Tracers waiting for their turn hold off
+    newly arriving requests, so a steady stream of them can't starve a tracer.
+    """
+
+    def __init__(self) -> None:
+        self.condition = threading.Condition()
+        self.running = 0
+        self.tracing = False
+        self.waiting_tracers = 0
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        with self.condition:
+            self.condition.wait_for(
+                lambda: not self.tracing and not self.waiting_tracers
+            )
+            self.running += 1
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.running -= 1
+                self.condition.notify_all()
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        with self.condition:
+            self.waiting_tracers += 1
+            self.condition.wait_for(lambda: not self.tracing and not self.running)
+            self.waiting_tracers -= 1
+            self.tracing = True
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.tracing = False
+                self.condition.notify_all()
+
+
+TRACING_LOCK = TracingLock()
+
+
+def preload(days: Sequence[str] = DAYS) -> dict[str, Solver]:
+    return {day: load_solver(day) for day in days}
+
+
+def handle_request(solvers: dict[str, Solver], request: dict) -> dict:
+    day = request.get("day")
+    if day not in solvers:
+        raise ValueError(f"Unknown day '{day}'")
+    if "data" in request:
+        data = request["data"]
+    elif "path" in request:
+        data = Path(request["path"]).read_text()
+    else:
+        raise ValueError("Request needs either 'path' or 'data'")
+    parts = tuple(request.get("parts", (1, 2)))
+    if not set(parts) <= {1, 2}:
+        raise ValueError(f"Unknown parts {parts}")
+
+    if request.get("memory", False):
+        with TRACING_LOCK.exclusive():
+            phases = run_solver(solvers[day], data, parts=parts, trace_memory=True)
+    else:
+        with TRACING_LOCK.shared():
+            phases = run_solver(solvers[day], data, parts=parts, trace_memory=False)
+    return {"ok": True, **RunResult(day=day, phases=phases).to_json()}
+
+
+class SolveHandler(StreamRequestHandler):
+    server: "SolverServer"
+
+    def handle(self) -> None:
+        # a connection may carry any number of requests, one per line
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                response = handle_request(self.server.solvers, json.loads(line))
+            except Exception as e:
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+            self.wfile.flush()
+
+
+class SolverServer(ThreadingUnixStreamServer):
+    """serves every connection in its own thread
+
+    Clients may keep a connection open for as long as they like without
+    holding up anyone else.
+    """
+
+    # don't let connections left open keep the process alive on shutdown
+    daemon_threads = True
+
+    def __init__(self, socket_path: Union[str, Path], solvers: dict[str, Solver]):
+        self.solvers = solvers
+        # a stale socket file from a server that died would make bind fail
+        if Path(socket_path).is_socket():
+            Path(socket_path).unlink()
+        super().__init__(str(socket_path), SolveHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        Path(self.server_address).unlink(missing_ok=True)  # type: ignore[arg-type]
+
+
+class SolverClient:
+    """connection to a running daemon; reusable for any number of requests"""
+
+    def __init__(self, socket_path: Union[str, Path] = DEFAULT_SOCKET):
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.connect(str(socket_path))
+        self.file = self.socket.makefile("rwb")
+
+    def __enter__(self) -> "SolverClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.file.close()
+        self.socket.close()
+
+    def solve(
+        self,
+        day: str,
+        *,
+        path: Optional[Union[str, Path]] = None,
+        data: Optional[str] = None,
+        parts: Sequence[int] = (1, 2),
+        memory: bool = False,
+    ) -> dict:
+        request: dict[str, Any] = {"day": day, "parts": list(parts), "memory": memory}
+        if data is not None:
+            request["data"] = data
+        elif path is not None:
+            # the daemon may well run in another working directory
+            request["path"] = str(Path(path).resolve())
+        else:
+            raise ValueError("Either path or data is needed")
+
+        self.file.write(json.dumps(request).encode() + b"\n")
+        self.file.flush()
+        line = self.file.readline()
+        if not line:
+            raise ConnectionError("The daemon closed the connection")
+        return json.loads(line)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("serve", help="preload every day and serve requests")
+
+    solve_parser = commands.add_parser("solve", help="ask a running daemon")
+    solve_parser.add_argument("day", help="day module to run, e.g. day05")
+    solve_parser.add_argument(
+        "input", nargs="?", help="defaults to inputs/; '-' sends stdin inline"
+    )
+    solve_parser.add_argument("--part", type=int, choices=(1, 2), action="append")
+    solve_parser.add_argument("--json", action="store_true", help="emit JSON")
+
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        with SolverServer(args.socket, preload()) as server:
+            print(f"Serving {len(server.solvers)} days on {args.socket}", flush=True)
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+    elif args.command == "solve":
+        parts = args.part or (1, 2)
+        with SolverClient(args.socket) as client:
+            if args.input == "-":
+                response = client.solve(args.day, data=sys.stdin.read(), parts=parts)
+            else:
+                path = args.input or default_input(args.day)
+                response = client.solve(args.day, path=path, parts=parts)
+
+        if args.json:
+            print(json.dumps(response, indent=2))
+        elif not response["ok"]:
+            sys.exit(response["error"])
+        else:
+            response.pop("ok")
+            print(format_result(RunResult.from_json(response)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,16 @@
-from sys import stdin
-from typing import Iterable, NewType, Type, TypeVar
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from typing import Iterable, Iterator, NewType, Optional, Type, TypeVar, Union
+
+from lib import Solver, iter_lines
+from resultcache import solve_stdin
 
 
 def main() -> None:
-    data: str = stdin.read()
-    calibration_document = CalibrationDocument.from_string(data)
-    correct_calibration_document = CorrectedCalibrationDocument.from_string(data)
-    print("Part 1:", calibration_document.calibration_value())
-    print("Part 2:", correct_calibration_document.calibration_value())
+    solve_stdin("day01", SOLVER)
 
 
 DigitTranslationTable = dict[str, int]
@@ -23,18 +26,38 @@ class CalibrationDocument:
 
     @classmethod
     def from_string(cls: Type[T], data: str) -> T:
-        return cls(
-            list(
-                CalibrationLine(
+        return cls.from_lines(data.split("\n"))
+
+    @classmethod
+    def from_lines(cls: Type[T], lines: Iterable[Union[str, bytes]]) -> T:
+        return cls(list(cls.iter_lines(lines)))
+
+    @classmethod
+    def iter_lines(
+        cls, lines: Iterable[Union[str, bytes]]
+    ) -> Iterator[CalibrationLine]:
+        for line in iter_lines(lines):
+            if line:
+                yield CalibrationLine(
                     list(digit_generator(line, table=cls.translation_table))
                 )
-                for line in data.split("\n")
-                if line
-            )
-        )
 
     def calibration_value(self) -> int:
-        return sum(10 * line[0] + line[-1] for line in self.lines)
+        return sum_of_calibration_values(self.lines)
+
+    @classmethod
+    def calibration_value_from_lines(cls, lines: Iterable[Union[str, bytes]]) -> int:
+        """calibration value without keeping any digits or lines around
+
+        Only the first and last digit of each line are looked for, so a line
+        is scanned up to its first digit and back from its end to its last one.
+        """
+        total = 0
+        for line in iter_lines(lines):
+            if line:
+                first, last = first_and_last_digits(line, table=cls.translation_table)
+                total += 10 * first + last
+        return total
 
 
 class CorrectedCalibrationDocument(CalibrationDocument):
@@ -52,14 +75,127 @@ class CorrectedCalibrationDocument(CalibrationDocument):
     }
 
 
-def digit_generator(calibration_line: str, *, table: dict) -> Iterable[int]:
-    while calibration_line:
-        for name, value in table.items():
-            if calibration_line.startswith(name):
-                yield value
-                break
+def sum_of_calibration_values(lines: Iterable[CalibrationLine]) -> int:
+    return sum(10 * line[0] + line[-1] for line in lines)
 
-        calibration_line = calibration_line[1:]
+
+@cache
+def digit_pattern(names: tuple[str, ...]) -> re.Pattern:
+    # A lookahead matches without consuming anything, so finditer tries every
+    # position and overlapping names like "eightwo" yield both digits. The
+    # alternation tries names in table order, so where several names start at
+    # the same position the first one in the table wins. That means every
+    # position costs a try of each name the regex engine can't rule out by its
+    # first character; it is one compiled pattern, not a one-pass automaton.
+    return re.compile(f"(?=({'|'.join(map(re.escape, names))}))")
+
+
+def first_and_last_digits(calibration_line: str, *, table: dict) -> tuple[int, int]:
+    """first and last digit of a line, from two scans towards the middle
+
+    A forward search finds the first digit and a separate walk back from the
+    end finds the last. That is two scans, not one, but neither goes past its
+    digit, so the stretch between the two digits is never looked at.
+    """
+    pattern = digit_pattern(tuple(table))
+    first = pattern.search(calibration_line)
+    if first is None:
+        raise ValueError(f"No digits in '{calibration_line}'")
+
+    # walk back from the end; at the latest this stops at the first digit
+    last = None
+    pos = len(calibration_line)
+    while last is None:
+        pos -= 1
+        last = pattern.match(calibration_line, pos)
+
+    return table[first.group(1)], table[last.group(1)]
+
+
+def digit_generator(calibration_line: str, *, table: dict) -> Iterable[int]:
+    for match in digit_pattern(tuple(table)).finditer(calibration_line):
+        yield table[match.group(1)]
+
+
+def chunk_offsets(data: Union[bytes, mmap.mmap], chunks: int) -> list[tuple[int, int]]:
+    """split data into about equal (start, end) ranges, cutting only after newlines"""
+    size = len(data)
+    boundaries = [0]
+    for i in range(1, chunks):
+        newline = data.find(b"\n", max(size * i // chunks, boundaries[-1]))
+        if newline < 0:
+            break
+        boundaries.append(newline + 1)
+    boundaries.append(size)
+    return [(a, b) for a, b in zip(boundaries, boundaries[1:]) if a < b]
+
+
+def calibration_values_of_line(line: str) -> tuple[int, int]:
+    """both parts' calibration values of a line, from a single scan of it
+
+    Every plain digit is also a match of the digit names' pattern, so part 1's
+    first and last digits are the first and last of those matches that are
+    plain digits.
+    """
+    plain = CalibrationDocument.translation_table
+    table = CorrectedCalibrationDocument.translation_table
+    first: Optional[int] = None
+    first_plain: Optional[int] = None
+    last = last_plain = 0
+    for match in digit_pattern(tuple(table)).finditer(line):
+        name = match.group(1)
+        last = table[name]
+        if first is None:
+            first = last
+        if name in plain:
+            last_plain = last
+            if first_plain is None:
+                first_plain = last
+    if first is None or first_plain is None:
+        raise ValueError(f"No digits in '{line}'")
+    return 10 * first_plain + last_plain, 10 * first + last
+
+
+def calibration_values_of_chunk(path: str, start: int, end: int) -> tuple[int, int]:
+    # Every worker maps the file itself, so only offsets and sums ever go
+    # through the pool's pipes.
+    part1 = part2 = 0
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        mm.seek(start)
+        while mm.tell() < end:
+            line = mm.readline().decode().rstrip("\r\n")
+            if line:
+                value1, value2 = calibration_values_of_line(line)
+                part1 += value1
+                part2 += value2
+    return part1, part2
+
+
+def calibration_values_from_file(
+    path: str, *, workers: Optional[int] = None, chunks: Optional[int] = None
+) -> tuple[int, int]:
+    """both parts' calibration values of a file, summed in parallel chunks"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0, 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # a few chunks per worker evens out uneven line lengths
+            offsets = chunk_offsets(mm, chunks or 4 * (workers or os.cpu_count() or 1))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(calibration_values_of_chunk, path, start, end)
+            for start, end in offsets
+        ]
+        sums = [future.result() for future in futures]
+    return sum(part1 for part1, _ in sums), sum(part2 for _, part2 in sums)
+
+
+SOLVER = Solver(
+    parse=lambda data: data.split("\n"),
+    part1=CalibrationDocument.calibration_value_from_lines,
+    part2=CorrectedCalibrationDocument.calibration_value_from_lines,
+)
 
 
 if __name__ == "__main__":
@@ -1,18 +1,31 @@
 import re
+from array import array
+from bisect import bisect_right
 from collections import defaultdict
-from dataclasses import dataclass
-from sys import stdin
-from typing import Optional
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Callable, Iterable, Iterator, Optional, Sequence, Union
+
+from lib import Solver, iter_lines
+from resultcache import solve_stdin
 
 RE_GAME = re.compile(r"Game (\d+): (.*)")
 RE_CUBE = re.compile(r"(\d+) (red|green|blue)")
+# GameTable column of a color, by the color's first letter
+COLOR_CHANNELS: dict[Union[str, bytes], int] = {
+    "r": 0,
+    "g": 1,
+    "b": 2,
+    b"r": 0,
+    b"g": 1,
+    b"b": 2,
+}
+# largest Fenwick tree sums_of_possible_games builds, 32 MiB of array('q')
+MAX_FENWICK_CELLS = 2**22
 
 
 def main() -> None:
-    games: list[GameRecord] = games_from_string(stdin.read())
-    bag = CubeCounts(red_count=12, green_count=13, blue_count=14)
-    print("Part 1:", sum_of_possible_games(games, bag))
-    print("Part 2:", power_sum(games))
+    solve_stdin("day02", SOLVER)
 
 
 @dataclass(frozen=True)
@@ -44,20 +57,24 @@ class GameRecord:
     game_id: int
     counts: list[CubeCounts]
 
-    def power(self) -> int:
-        max_counts = CubeCounts(
-            red_count=max(self.counts, key=lambda c: c.red_count).red_count,
-            green_count=max(self.counts, key=lambda c: c.green_count).green_count,
-            blue_count=max(self.counts, key=lambda c: c.blue_count).blue_count,
+    @cached_property
+    def max_counts(self) -> CubeCounts:
+        """the fewest cubes of each color that make this game possible"""
+        return CubeCounts(
+            red_count=max(c.red_count for c in self.counts),
+            green_count=max(c.green_count for c in self.counts),
+            blue_count=max(c.blue_count for c in self.counts),
         )
-        return max_counts.power()
+
+    def power(self) -> int:
+        return self.max_counts.power()
 
     def is_possible(self, bag: CubeCounts) -> bool:
-        return all(
-            c.red_count <= bag.red_count
-            and c.green_count <= bag.green_count
-            and c.blue_count <= bag.blue_count
-            for c in self.counts
+        needed = self.max_counts
+        return (
+            needed.red_count <= bag.red_count
+            and needed.green_count <= bag.green_count
+            and needed.blue_count <= bag.blue_count
         )
 
     @staticmethod
@@ -72,17 +89,155 @@ class GameRecord:
         )
 
 
+@dataclass
+class GameTable:
+    """Every game reduced to its id and the most cubes of each color it showed
+
+    Columns are plain arrays, one entry per game, so answering a question about
+    all games is a single pass over a few contiguous columns.
+    """
+
+    game_ids: array = field(default_factory=lambda: array("q"))
+    red: array = field(default_factory=lambda: array("q"))
+    green: array = field(default_factory=lambda: array("q"))
+    blue: array = field(default_factory=lambda: array("q"))
+
+    @staticmethod
+    def from_games(games: Iterable[GameRecord]) -> "GameTable":
+        table = GameTable()
+        for game in games:
+            needed = game.max_counts
+            table.append(
+                game.game_id, needed.red_count, needed.green_count, needed.blue_count
+            )
+        return table
+
+    @staticmethod
+    def from_lines(lines: Iterable[Union[str, bytes]]) -> "GameTable":
+        """parse game records straight into the table, without any regexes
+
+        Lines may be str or bytes. Splitting on whitespace turns a record into
+        "Game", "<id>:", then count and color tokens in turn (with trailing
+        commas and semicolons); the first letter of the color is all that is
+        needed to fold the count into the game's running maximums.
+        """
+        table = GameTable()
+        for line in lines:
+            tokens: Sequence[Union[str, bytes]] = line.split()
+            if not tokens:
+                continue
+            maxima = [0, 0, 0]
+            for count, color in zip(tokens[2::2], tokens[3::2]):
+                n = int(count)
+                channel = COLOR_CHANNELS[color[:1]]
+                if n > maxima[channel]:
+                    maxima[channel] = n
+            table.append(int(tokens[1][:-1]), *maxima)
+        return table
+
+    def append(self, game_id: int, red: int, green: int, blue: int) -> None:
+        self.game_ids.append(game_id)
+        self.red.append(red)
+        self.green.append(green)
+        self.blue.append(blue)
+
+    def __len__(self) -> int:
+        return len(self.game_ids)
+
+    def sum_of_possible_games(self, bag: CubeCounts) -> int:
+        return sum(
+            game_id
+            for game_id, r, g, b in zip(self.game_ids, self.red, self.green, self.blue)
+            if r <= bag.red_count and g <= bag.green_count and b <= bag.blue_count
+        )
+
+    def power_sum(self) -> int:
+        return sum(r * g * b for r, g, b in zip(self.red, self.green, self.blue))
+
+    def sums_of_possible_games(self, bags: Sequence[CubeCounts]) -> list[int]:
+        """sum_of_possible_games for every bag, answered together
+
+        Games and bags are swept in order of red: before a bag is answered,
+        every game needing no more red than it has is added to a 2D Fenwick
+        tree over the ranks of the games' green and blue needs. A bag is then
+        a prefix-sum query on that tree, so all bags take
+        O((games + bags) log(green) log(blue)) besides zeroing the tree.
+
+        The tree has a cell for every pair of distinct green and blue needs;
+        above MAX_FENWICK_CELLS, bags are answered one by one instead.
+        """
+        greens = sorted(set(self.green))
+        blues = sorted(set(self.blue))
+        ng, nb = len(greens), len(blues)
+        if ng * nb > MAX_FENWICK_CELLS:
+            return [self.sum_of_possible_games(bag) for bag in bags]
+
+        green_ranks = {value: rank for rank, value in enumerate(greens, start=1)}
+        blue_ranks = {value: rank for rank, value in enumerate(blues, start=1)}
+        # 1-based Fenwick tree, row x and column y at x * width + y
+        width = nb + 1
+        tree = array("q", bytes(8 * (ng + 1) * width))
+        games = sorted(zip(self.red, self.green, self.blue, self.game_ids))
+
+        sums = [0] * len(bags)
+        added = 0
+        for i in sorted(range(len(bags)), key=lambda i: bags[i].red_count):
+            bag = bags[i]
+            while added < len(games) and games[added][0] <= bag.red_count:
+                _, g, b, game_id = games[added]
+                added += 1
+                x = green_ranks[g]
+                while x <= ng:
+                    y = blue_ranks[b]
+                    while y <= nb:
+                        tree[x * width + y] += game_id
+                        y += y & -y
+                    x += x & -x
+
+            total = 0
+            x = bisect_right(greens, bag.green_count)
+            last_blue = bisect_right(blues, bag.blue_count)
+            while x > 0:
+                y = last_blue
+                while y > 0:
+                    total += tree[x * width + y]
+                    y -= y & -y
+                x -= x & -x
+            sums[i] = total
+        return sums
+
+
 def games_from_string(data: str) -> list[GameRecord]:
-    return [GameRecord.from_string(line.strip()) for line in data.split("\n") if line]
+    return list(games_from_lines(data.split("\n")))
+
 
+def games_from_lines(lines: Iterable[Union[str, bytes]]) -> Iterator[GameRecord]:
+    return (GameRecord.from_string(line.strip()) for line in iter_lines(lines) if line)
 
-def sum_of_possible_games(games: list[GameRecord], bag: CubeCounts) -> int:
+
+def sum_of_possible_games(games: Iterable[GameRecord], bag: CubeCounts) -> int:
     return sum(game.game_id if game.is_possible(bag) else 0 for game in games)
 
 
-def power_sum(games: list[GameRecord]) -> int:
+def power_sum(games: Iterable[GameRecord]) -> int:
     return sum(game.power() for game in games)
 
 
+# interchangeable parsers of the same input, compared by `bench parsers`
+PARSERS: dict[str, Callable[[str], GameTable]] = {
+    "regex": lambda data: GameTable.from_games(games_from_string(data)),
+    "tokenizer": lambda data: GameTable.from_lines(data.split("\n")),
+}
+
+
+SOLVER = Solver(
+    parse=lambda data: GameTable.from_lines(data.split("\n")),
+    part1=lambda table: table.sum_of_possible_games(
+        CubeCounts(red_count=12, green_count=13, blue_count=14)
+    ),
+    part2=GameTable.power_sum,
+)
+
+
 if __name__ == "__main__":
     main()
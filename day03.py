@@ -1,20 +1,76 @@
+import re
+from bisect import bisect_right
 from dataclasses import dataclass
 from math import prod
-from sys import stdin
-from typing import Iterable
+from typing import Callable, Iterable, Iterator, Union
 
-from lib import Point, neighborhood
+from lib import BitGrid, Grid2D, Point, Solver, iter_lines
+from resultcache import solve_stdin
 
 
 def main() -> None:
-    schematic = Schematic.from_string(stdin.read())
-    print("Part 1", sum_of_part_numbers(schematic))
-    print("Part 2", sum_of_gear_ratios(schematic))
+    solve_stdin("day03", SOLVER)
 
 
-class GridDict(dict[Point, str]):
-    def __missing__(self, key: Point) -> str:
-        return "."
+RE_NUMBER = re.compile(rb"\d+")
+# whitespace is never a symbol, including the \r of a CRLF file
+RE_SYMBOL = re.compile(rb"[^.\d\s]")
+SYMBOLS = bytes(sorted(set(range(256)) - set(b".0123456789 \t\n\r\x0b\x0c")))
+
+
+def schematic_grid(data: str) -> Grid2D:
+    """the schematic as a grid, whatever its line endings or row lengths
+
+    Lines are stripped of surrounding whitespace (and so of CRLF endings), and
+    short rows are padded with '.', which is what the missing cells mean.
+    """
+    lines = [line.strip() for line in data.split("\n")]
+    while lines and not lines[-1]:
+        lines.pop()
+    width = max(map(len, lines), default=0)
+    return Grid2D.from_string("\n".join(line.ljust(width, ".") for line in lines))
+
+
+@dataclass(frozen=True)
+class NumberSpan:
+    value: int
+    y: int
+    # x of the first digit, and one past the last
+    start: int
+    end: int
+
+
+@dataclass
+class NumberLabels:
+    """Which number, if any, every cell of the schematic is a digit of
+
+    labels holds an index into numbers for each cell of the grid (by the grid's
+    flat index), or -1 for cells that aren't digits.
+    """
+
+    labels: list[int]
+    numbers: list[NumberSpan]
+
+    @staticmethod
+    def from_grid(grid: Grid2D) -> "NumberLabels":
+        labels = [-1] * len(grid.cells)
+        numbers: list[NumberSpan] = []
+        for y in range(grid.height):
+            for mo in RE_NUMBER.finditer(grid.row(y).tobytes()):
+                number_id = len(numbers)
+                numbers.append(NumberSpan(int(mo.group()), y, mo.start(), mo.end()))
+                first = grid.index(Point(mo.start(), y))
+                labels[first : first + mo.end() - mo.start()] = [number_id] * (
+                    mo.end() - mo.start()
+                )
+        return NumberLabels(labels=labels, numbers=numbers)
+
+    def adjacent_numbers(self, grid: Grid2D, idx: int) -> list[NumberSpan]:
+        """distinct numbers with a digit in the 8-neighborhood of idx"""
+        number_ids = dict.fromkeys(
+            self.labels[n] for n in grid.neighbors(idx) if self.labels[n] >= 0
+        )
+        return [self.numbers[number_id] for number_id in number_ids]
 
 
 @dataclass
@@ -29,49 +85,134 @@ class Schematic:
 
     @staticmethod
     def from_string(data: str) -> "Schematic":
-        grid = GridDict(
-            (Point(x, y), ch)
-            for y, line in enumerate(data.split("\n"))
-            for x, ch in enumerate(line.strip())
-            if line and ch != "."
-        )
+        grid = schematic_grid(data)
+        labels = NumberLabels.from_grid(grid)
 
-        return Schematic(
-            parts=[
-                Part(numbers=list(nearby_numbers(grid, p)), symbol=symbol)
-                for p, symbol in find_symbols(grid)
-            ]
-        )
+        parts: list[Part] = []
+        for y in range(grid.height):
+            for mo in RE_SYMBOL.finditer(grid.row(y).tobytes()):
+                numbers = labels.adjacent_numbers(
+                    grid, grid.index(Point(mo.start(), y))
+                )
+                parts.append(
+                    Part(numbers=[n.value for n in numbers], symbol=mo.group().decode())
+                )
+        return Schematic(parts=parts)
 
 
-def find_symbols(grid: GridDict) -> Iterable[tuple[Point, str]]:
-    return (
-        (p, symbol)
-        for p, symbol in grid.items()
-        if symbol != "." and not symbol.isdigit()
-    )
+@dataclass
+class Row:
+    """One schematic line and its numbers, as (start, end, value) by position"""
 
+    line: bytes
+    starts: list[int]
+    numbers: list[tuple[int, int, int]]
 
-def nearby_numbers(grid: GridDict, p: Point) -> Iterable[int]:
-    used: set[Point] = set()
+    @staticmethod
+    def from_bytes(line: bytes) -> "Row":
+        numbers = [
+            (mo.start(), mo.end(), int(mo.group())) for mo in RE_NUMBER.finditer(line)
+        ]
+        return Row(
+            line=line, starts=[start for start, _, _ in numbers], numbers=numbers
+        )
 
-    for q in neighborhood(p):
-        if q in used or not grid[q].isdigit():
-            continue
+    def numbers_around(self, x: int) -> Iterator[int]:
+        """numbers with a digit in column x - 1, x or x + 1, left to right"""
+        # numbers don't overlap, so the ones starting at x + 1 or before that
+        # also reach column x - 1 are the last few of them
+        last = bisect_right(self.starts, x + 1)
+        first = last
+        while first > 0 and self.numbers[first - 1][1] >= x:
+            first -= 1
+        return (value for _, _, value in self.numbers[first:last])
+
+
+EMPTY_ROW = Row(line=b"", starts=[], numbers=[])
+
+
+def stream_parts(lines: Iterable[Union[str, bytes]]) -> Iterator[Part]:
+    """the schematic's parts in order, from a window of three lines at a time
+
+    Symbols on a line are only resolved once the line below it has been read,
+    so memory stays proportional to the width however tall the schematic is.
+    """
+    above, current = EMPTY_ROW, None
+    for line in iter_lines(lines):
+        # stripped like schematic_grid does, and blank lines are rows too, so
+        # the rows on either side of one aren't adjacent
+        below = Row.from_bytes(line.strip().encode())
+        if current is not None:
+            yield from row_parts(above, current, below)
+            above = current
+        current = below
+    if current is not None:
+        yield from row_parts(above, current, EMPTY_ROW)
+
+
+def row_parts(above: Row, current: Row, below: Row) -> Iterator[Part]:
+    for mo in RE_SYMBOL.finditer(current.line):
+        x = mo.start()
+        numbers = [n for row in (above, current, below) for n in row.numbers_around(x)]
+        yield Part(numbers=numbers, symbol=mo.group().decode())
+
+
+def sums_from_lines(lines: Iterable[Union[str, bytes]]) -> tuple[int, int]:
+    """sum of part numbers and sum of gear ratios in one streaming pass"""
+    part_numbers = gear_ratios = 0
+    for part in stream_parts(lines):
+        part_numbers += sum(part.numbers)
+        if len(part.numbers) == 2:
+            gear_ratios += prod(part.numbers)
+    return part_numbers, gear_ratios
+
+
+def bitboard_sums(data: str) -> tuple[int, int]:
+    """sum of part numbers and sum of gear ratios using whole-grid bit masks
+
+    The symbol mask is dilated by the 8-neighborhood once; a number is a part
+    number if its digits' bits intersect that mask in its row. Like
+    sum_of_part_numbers, a number next to several symbols counts once for each
+    of them, which is a popcount of the symbol mask in the box around it. Gear
+    ratios come from the numbers around each symbol with exactly two of them.
+    """
+    grid = schematic_grid(data)
+    symbols = BitGrid.from_grid(grid, SYMBOLS)
+    symbol_rows = symbols.rows()
+    touched_rows = symbols.dilate(diagonals=True).rows()
+    rows = [Row.from_bytes(grid.row(y).tobytes()) for y in range(grid.height)]
+
+    part_numbers = 0
+    for y, (row, touched) in enumerate(zip(rows, touched_rows)):
+        for start, end, value in row.numbers:
+            if not touched >> start & ((1 << (end - start)) - 1):
+                continue
+            left = max(start - 1, 0)
+            box = (1 << (end + 1 - left)) - 1
+            symbol_count = sum(
+                bin(symbol_row >> left & box).count("1")
+                for symbol_row in symbol_rows[max(y - 1, 0) : y + 2]
+            )
+            part_numbers += value * symbol_count
+
+    gear_ratios = 0
+    for y, symbol_row in enumerate(symbol_rows):
+        while symbol_row:
+            lowest = symbol_row & -symbol_row
+            symbol_row ^= lowest
+            x = lowest.bit_length() - 1
+            numbers = [
+                n for row in rows[max(y - 1, 0) : y + 2] for n in row.numbers_around(x)
+            ]
+            if len(numbers) == 2:
+                gear_ratios += prod(numbers)
 
-        # find beginning of number
-        while grid[q + Point(-1, 0)].isdigit():
-            q = q + Point(-1, 0)
+    return part_numbers, gear_ratios
 
-        # collect all digits of the number
-        digits: list[str] = []
-        while grid[q].isdigit():
-            digits.append(grid[q])
-            used.add(q)
-            q = q + Point(1, 0)
 
-        # turn the number to int
-        yield int("".join(digits))
+def label_sums(data: str) -> tuple[int, int]:
+    schematic = Schematic.from_string(data)
+    return sum_of_part_numbers(schematic), sum_of_gear_ratios(schematic)
 
 
 def sum_of_part_numbers(schematic: Schematic) -> int:
@@ -82,5 +223,23 @@ def sum_of_gear_ratios(schematic: Schematic) -> int:
     return sum(prod(part.numbers) for part in schematic.parts if len(part.numbers) == 2)
 
 
+# interchangeable ways to get both answers at once from the raw input
+ENGINES: dict[str, Callable[[str], tuple[int, int]]] = {
+    "labels": label_sums,
+    "stream": lambda data: sums_from_lines(data.split("\n")),
+    "bitboard": bitboard_sums,
+}
+
+# `bench parsers` compares the engines like any other day's parsers
+PARSERS = ENGINES
+
+
+SOLVER = Solver(
+    parse=Schematic.from_string,
+    part1=sum_of_part_numbers,
+    part2=sum_of_gear_ratios,
+)
+
+
 if __name__ == "__main__":
     main()
@@ -1,51 +1,105 @@
+from collections import defaultdict
 from dataclasses import dataclass
-from sys import stdin
+from functools import cached_property
+from typing import Iterable, Iterator, Optional, Union
 
+from lib import Solver, iter_lines
+from resultcache import solve_stdin
 
-def main():
-    cards = parse_cards(stdin.read())
-    print("Part 1:", total_score(cards))
-    print("Part 2:", count_scratch_cards(cards))
+
+def main() -> None:
+    solve_stdin("day04", SOLVER)
 
 
 @dataclass(frozen=True, eq=True)
 class Card:
-    got: set[int]
-    winning: set[int]
+    # bit n is set if number n is on the card
+    got: int
+    winning: int
+
+    @cached_property
+    def match_count(self) -> int:
+        return bin(self.got & self.winning).count("1")
+
+
+def numbers_to_mask(numbers: str) -> int:
+    mask = 0
+    for n in numbers.split():
+        mask |= 1 << int(n)
+    return mask
 
 
 def parse_cards(data: str) -> list[Card]:
-    cards: list[Card] = []
+    return list(iter_cards(data.split("\n")))
 
-    for line in data.split("\n"):
+
+def iter_cards(lines: Iterable[Union[str, bytes]]) -> Iterator[Card]:
+    for line in iter_lines(lines):
         if not line:
             continue
         _, rest = line.split(":", maxsplit=1)
         winning, got = rest.split("|", maxsplit=1)
-        cards.append(
-            Card(
-                got=set(int(n.strip()) for n in got.split(" ") if n.strip()),
-                winning=set(int(n.strip()) for n in winning.split(" ") if n.strip()),
-            )
-        )
+        yield Card(got=numbers_to_mask(got), winning=numbers_to_mask(winning))
+
+
+def match_counts(cards: Iterable[Card]) -> list[int]:
+    return [card.match_count for card in cards]
+
+
+def score_of_matches(counts: Iterable[int]) -> int:
+    return sum(1 << (m - 1) for m in counts if m)
+
+
+def scratch_cards_of_matches(
+    counts: Iterable[int], *, modulus: Optional[int] = None
+) -> int:
+    """total number of scratch cards, given each card's match count in order
+
+    Instead of adding a card's copies to each of the following cards, the copies
+    are added to a running total once and scheduled to drop out of it again
+    after the last card they win. That is O(1) per card however many matches
+    there are, and only the scheduled drops are kept in memory, so counts can
+    be a stream.
+
+    Copy counts grow exponentially on long winning chains; with a modulus all
+    arithmetic is done modulo it (e.g. 2**64 for fixed-width results).
+    """
+    total = 0
+    # copies won from earlier cards that reach the current card
+    running = 0
+    expiring: dict[int, int] = defaultdict(int)
+
+    for card_number, match_count in enumerate(counts):
+        running -= expiring.pop(card_number, 0)
+        copies = 1 + running
+        if modulus is not None:
+            copies %= modulus
+        total += copies
+        if match_count:
+            running += copies
+            expiring[card_number + match_count + 1] += copies
+        if modulus is not None:
+            running %= modulus
+            total %= modulus
 
-    return cards
+    return total
 
 
-def total_score(cards: list[Card]) -> int:
-    matches = (c.got & c.winning for c in cards)
-    return sum(2 ** (len(m) - 1) for m in matches if m)
+def total_score(cards: Iterable[Card]) -> int:
+    return score_of_matches(card.match_count for card in cards)
 
 
-def count_scratch_cards(cards: list[Card]) -> int:
-    counts: list[int] = [1 for _ in range(len(cards))]
+def count_scratch_cards(cards: Iterable[Card], *, modulus: Optional[int] = None) -> int:
+    return scratch_cards_of_matches(
+        (card.match_count for card in cards), modulus=modulus
+    )
 
-    for card_number, c in enumerate(cards):
-        match_count = len(c.got & c.winning)
-        for i in range(card_number + 1, card_number + match_count + 1):
-            counts[i] += counts[card_number]
 
-    return sum(counts)
+SOLVER = Solver(
+    parse=lambda data: match_counts(iter_cards(data.split("\n"))),
+    part1=score_of_matches,
+    part2=scratch_cards_of_matches,
+)
 
 
 if __name__ == "__main__":
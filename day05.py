@@ -1,14 +1,14 @@
+from bisect import bisect_right
 from dataclasses import dataclass
-from sys import stdin
-from typing import Iterable
+from functools import cached_property
+from typing import Iterable, Iterator, Optional
+
+from lib import Solver
+from resultcache import solve_stdin
 
 
 def main() -> None:
-    data = stdin.read()
-    almanac = Almanac.from_string(data)
-    print("Part 1:", lowest_location(almanac))
-    almanac2 = Almanac.from_string(data, seeds_as_ranges=True)
-    print("Part 2:", lowest_location(almanac2))
+    solve_stdin("day05", SOLVER)
 
 
 @dataclass(frozen=True, eq=True)
@@ -20,88 +20,99 @@ class CategoryRange:
         return self.target.start - self.source.start
 
 
-@dataclass(frozen=True, eq=True, repr=True)
-class CategoryMap:
-    source: str
-    target: str
-    maps: list[CategoryRange]
+@dataclass(frozen=True)
+class PiecewiseMap:
+    """integers shifted by a constant offset per interval of a sorted table
+
+    Piece i covers starts[i] up to starts[i + 1], the last one up to infinity.
+    The table starts at 0, gaps between ranges are explicit identity pieces,
+    and anything below 0 is mapped to itself.
+    """
+
+    starts: list[int]
+    offsets: list[int]
+
+    @staticmethod
+    def identity() -> "PiecewiseMap":
+        return PiecewiseMap(starts=[0], offsets=[0])
+
+    @staticmethod
+    def from_ranges(ranges: Iterable[CategoryRange]) -> "PiecewiseMap":
+        starts: list[int] = [0]
+        offsets: list[int] = [0]
+        for c in sorted(ranges, key=lambda c: c.source.start):
+            if not c.source:
+                continue
+            if c.source.start < starts[-1]:
+                raise ValueError(f"Overlapping source ranges at {c.source}")
+            if c.source.start == starts[-1]:
+                # no gap, the range replaces the identity piece after the last
+                offsets[-1] = c.offset()
+            else:
+                starts.append(c.source.start)
+                offsets.append(c.offset())
+            starts.append(c.source.stop)
+            offsets.append(0)
+        return PiecewiseMap(starts=starts, offsets=offsets)
+
+    def __call__(self, value: int) -> int:
+        i = bisect_right(self.starts, value) - 1
+        return value + self.offsets[i] if i >= 0 else value
+
+    def segments(self, start: int) -> Iterator[tuple[int, Optional[int], int]]:
+        """(start, stop, offset) of the pieces from start upwards
+
+        The first piece is cut to begin at start, the last one has no stop.
+        """
+        i = bisect_right(self.starts, start) - 1
+        if i < 0:
+            yield start, self.starts[0], 0
+            i, start = 0, self.starts[0]
+        for j in range(i, len(self.starts)):
+            stop = self.starts[j + 1] if j + 1 < len(self.starts) else None
+            yield start, stop, self.offsets[j]
+            if stop is not None:
+                start = stop
 
     def map_range(self, r: range) -> list[range]:
         mapped: list[range] = []
-        unmapped: list[range] = [r]
-        for mp in self.maps:
-            if not unmapped:
+        for start, stop, offset in self.segments(r.start):
+            if start >= r.stop:
                 break
-            new_unmapped: list[range] = []
-            while unmapped:
-                u, m = self._map_range_helper(unmapped.pop(), mp)
-                mapped.extend(m)
-                new_unmapped.extend(u)
-            unmapped = new_unmapped
-
-        mapped.extend(unmapped)
+            end = r.stop if stop is None else min(stop, r.stop)
+            mapped.append(range(start + offset, end + offset))
         return mapped
 
-    @staticmethod
-    def _map_range_helper(
-        r: range, c: CategoryRange
-    ) -> tuple[list[range], list[range]]:
-        """split range r into mapped and unmapped parts"""
-
-        offset: int = c.offset()
-        s: range = c.source
-        unmapped: list[range] = []
-        mapped: list[range] = []
+    def then(self, other: "PiecewiseMap") -> "PiecewiseMap":
+        """the map applying self first and other to the result"""
+        starts: list[int] = []
+        offsets: list[int] = []
+        for start, stop, offset in self.segments(self.starts[0]):
+            # cut this piece's image by the pieces of other it overlaps
+            for lo, hi, second in other.segments(start + offset):
+                if stop is not None and lo >= stop + offset:
+                    break
+                if not offsets or offsets[-1] != offset + second:
+                    starts.append(lo - offset)
+                    offsets.append(offset + second)
+                if hi is None:
+                    break
+        return PiecewiseMap(starts=starts, offsets=offsets)
 
-        if r.start < s.start and r.stop > s.stop:
-            # s is wholly contained within r
-            #
-            # r.start    s.start               s.stop     r.stop
-            #    V          V                     V          V
-            #    +----------+---------------------+----------+
-            #    | unmapped |       mapped        | unmapped |
-            #    +----------+---------------------+----------+
-            unmapped = [
-                range(r.start, s.start),
-                range(s.stop, r.stop),
-            ]
-            mapped = [range(s.start + offset, s.stop + offset)]
-        elif r.start >= s.start and r.stop <= s.stop:
-            # r is wholly contained by or equal to s
-            #
-            # s.start    r.start               r.stop     s.stop
-            #    V          V                     V          V
-            #    +----------+---------------------+----------+
-            #    |          |       mapped        |          |
-            #    +----------+---------------------+----------+
-            unmapped = []
-            mapped = [range(r.start + offset, r.stop + offset)]
-        elif r.start < s.start and r.stop > s.start:
-            # r overlaps s from left
-            #
-            # r.start    s.start               r.stop     s.stop
-            #    V          V                     V          V
-            #    +----------+---------------------+----------+
-            #    | unmapped |       mapped        |          |
-            #    +----------+---------------------+----------+
-            unmapped = [range(r.start, s.start)]
-            mapped = [range(s.start + offset, r.stop + offset)]
-        elif r.start < s.stop and r.stop > s.stop:
-            # r overlaps s from right
-            #
-            # s.start    r.start               s.stop     r.stop
-            #    V          V                     V          V
-            #    +----------+---------------------+----------+
-            #    |          |       mapped        | unmapped |
-            #    +----------+---------------------+----------+
-            unmapped = [range(s.stop, r.stop)]
-            mapped = [range(r.start + offset, s.stop + offset)]
-        else:
-            # no overlap
-            unmapped = [r]
-            mapped = []
 
-        return unmapped, mapped
+@dataclass(frozen=True, eq=True, repr=True)
+class CategoryMap:
+    source: str
+    target: str
+    maps: list[CategoryRange]
+
+    @cached_property
+    def pieces(self) -> PiecewiseMap:
+        """the ranges in source order, with the gaps between them as identity"""
+        return PiecewiseMap.from_ranges(self.maps)
+
+    def map_range(self, r: range) -> list[range]:
+        return self.pieces.map_range(r)
 
     @staticmethod
     def from_string(data: str) -> "CategoryMap":
@@ -123,6 +134,7 @@ class CategoryMap:
                 )
             )
 
+        maps.sort(key=lambda c: c.source.start)
         return CategoryMap(source=src, target=tgt, maps=maps)
 
 
@@ -149,20 +161,30 @@ class Almanac:
 
         return Almanac(seeds=seeds, maps={m.source: m for m in maps})
 
-
-def traverse(almanac: Almanac, r: range, category: str = "seed") -> list[range]:
-    if category not in almanac.maps:
-        return [r]
-
-    mapped_ranges: list[range] = almanac.maps[category].map_range(r)
-    next_traversal: list[range] = []
-    for m in mapped_ranges:
-        next_traversal.extend(traverse(almanac, m, almanac.maps[category].target))
-    return next_traversal
+    @cached_property
+    def seed_to_location(self) -> PiecewiseMap:
+        """the whole chain of maps from seed on, composed into a single table"""
+        table = PiecewiseMap.identity()
+        category = "seed"
+        while category in self.maps:
+            table = table.then(self.maps[category].pieces)
+            category = self.maps[category].target
+        return table
 
 
 def lowest_location(almanac: Almanac) -> int:
-    return min(min(r.start for r in traverse(almanac, seed)) for seed in almanac.seeds)
+    table = almanac.seed_to_location
+    return min(min(r.start for r in table.map_range(seed)) for seed in almanac.seeds)
+
+
+SOLVER = Solver(
+    parse=lambda data: (
+        Almanac.from_string(data),
+        Almanac.from_string(data, seeds_as_ranges=True),
+    ),
+    part1=lambda almanacs: lowest_location(almanacs[0]),
+    part2=lambda almanacs: lowest_location(almanacs[1]),
+)
 
 
 if __name__ == "__main__":
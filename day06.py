@@ -1,7 +1,9 @@
 import re
 from dataclasses import dataclass
 from math import ceil, floor, prod, sqrt
-from sys import stdin
+
+from lib import Solver
+from resultcache import solve_stdin
 
 RE_NUMBER = re.compile(r"\d+")
 
@@ -13,11 +15,7 @@ class Race:
 
 
 def main() -> None:
-    data: str = stdin.read()
-    races = parse_races(data)
-    print("Part 1", total_winning_strategies(races))
-    races = parse_races_bad_kerning(data)
-    print("Part 2", total_winning_strategies(races))
+    solve_stdin("day06", SOLVER)
 
 
 def parse_races(data: str) -> list[Race]:
@@ -90,5 +88,12 @@ def total_winning_strategies(races: list[Race]) -> int:
     return prod(count_winning_strategies(r) for r in races)
 
 
+SOLVER = Solver(
+    parse=lambda data: (parse_races(data), parse_races_bad_kerning(data)),
+    part1=lambda races: total_winning_strategies(races[0]),
+    part2=lambda races: total_winning_strategies(races[1]),
+)
+
+
 if __name__ == "__main__":
     main()
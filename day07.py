@@ -1,16 +1,14 @@
 from collections import Counter
 from dataclasses import dataclass
 from enum import IntEnum
-from sys import stdin
-from typing import Sequence
+from typing import Iterable, Iterator, Union
+
+from lib import Solver, iter_lines
+from resultcache import solve_stdin
 
 
 def main() -> None:
-    data: str = stdin.read()
-    hands: list[Hand] = parse_hands(data)
-    print("Part 1", winnings(hands))
-    joker_hands: list[HandWithJokers] = parse_hands_with_jokers(data)
-    print("Part 2", winnings(joker_hands))
+    solve_stdin("day07", SOLVER)
 
 
 class HandType(IntEnum):
@@ -117,18 +115,35 @@ class HandWithJokers(Hand):
 
 
 def parse_hands(data: str) -> list[Hand]:
-    return [Hand.from_string(line.strip()) for line in data.split("\n") if line]
+    return list(iter_hands(data.split("\n")))
+
+
+def iter_hands(lines: Iterable[Union[str, bytes]]) -> Iterator[Hand]:
+    return (Hand.from_string(line.strip()) for line in iter_lines(lines) if line)
 
 
 def parse_hands_with_jokers(data: str) -> list[HandWithJokers]:
-    return [
-        HandWithJokers.from_string(line.strip()) for line in data.split("\n") if line
-    ]
+    return list(iter_hands_with_jokers(data.split("\n")))
+
 
+def iter_hands_with_jokers(
+    lines: Iterable[Union[str, bytes]]
+) -> Iterator[HandWithJokers]:
+    return (
+        HandWithJokers.from_string(line.strip()) for line in iter_lines(lines) if line
+    )
 
-def winnings(hands: Sequence[Hand]) -> int:
+
+def winnings(hands: Iterable[Hand]) -> int:
     return sum(rank * hand.bid for rank, hand in enumerate(sorted(hands), start=1))
 
 
+SOLVER = Solver(
+    parse=lambda data: (parse_hands(data), parse_hands_with_jokers(data)),
+    part1=lambda hands: winnings(hands[0]),
+    part2=lambda hands: winnings(hands[1]),
+)
+
+
 if __name__ == "__main__":
     main()
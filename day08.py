@@ -2,18 +2,18 @@ import re
 from dataclasses import dataclass
 from itertools import cycle, takewhile
 from math import lcm
-from sys import stdin
 from typing import Iterable
 
+from lib import Solver
+from resultcache import solve_stdin
+
 RE_EDGE = re.compile(r"^(\w{3}) = \((\w{3}), (\w{3})\)$")
 
 EdgeDict = dict[str, tuple[str, str]]
 
 
 def main() -> None:
-    map: Map = Map.from_string(stdin.read())
-    print("Part 1:", steps_between(map, start="AAA", stop="ZZZ"))
-    print("Part 2:", ghost_steps(map))
+    solve_stdin("day08", SOLVER)
 
 
 @dataclass
@@ -61,5 +61,12 @@ def ghost_steps(map: Map) -> int:
     return steps
 
 
+SOLVER = Solver(
+    parse=Map.from_string,
+    part1=lambda map: steps_between(map, start="AAA", stop="ZZZ"),
+    part2=ghost_steps,
+)
+
+
 if __name__ == "__main__":
     main()
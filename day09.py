@@ -1,5 +1,8 @@
 import re
-from sys import stdin
+from typing import Iterable, Iterator, Union
+
+from lib import Solver, iter_lines
+from resultcache import solve_stdin
 
 RE_NUMBER = re.compile(r"-?\d+")
 
@@ -7,16 +10,17 @@ History = list[int]
 
 
 def main() -> None:
-    histories: list[History] = parse_histories(stdin.read())
-    print("Part 1:", sum_of_next_values(histories))
-    print("Part 2:", sum_of_previous_values(histories))
+    solve_stdin("day09", SOLVER)
 
 
 def parse_histories(data: str) -> list[History]:
-    def parse_history(data: str) -> History:
-        return [int(m) for m in RE_NUMBER.findall(data)]
+    return list(iter_histories(data.split("\n")))
+
 
-    return [parse_history(line) for line in data.split("\n") if line]
+def iter_histories(lines: Iterable[Union[str, bytes]]) -> Iterator[History]:
+    return (
+        [int(m) for m in RE_NUMBER.findall(line)] for line in iter_lines(lines) if line
+    )
 
 
 def extrapolate_next_item(history: History) -> int:
@@ -28,13 +32,20 @@ def extrapolate_next_item(history: History) -> int:
     )
 
 
-def sum_of_next_values(histories: list[History]) -> int:
+def sum_of_next_values(histories: Iterable[History]) -> int:
     return sum(extrapolate_next_item(h) for h in histories)
 
 
-def sum_of_previous_values(histories: list[History]) -> int:
+def sum_of_previous_values(histories: Iterable[History]) -> int:
     return sum(extrapolate_next_item(h[::-1]) for h in histories)
 
 
+SOLVER = Solver(
+    parse=parse_histories,
+    part1=sum_of_next_values,
+    part2=sum_of_previous_values,
+)
+
+
 if __name__ == "__main__":
     main()
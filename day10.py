@@ -1,8 +1,8 @@
 from dataclasses import dataclass, field
-from sys import stdin
 from typing import Optional
 
-from lib import Point, orthogonal_directions
+from lib import Point, Solver, orthogonal_directions
+from resultcache import solve_stdin
 
 PIPE_SYMBOLS: dict[str, list[Point]] = {
     "|": [Point.north(), Point.south()],
@@ -15,9 +15,7 @@ PIPE_SYMBOLS: dict[str, list[Point]] = {
 
 
 def main() -> None:
-    grid = Grid.from_string(stdin.read())
-    print("Part 1:", loop_length(grid) // 2)
-    print("Part 2:", count_enclosed_tiles(grid))
+    solve_stdin("day10", SOLVER)
 
 
 @dataclass(eq=True, frozen=True)
@@ -117,5 +115,12 @@ def count_enclosed_tiles(grid: Grid) -> int:
     return inner_count
 
 
+SOLVER = Solver(
+    parse=Grid.from_string,
+    part1=lambda grid: loop_length(grid) // 2,
+    part2=count_enclosed_tiles,
+)
+
+
 if __name__ == "__main__":
     main()
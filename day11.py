@@ -1,18 +1,11 @@
-from dataclasses import asdict
 from itertools import combinations
-from sys import stdin
 
-from lib import Point, manhattan_distance
+from lib import Point, Solver, manhattan_distance
+from resultcache import solve_stdin
 
 
 def main() -> None:
-    grid = GridDict.from_string(stdin.read())
-
-    part1_grid = expand_universe(grid)
-    print("Part 1:", sum_of_distances(part1_grid))
-
-    part2_grid = expand_universe(grid, hubble_constant=1000000)
-    print("Part 2:", sum_of_distances(part2_grid))
+    solve_stdin("day11", SOLVER)
 
 
 class GridDict(dict[Point, str]):
@@ -44,9 +37,7 @@ def expand_universe(grid: GridDict, hubble_constant=2) -> GridDict:
             else:
                 new_grid.update(
                     {
-                        Point(
-                            **{**asdict(p), axis: getattr(p, axis) + expansion}
-                        ): grid[p]
+                        p._replace(**{axis: getattr(p, axis) + expansion}): grid[p]
                         for p in points
                     }
                 )
@@ -61,5 +52,12 @@ def sum_of_distances(grid: GridDict) -> int:
     return sum(manhattan_distance(p1, p2) for p1, p2 in combinations(grid.keys(), 2))
 
 
+SOLVER = Solver(
+    parse=GridDict.from_string,
+    part1=lambda grid: sum_of_distances(expand_universe(grid)),
+    part2=lambda grid: sum_of_distances(expand_universe(grid, hubble_constant=1000000)),
+)
+
+
 if __name__ == "__main__":
     main()
@@ -1,14 +1,15 @@
 from dataclasses import dataclass
 from enum import IntEnum, auto
 from functools import cache
-from sys import stdin
+from typing import Iterable, Iterator, Union
+
+import instrument
+from lib import Solver, iter_lines
+from resultcache import solve_stdin
 
 
 def main() -> None:
-    rows = parse_spring_rows(stdin.read())
-    print("Part 1:", sum(count_arrangements(row) for row in rows))
-    rows = unfold_rows(rows)
-    print("Part 2:", sum(count_arrangements(row) for row in rows))
+    solve_stdin("day12", SOLVER)
 
 
 class SpringStatus(IntEnum):
@@ -52,7 +53,11 @@ class SpringRow:
 
 
 def parse_spring_rows(data: str) -> list[SpringRow]:
-    return [SpringRow.from_string(line) for line in data.split("\n") if line]
+    return list(iter_spring_rows(data.split("\n")))
+
+
+def iter_spring_rows(lines: Iterable[Union[str, bytes]]) -> Iterator[SpringRow]:
+    return (SpringRow.from_string(line) for line in iter_lines(lines) if line)
 
 
 @cache
@@ -93,6 +98,12 @@ def count_arrangements(row: SpringRow, current_group=0) -> int:
         )
 
 
+if instrument.ENABLED:
+    instrument.gauge(
+        "day12.count_arrangements", lambda: count_arrangements.cache_info()._asdict()
+    )
+
+
 def unfold_row(row: SpringRow) -> SpringRow:
     new_springs = ((row.springs + (SpringStatus.Unknown,)) * 5)[:-1]
     return SpringRow(
@@ -105,5 +116,12 @@ def unfold_rows(rows: list[SpringRow]) -> list[SpringRow]:
     return [unfold_row(row) for row in rows]
 
 
+SOLVER = Solver(
+    parse=parse_spring_rows,
+    part1=lambda rows: sum(count_arrangements(row) for row in rows),
+    part2=lambda rows: sum(count_arrangements(row) for row in unfold_rows(rows)),
+)
+
+
 if __name__ == "__main__":
     main()
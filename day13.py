@@ -2,16 +2,14 @@ from dataclasses import dataclass
 from enum import IntEnum
 from functools import reduce
 from operator import or_
-from sys import stdin
 from typing import Callable
 
-from lib import transpose
+from lib import Solver, transpose_bits
+from resultcache import solve_stdin
 
 
 def main() -> None:
-    grids = parse_grids(stdin.read())
-    print("Part 1:", apparent_reflection_summary(grids))
-    print("Part 2:", real_reflection_summary(grids))
+    solve_stdin("day13", SOLVER)
 
 
 @dataclass
@@ -27,10 +25,8 @@ class Grid:
             )
 
         lines = data.split("\n")
-        return Grid(
-            rows=[line_to_bits(line) for line in lines],
-            columns=[line_to_bits("".join(column)) for column in transpose(lines)],
-        )
+        rows = [line_to_bits(line) for line in lines]
+        return Grid(rows=rows, columns=transpose_bits(rows, len(lines[0])))
 
 
 class ReflectionType(IntEnum):
@@ -104,5 +100,12 @@ def real_reflection_summary(grids: list[Grid]) -> int:
     return sum(find_real_reflection(g).reflection_value for g in grids)
 
 
+SOLVER = Solver(
+    parse=parse_grids,
+    part1=apparent_reflection_summary,
+    part2=real_reflection_summary,
+)
+
+
 if __name__ == "__main__":
     main()
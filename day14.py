@@ -1,103 +1,81 @@
 from dataclasses import dataclass
-from enum import IntEnum, auto
-from operator import attrgetter
-from sys import stdin
+from enum import IntEnum
 
-from lib import Point
+import instrument
+from lib import Grid2D, Point, Solver
+from resultcache import solve_stdin
 
 
 def main() -> None:
-    grid = Grid.from_string(stdin.read())
-    print("Part 1:", grid.tilt().load)
-    print("Part 2:", grid.n_cycles(1000000000).load)
+    solve_stdin("day14", SOLVER)
 
 
 class Tile(IntEnum):
-    Empty: int = auto()
-    LooseRock: int = auto()
-    FixedRock: int = auto()
+    Empty = ord(".")
+    LooseRock = ord("O")
+    FixedRock = ord("#")
 
 
-TILE_MAPPING: dict[str, Tile] = {
-    ".": Tile.Empty,
-    "O": Tile.LooseRock,
-    "#": Tile.FixedRock,
-}
-
-
-class GridDict(dict[Point, Tile]):
-    def __missing__(self, key: Point) -> Tile:
-        return Tile.Empty
-
-    @staticmethod
-    def from_string(data: str) -> "GridDict":
-        return GridDict(
-            {
-                Point(x, y): TILE_MAPPING[ch]
-                for y, line in enumerate(data.split("\n"))
-                if line
-                for x, ch in enumerate(line)
-                if ch != "."
-            }
-        )
-
-
-def hash_grid(gd: GridDict) -> int:
-    return hash(sum(hash(hash(p) + hash(t)) for p, t in gd.items()))
+def roll(lane: bytes, toward_start: bool) -> bytes:
+    """lane with every loose rock rolled as far towards one end as it goes"""
+    rolled: list[bytes] = []
+    for segment in lane.split(b"#"):
+        rocks = segment.count(b"O")
+        empty = b"." * (len(segment) - rocks)
+        if toward_start:
+            rolled.append(b"O" * rocks + empty)
+        else:
+            rolled.append(empty + b"O" * rocks)
+    return b"#".join(rolled)
 
 
 @dataclass(frozen=True)
 class Grid:
-    grid: GridDict
-    width: int
-    height: int
+    grid: Grid2D
 
     def __str__(self) -> "str":
-        string_builder = []
-        reverse_map = {v: k for k, v in TILE_MAPPING.items()}
-        for y in range(self.height):
-            for x in range(self.width):
-                string_builder.append(reverse_map[self.grid[Point(x, y)]])
-            string_builder.append("\n")
-        return "".join(string_builder)
+        return str(self.grid)
 
     @staticmethod
     def from_string(data: str) -> "Grid":
-        grid = GridDict.from_string(data)
-        max_x = max(p.x for p in grid.keys())
-        max_y = max(p.y for p in grid.keys())
-        return Grid(grid=grid, width=max_x + 1, height=max_y + 1)
+        return Grid(grid=Grid2D.from_string(data))
+
+    @staticmethod
+    def from_file(path: str) -> "Grid":
+        return Grid(grid=Grid2D.from_file(path))
+
+    @property
+    def width(self) -> int:
+        return self.grid.width
+
+    @property
+    def height(self) -> int:
+        return self.grid.height
+
+    def cells(self) -> bytes:
+        """every cell row by row, without line endings"""
+        return b"".join(self.grid.row(y) for y in range(self.height))
 
     def tilt(self, direction: Point = Point.north()) -> "Grid":
-        def roll_rock(grid: GridDict, p: Point):
-            while True:
-                q = p + direction
-                if (
-                    q.y < 0
-                    or q.y >= self.height
-                    or q.x < 0
-                    or q.x >= self.width
-                    or grid[q] != Tile.Empty
-                ):
-                    return p
-                p = q
-
-        new_grid = GridDict({p: t for p, t in self.grid.items() if t == Tile.FixedRock})
-        loose_rocks = (p for p, t in self.grid.items() if t == Tile.LooseRock)
-
-        # west-to-east north-to-south works for north and west tilts,
-        # but south and east need to be reversed
-        should_reverse: bool = direction in (Point.south(), Point.east())
-
-        for p in sorted(loose_rocks, key=attrgetter("y", "x"), reverse=should_reverse):
-            new_grid[roll_rock(new_grid, p)] = Tile.LooseRock
-
-        return Grid(grid=new_grid, width=self.width, height=self.height)
+        # Every row or column along the direction is rolled on its own; rocks
+        # between two fixed rocks just pile up at one end of that stretch.
+        width, height = self.width, self.height
+        cells = bytearray(self.cells())
+        toward_start = direction in (Point.north(), Point.west())
+        if direction in (Point.north(), Point.south()):
+            for x in range(width):
+                cells[x::width] = roll(bytes(cells[x::width]), toward_start)
+        else:
+            for start in range(0, width * height, width):
+                lane = bytes(cells[start : start + width])
+                cells[start : start + width] = roll(lane, toward_start)
+        return Grid(grid=Grid2D(width, height, cells, Tile.Empty))
 
     @property
     def load(self) -> int:
         return sum(
-            self.height - p.y for p, t in self.grid.items() if t == Tile.LooseRock
+            (self.height - y) * self.grid.row(y).tobytes().count(b"O")
+            for y in range(self.height)
         )
 
     def cycle(self) -> "Grid":
@@ -106,27 +84,39 @@ class Grid:
             new_grid = new_grid.tilt(direction)
         return new_grid
 
+    @instrument.timed("day14.n_cycles")
     def n_cycles(self, n: int) -> "Grid":
-        seen: dict[int, int] = {hash_grid(self.grid): 0}
+        # the cells themselves are the key, so no two grids can ever collide
+        seen: dict[bytes, int] = {self.cells(): 0}
         history: dict[int, Grid] = {0: self}
 
         new_grid = self
+        instrumented = instrument.ENABLED
         for c in range(1, n + 1):
             new_grid = new_grid.cycle()
+            if instrumented:
+                instrument.count("day14.cycle_probes")
 
             # detect cyclical repetition, shortcut to the end if possible
-            new_hash = hash_grid(new_grid.grid)
-            if new_hash in seen:
-                offset = seen[new_hash]
-                remainder = n - seen[new_hash]
-                cycle_length = c - seen[new_hash]
+            key = new_grid.cells()
+            if key in seen:
+                offset = seen[key]
+                remainder = n - seen[key]
+                cycle_length = c - seen[key]
                 return history[offset + (remainder % cycle_length)]
 
-            seen[new_hash] = c
+            seen[key] = c
             history[c] = new_grid
 
         return new_grid
 
 
+SOLVER = Solver(
+    parse=Grid.from_string,
+    part1=lambda grid: grid.tilt().load,
+    part2=lambda grid: grid.n_cycles(1000000000).load,
+)
+
+
 if __name__ == "__main__":
     main()
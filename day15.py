@@ -1,14 +1,14 @@
 from collections import defaultdict
 from dataclasses import dataclass
 from functools import reduce
-from sys import stdin
 from typing import Callable, Mapping, MutableMapping
 
+from lib import Solver
+from resultcache import solve_stdin
+
 
 def main() -> None:
-    steps = parse_steps(stdin.read())
-    print("Part 1:", sum_of_hashes(steps))
-    print("Part 2:", total_focusing_power(steps))
+    solve_stdin("day15", SOLVER)
 
 
 def parse_steps(data: str) -> list[str]:
@@ -76,5 +76,12 @@ def total_focusing_power(steps: list[str]) -> int:
     )
 
 
+SOLVER = Solver(
+    parse=parse_steps,
+    part1=sum_of_hashes,
+    part2=total_focusing_power,
+)
+
+
 if __name__ == "__main__":
     main()
@@ -1,37 +1,37 @@
 from dataclasses import dataclass
-from sys import stdin
 from typing import Callable
 
-from lib import Point
+import instrument
+from lib import Grid2D, Point, Solver
+from resultcache import solve_stdin
 
 
 def main() -> None:
-    grid = Grid.from_string(stdin.read())
-    start_beam = Beam(pos=Point(-1, 0), v=Point(1, 0))
-    print("Part 1:", count_energized_tiles(grid, start_beam))
-    print("Part 2:", most_energized_configuration(grid))
+    solve_stdin("day16", SOLVER)
 
 
 @dataclass(frozen=True)
 class Grid:
-    grid: dict[Point, str]
-    width: int
-    height: int
+    grid: Grid2D
 
     @staticmethod
     def from_string(data: str) -> "Grid":
-        new_grid = {
-            Point(x, y): ch
-            for y, line in enumerate(data.split("\n"))
-            if line
-            for x, ch in enumerate(line)
-        }
-        max_x = max(p.x for p in new_grid.keys())
-        max_y = max(p.y for p in new_grid.keys())
-        return Grid(grid=new_grid, width=max_x + 1, height=max_y + 1)
+        return Grid(grid=Grid2D.from_string(data))
+
+    @staticmethod
+    def from_file(path: str) -> "Grid":
+        return Grid(grid=Grid2D.from_file(path))
+
+    @property
+    def width(self) -> int:
+        return self.grid.width
+
+    @property
+    def height(self) -> int:
+        return self.grid.height
 
     def in_bounds(self, p: Point) -> bool:
-        return p.x >= 0 and p.x < self.width and p.y >= 0 and p.y < self.height
+        return p in self.grid
 
 
 @dataclass(eq=True, frozen=True)
@@ -105,21 +105,25 @@ def empty_space(beam_v: Point) -> list[Point]:
     return [beam_v]
 
 
-TRANSFORMATIONS: dict[str, Callable[[Point], list[Point]]] = {
-    "|": vertical_splitter,
-    "-": horizontal_splitter,
-    "\\": left_mirror,
-    "/": right_mirror,
-    ".": empty_space,
+TRANSFORMATIONS: dict[int, Callable[[Point], list[Point]]] = {
+    ord("|"): vertical_splitter,
+    ord("-"): horizontal_splitter,
+    ord("\\"): left_mirror,
+    ord("/"): right_mirror,
+    ord("."): empty_space,
 }
 
 
+@instrument.timed("day16.count_energized_tiles")
 def count_energized_tiles(grid: Grid, beam: Beam) -> int:
     seen: set[Beam] = set()
     beams: list[Beam] = [beam]
+    instrumented = instrument.ENABLED
 
     while beams:
         past_beam: Beam = beams.pop()
+        if instrumented:
+            instrument.count("day16.beam_steps")
         beam = Beam(pos=past_beam.pos + past_beam.v, v=past_beam.v)
 
         if not grid.in_bounds(beam.pos) or beam in seen:
@@ -130,7 +134,7 @@ def count_energized_tiles(grid: Grid, beam: Beam) -> int:
             continue
 
         seen.add(beam)
-        tile: str = grid.grid[beam.pos]
+        tile: int = grid.grid[beam.pos]
         beams.extend(
             Beam(pos=beam.pos, v=new_v) for new_v in TRANSFORMATIONS[tile](beam.v)
         )
@@ -151,5 +155,14 @@ def most_energized_configuration(grid: Grid) -> int:
     return max(count_energized_tiles(grid, beam) for beam in start_beams)
 
 
+SOLVER = Solver(
+    parse=Grid.from_string,
+    part1=lambda grid: count_energized_tiles(
+        grid, Beam(pos=Point(-1, 0), v=Point(1, 0))
+    ),
+    part2=most_energized_configuration,
+)
+
+
 if __name__ == "__main__":
     main()
@@ -1,50 +1,36 @@
 from collections import defaultdict
 from dataclasses import dataclass
 from heapq import heappop, heappush
-from sys import stdin
 
-from lib import Point, orthogonal_directions
+import instrument
+from lib import Grid2D, Point, Solver, orthogonal_directions
+from resultcache import solve_stdin
+
+HEAT_LOSS_TABLE = bytes.maketrans(b"0123456789", bytes(range(10)))
 
 
 def main() -> None:
-    grid = Grid.from_string(stdin.read())
-    print(
-        "Part 1:",
-        min_heat_loss(
-            grid=grid, start=Point(0, 0), finish=Point(grid.max_x, grid.max_y)
-        ),
-    )
-    print(
-        "Part 1:",
-        min_heat_loss(
-            grid=grid,
-            start=Point(0, 0),
-            finish=Point(grid.max_x, grid.max_y),
-            min_streak=4,
-            max_streak=10,
-        ),
-    )
+    solve_stdin("day17", SOLVER)
 
 
 @dataclass
 class Grid:
-    grid: dict[Point, int]
+    grid: Grid2D
     max_x: int
     max_y: int
 
     @staticmethod
     def from_string(data: str) -> "Grid":
-        new_grid = {
-            Point(x, y): int(ch)
-            for y, line in enumerate(data.split("\n"))
-            if line
-            for x, ch in enumerate(line)
-        }
-        max_x = max(p.x for p in new_grid.keys())
-        max_y = max(p.y for p in new_grid.keys())
-        return Grid(grid=new_grid, max_x=max_x, max_y=max_y)
+        new_grid = Grid2D.from_string(data, translate=HEAT_LOSS_TABLE)
+        return Grid(grid=new_grid, max_x=new_grid.width - 1, max_y=new_grid.height - 1)
+
+    @staticmethod
+    def from_file(path: str) -> "Grid":
+        new_grid = Grid2D.from_file(path, translate=HEAT_LOSS_TABLE)
+        return Grid(grid=new_grid, max_x=new_grid.width - 1, max_y=new_grid.height - 1)
 
 
+@instrument.timed("day17.min_heat_loss")
 def min_heat_loss(
     grid: Grid, start: Point, finish: Point, min_streak: int = 1, max_streak: int = 3
 ) -> int:
@@ -58,9 +44,12 @@ def min_heat_loss(
 
     path_costs: dict[CostKey, int] = defaultdict(lambda: 2**32)
     seen: set[CostKey] = set()
+    instrumented = instrument.ENABLED
 
     while queue:
         cost, pos, blocked_direction = heappop(queue)
+        if instrumented:
+            instrument.count("day17.heap_pops")
 
         if pos == finish:
             return int(cost)
@@ -95,9 +84,26 @@ def min_heat_loss(
 
                 path_costs[(next_pos, direction)] = cost_to_destination
                 heappush(queue, (cost_to_destination, next_pos, direction))
+                if instrumented:
+                    instrument.count("day17.heap_pushes")
 
     assert None, "Path not found"
 
 
+SOLVER = Solver(
+    parse=Grid.from_string,
+    part1=lambda grid: min_heat_loss(
+        grid=grid, start=Point(0, 0), finish=Point(grid.max_x, grid.max_y)
+    ),
+    part2=lambda grid: min_heat_loss(
+        grid=grid,
+        start=Point(0, 0),
+        finish=Point(grid.max_x, grid.max_y),
+        min_streak=4,
+        max_streak=10,
+    ),
+)
+
+
 if __name__ == "__main__":
     main()
@@ -1,8 +1,9 @@
 import re
 from dataclasses import dataclass
-from sys import stdin
+from typing import Iterable, Iterator, Union
 
-from lib import Point
+from lib import Point, Solver, iter_lines
+from resultcache import solve_stdin
 
 RE_DIG_INSTRUCTION = re.compile(r"^([UDLR]) (\d+) \(#([0-9a-fA-F]{6})\)$")
 DIG_DIRECTION_MAP: dict[str, Point] = {
@@ -20,10 +21,7 @@ SWAPPED_DIG_DIRECTION_MAP: dict[str, Point] = {
 
 
 def main() -> None:
-    dig_instructions = parse_instruction(stdin.read())
-    print("Part 1:", lagoon_size(dig_instructions))
-    swapped = swap_instructions(dig_instructions)
-    print("Part 2:", lagoon_size(swapped))
+    solve_stdin("day18", SOLVER)
 
 
 @dataclass(eq=True, frozen=True)
@@ -52,20 +50,15 @@ class DigInstruction:
 
 
 def parse_instruction(data: str) -> list[DigInstruction]:
-    return [DigInstruction.from_string(line) for line in data.split("\n") if line]
+    return list(iter_instructions(data.split("\n")))
 
 
-def swap_instructions(instructions: list[DigInstruction]) -> list[DigInstruction]:
-    return [inst.swap() for inst in instructions]
-
+def iter_instructions(lines: Iterable[Union[str, bytes]]) -> Iterator[DigInstruction]:
+    return (DigInstruction.from_string(line) for line in iter_lines(lines) if line)
 
-def make_polygon(trench: list[DigInstruction]) -> list[Point]:
-    points: list[Point] = [Point(0, 0)]
 
-    for instr in trench:
-        points.append(points[-1] + instr.direction * instr.distance)
-
-    return points
+def swap_instructions(instructions: Iterable[DigInstruction]) -> list[DigInstruction]:
+    return [inst.swap() for inst in instructions]
 
 
 def determinant(p1: Point, p2: Point) -> int:
@@ -74,24 +67,36 @@ def determinant(p1: Point, p2: Point) -> int:
     return p1.x * p2.y - p2.x * p1.y
 
 
-def lagoon_size(instructions: list[DigInstruction]) -> int:
-    vertices = make_polygon(instructions)
+def lagoon_size(instructions: Iterable[DigInstruction]) -> int:
+    # Both sums are accumulated while walking the trench, so the instructions can
+    # be streamed without ever keeping the polygon around.
+    vertex = Point(0, 0)
+    double_area: int = 0
+    edge_points: int = 0
 
-    # shoelace formula: https://en.wikipedia.org/wiki/Shoelace_formula
-    inner_area: float = (
-        sum(
-            determinant(p1, p2)
-            for p1, p2 in zip(vertices, vertices[1:] + [vertices[0]])
-        )
-        // 2
-    )
+    for instr in instructions:
+        next_vertex = vertex + instr.direction * instr.distance
+        # shoelace formula: https://en.wikipedia.org/wiki/Shoelace_formula
+        double_area += determinant(vertex, next_vertex)
+        edge_points += instr.distance
+        vertex = next_vertex
+
+    # The trench ends where it started, at the origin, so the closing edge of the
+    # shoelace sum is always zero.
+    inner_area = double_area // 2
 
     # pick's theorem: https://en.wikipedia.org/wiki/Pick%27s_theorem
-    edge_points = sum(instr.distance for instr in instructions)
     area: int = int(inner_area + edge_points // 2 + 1)
 
     return area
 
 
+SOLVER = Solver(
+    parse=parse_instruction,
+    part1=lagoon_size,
+    part2=lambda instructions: lagoon_size(swap_instructions(instructions)),
+)
+
+
 if __name__ == "__main__":
     main()
@@ -3,8 +3,10 @@ from dataclasses import dataclass
 from enum import IntEnum, auto
 from math import prod
 from operator import gt, lt
-from sys import stdin
-from typing import Callable, Iterable, Optional
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+from lib import Solver, iter_lines
+from resultcache import solve_stdin
 
 RE_WORKFLOW = re.compile(r"^(\w+){([^}]+)}$")
 RE_RULE = re.compile(r"^(\w+)([<>])(\d+):(\w+)")
@@ -13,12 +15,7 @@ OP: dict[str, Callable] = {"<": lt, ">": gt}
 
 
 def main() -> None:
-    workflows: WorkflowMap
-    parts: PartList
-    workflows, parts = parse_input(stdin.read())
-
-    print("Part 1:", accepted_rating(workflows, parts))
-    print("Part 2:", count_distinct_combinations(workflows))
+    solve_stdin("day19", SOLVER)
 
 
 class WorkflowResult(IntEnum):
@@ -131,20 +128,24 @@ PartList = list[Part]
 
 
 def parse_input(data: str) -> tuple[WorkflowMap, PartList]:
-    workflowdata, partdata = data.split("\n\n")
+    workflowmap, parts = read_input(data.split("\n"))
+    return workflowmap, list(parts)
+
 
-    # parse and structure workflows
-    workflows: list[Workflow] = [
-        Workflow.from_string(line) for line in workflowdata.split("\n") if line
-    ]
-    workflowmap: dict[str, Workflow] = {wf.name: wf for wf in workflows}
+def read_input(
+    lines: Iterable[Union[str, bytes]]
+) -> tuple[WorkflowMap, Iterator[Part]]:
+    """read the workflows, leaving the parts to be parsed as they're consumed"""
+    line_iter = iter_lines(lines)
 
-    # parse parts
-    parts: list[Part] = [
-        Part.from_string(line) for line in partdata.split("\n") if line
-    ]
+    workflowmap: WorkflowMap = {}
+    for line in line_iter:
+        if not line:
+            break
+        wf = Workflow.from_string(line)
+        workflowmap[wf.name] = wf
 
-    return workflowmap, parts
+    return workflowmap, (Part.from_string(line) for line in line_iter if line)
 
 
 def apply_workflows(workflows: WorkflowMap, part: Part) -> WorkflowResult:
@@ -161,7 +162,7 @@ def apply_workflows(workflows: WorkflowMap, part: Part) -> WorkflowResult:
     assert None, "End of workflows reached"
 
 
-def accepted_rating(workflows: WorkflowMap, parts: list[Part]) -> int:
+def accepted_rating(workflows: WorkflowMap, parts: Iterable[Part]) -> int:
     return sum(
         p.x + p.m + p.a + p.s
         for p in parts
@@ -213,5 +214,12 @@ def count_distinct_combinations(workflows: WorkflowMap) -> int:
     return combinations
 
 
+SOLVER = Solver(
+    parse=parse_input,
+    part1=lambda puzzle: accepted_rating(*puzzle),
+    part2=lambda puzzle: count_distinct_combinations(puzzle[0]),
+)
+
+
 if __name__ == "__main__":
     main()
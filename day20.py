@@ -6,17 +6,23 @@ from functools import reduce
 from itertools import count
 from math import lcm, prod
 from operator import add
-from sys import stdin
 from typing import Callable, Optional
 
+import instrument
+from lib import Solver
+from resultcache import solve_stdin
+
 RE_MODULE_DEFINITION = re.compile(r"^([%&]?\w+) -> (.*)$")
 
 
 def main() -> None:
-    machinery = Machinery.from_string(stdin.read())
-    machinery.button_mash(1000)
-    print("Part 1:", machinery.pulse_score())
-    print("Part 2:", fewest_pushes_for_rx_low(machinery))
+    solve_stdin("day20", SOLVER)
+
+
+def pulse_score_after_button_mash(machinery: "Machinery", n: int = 1000) -> int:
+    machinery.reset()
+    machinery.button_mash(n)
+    return machinery.pulse_score()
 
 
 def fewest_pushes_for_rx_low(machinery: "Machinery") -> int:
@@ -172,8 +178,13 @@ class Machinery:
         msgqueue: list[PulseMessage] = [
             PulseMessage(source="button", target="broadcaster", pulse=Pulse.Low)
         ]
+        instrumented = instrument.ENABLED
+        if instrumented:
+            instrument.count("day20.button_presses")
         while msgqueue:
             msg = msgqueue.pop(0)
+            if instrumented:
+                instrument.count("day20.pulses")
             msgqueue.extend(self.modules[msg.target].pulse_in(msg.pulse, msg.source))
 
     def button_mash(self, n: int) -> None:
@@ -230,5 +241,12 @@ class Machinery:
         return machinery
 
 
+SOLVER = Solver(
+    parse=Machinery.from_string,
+    part1=pulse_score_after_button_mash,
+    part2=fewest_pushes_for_rx_low,
+)
+
+
 if __name__ == "__main__":
     main()
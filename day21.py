@@ -1,23 +1,19 @@
 from dataclasses import dataclass
-from sys import stdin
 
-from lib import Point, orthogonal_neighborhood
+from lib import BitGrid, Grid2D, Point, Solver
+from resultcache import solve_stdin
 
-
-def main() -> None:
-    grid = Grid.from_string(stdin.read())
-    print("Part 1:", count_plots_reachable_in_n_steps(grid, n=64))
-    print("Part 2:", interpolate_plots_reachable_in_n_steps(grid, n=26501365))
+ROCK = ord("#")
+START = ord("S")
 
 
-class GridDict(dict[Point, str]):
-    def __missing__(self, key: Point) -> str:
-        return "."
+def main() -> None:
+    solve_stdin("day21", SOLVER)
 
 
 @dataclass
 class Grid:
-    grid: GridDict
+    grid: Grid2D
     start: Point
 
     width: int
@@ -25,39 +21,37 @@ class Grid:
 
     @staticmethod
     def from_string(data: str) -> "Grid":
-        grid = GridDict(
-            {
-                Point(x, y): ch
-                for y, line in enumerate(data.split("\n"))
-                if line
-                for x, ch in enumerate(line)
-            }
-        )
-        start: Point = next(k for k, v in grid.items() if v == "S")
-        grid[start] = "."
+        return Grid.from_grid(Grid2D.from_string(data))
 
-        max_x = max(p.x for p in grid.keys())
-        max_y = max(p.y for p in grid.keys())
+    @staticmethod
+    def from_file(path: str) -> "Grid":
+        return Grid.from_grid(Grid2D.from_file(path))
 
-        return Grid(grid=grid, start=start, width=max_x + 1, height=max_y + 1)
+    @staticmethod
+    def from_grid(grid: Grid2D) -> "Grid":
+        # The start tile is left as it is; anything that isn't a rock is a
+        # garden plot as far as walking goes, and file backed grids are
+        # read-only anyway.
+        start = grid.find(START)
+        assert start is not None, "No starting position"
 
-    def __getitem__(self, key: Point) -> str:
-        p = Point(key.x % self.width, key.y % self.height)
-        return self.grid[p]
+        return Grid(grid=grid, start=start, width=grid.width, height=grid.height)
 
 
 def count_plots_reachable_in_n_steps(grid: Grid, n: int) -> int:
-    locations: set[Point] = set([grid.start])
-    for step in range(1, n + 1):
-        new_locations = set(
-            neighbor
-            for pos in locations
-            for neighbor in orthogonal_neighborhood(pos)
-            if grid[neighbor] != "#"
-        )
-        locations = new_locations
+    # The garden repeats forever, but n steps can't take us further than n
+    # tiles from the start, so that many copies of it around the start will do.
+    copies = n // min(grid.width, grid.height) + 1
+    rocks = BitGrid.from_grid(grid.grid, ROCK).tiled(2 * copies + 1, 2 * copies + 1)
+    start = grid.start + Point(copies * grid.width, copies * grid.height)
+
+    # Step the whole frontier at once: everything next to where we could be,
+    # minus the rocks.
+    locations = BitGrid.from_points([start], rocks.width, rocks.height)
+    for _ in range(n):
+        locations = locations.neighbors() - rocks
 
-    return len(locations)
+    return locations.count()
 
 
 def interpolate_plots_reachable_in_n_steps(grid: Grid, n: int) -> int:
@@ -79,5 +73,12 @@ def interpolate_plots_reachable_in_n_steps(grid: Grid, n: int) -> int:
     return int(a * goal**2 + b * goal + c)
 
 
+SOLVER = Solver(
+    parse=Grid.from_string,
+    part1=lambda grid: count_plots_reachable_in_n_steps(grid, n=64),
+    part2=lambda grid: interpolate_plots_reachable_in_n_steps(grid, n=26501365),
+)
+
+
 if __name__ == "__main__":
     main()
@@ -2,17 +2,16 @@ import re
 from collections import defaultdict, namedtuple
 from dataclasses import dataclass, field
 from operator import attrgetter
-from sys import stdin
 from typing import Iterable
 
+from lib import Solver
+from resultcache import solve_stdin
+
 RE_BRICK = re.compile(r"(\d+),(\d+),(\d+)~(\d+),(\d+),(\d+)")
 
 
 def main() -> None:
-    bricks = parse_bricks(stdin.read())
-    fallen_bricks = simulate_gravity(bricks)
-    print("Part 1:", count_safe_to_disintegrate(fallen_bricks))
-    print("Part 2:", sum_of_best_chain_reactions(fallen_bricks))
+    solve_stdin("day22", SOLVER)
 
 
 Point3D = namedtuple("Point3D", ["x", "y", "z"])
@@ -156,5 +155,12 @@ def sum_of_best_chain_reactions(bricks: list[Brick]) -> int:
     return chain_reaction_count
 
 
+SOLVER = Solver(
+    parse=lambda data: simulate_gravity(parse_bricks(data)),
+    part1=count_safe_to_disintegrate,
+    part2=sum_of_best_chain_reactions,
+)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,502 @@
+"""Synthetic puzzle inputs at any scale
+
+    python -m generators day14 --scale 4 --seed 1 > /tmp/day14.txt
+
+scale=1 gives an input of roughly the same size as the real puzzle input, and
+the amount of input grows linearly with scale: N times more lines for the
+line-oriented days, N times the area (sqrt(N) times the side) for the grid days.
+The output always satisfies the assumptions the solvers make about the real
+inputs, e.g. day21 keeps the start row and column free of rocks.
+"""
+
+from argparse import ArgumentParser
+from itertools import product
+from random import Random
+from string import ascii_lowercase, ascii_uppercase
+from sys import stdout
+from typing import Callable
+
+DIGIT_NAMES = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+CARD_LABELS = "AKQJT98765432"
+XMAS = "xmas"
+
+
+def scaled(n: int, scale: float) -> int:
+    return max(1, round(n * scale))
+
+
+def scaled_side(n: int, scale: float) -> int:
+    return max(3, round(n * scale**0.5))
+
+
+def random_grid(
+    rng: Random, width: int, height: int, weights: dict[str, float]
+) -> list[list[str]]:
+    population, cum_weights = list(weights.keys()), list(weights.values())
+    return [
+        rng.choices(population, weights=cum_weights, k=width) for _ in range(height)
+    ]
+
+
+def join_grid(grid: list[list[str]]) -> str:
+    return "".join("".join(row) + "\n" for row in grid)
+
+
+def generate_day01(rng: Random, scale: float) -> str:
+    lines: list[str] = []
+    for _ in range(scaled(1000, scale)):
+        pieces = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 8)):
+            kind = rng.random()
+            if kind < 0.5:
+                pieces.append(
+                    "".join(rng.choices(ascii_lowercase, k=rng.randint(1, 5)))
+                )
+            elif kind < 0.8:
+                pieces.append(rng.choice(DIGIT_NAMES))
+            else:
+                pieces.append(str(rng.randint(1, 9)))
+        rng.shuffle(pieces)
+        lines.append("".join(pieces))
+    return "".join(line + "\n" for line in lines)
+
+
+def generate_day02(rng: Random, scale: float) -> str:
+    lines: list[str] = []
+    for game_id in range(1, scaled(100, scale) + 1):
+        handfuls: list[str] = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], k=rng.randint(1, 3))
+            handfuls.append(", ".join(f"{rng.randint(1, 20)} {c}" for c in colors))
+        lines.append(f"Game {game_id}: " + "; ".join(handfuls))
+    return "".join(line + "\n" for line in lines)
+
+
+def generate_day03(rng: Random, scale: float) -> str:
+    side = scaled_side(140, scale)
+    rows: list[str] = []
+    for _ in range(side):
+        row: list[str] = []
+        while len(row) < side:
+            kind = rng.random()
+            if kind < 0.12:
+                row.extend(str(rng.randint(1, 999)))
+                row.append(".")
+            elif kind < 0.16:
+                row.append(rng.choice("*#+$/@%=&-"))
+            else:
+                row.append(".")
+        rows.append("".join(row[:side]))
+    return "".join(row + "\n" for row in rows)
+
+
+def generate_day04(rng: Random, scale: float) -> str:
+    card_count = scaled(200, scale)
+    lines: list[str] = []
+    for card in range(1, card_count + 1):
+        # keep match counts modest; copy counts grow exponentially otherwise
+        match_count = min(rng.choice([0, 0, 0, 1, 1, 2, 3, 4, 10]), card_count - card)
+        winning = rng.sample(range(1, 100), k=10)
+        others = [n for n in range(1, 100) if n not in winning]
+        got = rng.sample(winning, k=match_count) + rng.sample(others, 25 - match_count)
+        rng.shuffle(got)
+        lines.append(
+            f"Card {card:>3}: "
+            + " ".join(f"{n:>2}" for n in winning)
+            + " | "
+            + " ".join(f"{n:>2}" for n in got)
+        )
+    return "".join(line + "\n" for line in lines)
+
+
+def generate_day05(rng: Random, scale: float) -> str:
+    space = 2**32
+    seed_numbers: list[int] = []
+    for _ in range(scaled(10, scale)):
+        start = rng.randrange(space // 2)
+        seed_numbers.extend([start, rng.randint(1, space // 20)])
+
+    categories = [
+        "seed",
+        "soil",
+        "fertilizer",
+        "water",
+        "light",
+        "temperature",
+        "humidity",
+        "location",
+    ]
+    blocks: list[str] = ["seeds: " + " ".join(map(str, seed_numbers))]
+    for source, target in zip(categories, categories[1:]):
+        cuts = sorted(rng.sample(range(1, space), k=scaled(30, scale)))
+        intervals = list(zip([0] + cuts, cuts + [space]))
+        # lay the intervals out back to back in the target space in random order
+        rng.shuffle(intervals)
+        lines = [f"{source}-to-{target} map:"]
+        target_start = 0
+        for start, stop in intervals:
+            if rng.random() < 0.8:
+                # leave some source intervals unmapped, i.e. identity
+                lines.append(f"{target_start} {start} {stop - start}")
+            target_start += stop - start
+        blocks.append("\n".join(lines))
+    return "\n\n".join(blocks) + "\n"
+
+
+def generate_day06(rng: Random, scale: float) -> str:
+    # Part 2 glues all numbers together and takes a float square root of the
+    # result, so the number of races has to stay small.
+    race_count = min(scaled(4, scale), 40)
+    times = [rng.randint(40, 63) for _ in range(race_count)]
+    records = [rng.randint(100, t * t // 4 - 1) for t in times]
+    return (
+        "Time:      " + " ".join(f"{t:>4}" for t in times) + "\n"
+        "Distance:  " + " ".join(f"{r:>4}" for r in records) + "\n"
+    )
+
+
+def generate_day07(rng: Random, scale: float) -> str:
+    hands: set[str] = set()
+    while len(hands) < scaled(1000, scale):
+        hands.add("".join(rng.choices(CARD_LABELS, k=5)))
+    return "".join(f"{hand} {rng.randint(1, 1000)}\n" for hand in sorted(hands))
+
+
+def generate_day08(rng: Random, scale: float) -> str:
+    ghost_count = 6
+    names = [
+        "".join(p)
+        for p in product(ascii_uppercase, ascii_uppercase, ascii_uppercase[1:-1])
+    ]
+    node_count = min(scaled(700, scale), len(names) - ghost_count)
+    inner_names = rng.sample(names, k=node_count)
+    prefixes = ["AA"] + rng.sample(
+        ["".join(p) for p in product(ascii_uppercase, repeat=2) if p[0] != p[1]],
+        k=ghost_count - 1,
+    )
+
+    edges: list[str] = []
+    per_ghost = node_count // ghost_count
+    for ghost, prefix in enumerate(prefixes):
+        start = prefix + "A"
+        end = "ZZZ" if prefix == "AA" else prefix + "Z"
+        chain = inner_names[ghost * per_ghost : (ghost + 1) * per_ghost]
+        path = [start] + chain + [end]
+        for node, next_node in zip(path, path[1:]):
+            edges.append(f"{node} = ({next_node}, {next_node})")
+        # loop back into the chain after the end node
+        loop_to = chain[0] if chain else end
+        edges.append(f"{end} = ({loop_to}, {loop_to})")
+
+    rng.shuffle(edges)
+    instructions = "".join(rng.choices("LR", k=rng.randint(200, 300)))
+    return instructions + "\n\n" + "".join(edge + "\n" for edge in edges)
+
+
+def generate_day09(rng: Random, scale: float) -> str:
+    lines: list[str] = []
+    for _ in range(scaled(200, scale)):
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(1, 6))]
+        values = [
+            sum(c * x**power for power, c in enumerate(coefficients))
+            for x in range(21)
+        ]
+        lines.append(" ".join(map(str, values)))
+    return "".join(line + "\n" for line in lines)
+
+
+def generate_day10(rng: Random, scale: float) -> str:
+    # The loop runs around the border of the grid with S in the top left corner;
+    # the inside is filled with pipe junk that isn't connected to the loop.
+    side = scaled_side(140, scale)
+    inside = random_grid(
+        rng,
+        side - 2,
+        side - 2,
+        {".": 2, "|": 1, "-": 1, "L": 1, "J": 1, "7": 1, "F": 1},
+    )
+    rows = ["S" + "-" * (side - 2) + "7"]
+    rows.extend("|" + "".join(row) + "|" for row in inside)
+    rows.append("L" + "-" * (side - 2) + "J")
+    return "".join(row + "\n" for row in rows)
+
+
+def generate_day11(rng: Random, scale: float) -> str:
+    side = scaled_side(140, scale)
+    grid = random_grid(rng, side, side, {".": 0.98, "#": 0.02})
+    for y in rng.sample(range(side), k=side // 10):
+        grid[y] = ["."] * side
+    for x in rng.sample(range(side), k=side // 10):
+        for row in grid:
+            row[x] = "."
+    return join_grid(grid)
+
+
+def generate_day12(rng: Random, scale: float) -> str:
+    lines: list[str] = []
+    for _ in range(scaled(1000, scale)):
+        groups = [rng.randint(1, 5) for _ in range(rng.randint(1, 4))]
+        springs: list[str] = ["."] * rng.randint(0, 2)
+        for group in groups:
+            springs.extend("#" * group + "." * rng.randint(1, 3))
+        springs = springs[:-1] if rng.random() < 0.5 else springs
+        row = "".join("?" if rng.random() < 0.4 else ch for ch in springs)
+        lines.append(row + " " + ",".join(map(str, groups)))
+    return "".join(line + "\n" for line in lines)
+
+
+DAY13_PATTERNS = [
+    [
+        "#.##..##.",
+        "..#.##.#.",
+        "##......#",
+        "##......#",
+        "..#.##.#.",
+        "..##..##.",
+        "#.#.##.#.",
+    ],
+    [
+        "#...##..#",
+        "#....#..#",
+        "..##..###",
+        "#####.##.",
+        "#####.##.",
+        "..##..###",
+        "#....#..#",
+    ],
+]
+
+
+def generate_day13(rng: Random, scale: float) -> str:
+    # Random patterns almost never have a reflection line, let alone a smudged
+    # one. Instead, take known-good patterns and apply random symmetries of the
+    # square to them, which keeps both reflections intact.
+    patterns: list[str] = []
+    for _ in range(scaled(100, scale)):
+        rows = rng.choice(DAY13_PATTERNS)
+        if rng.random() < 0.5:
+            rows = rows[::-1]
+        if rng.random() < 0.5:
+            rows = [row[::-1] for row in rows]
+        if rng.random() < 0.5:
+            rows = ["".join(column) for column in zip(*rows)]
+        patterns.append("\n".join(rows))
+    return "\n\n".join(patterns) + "\n"
+
+
+def generate_day14(rng: Random, scale: float) -> str:
+    side = scaled_side(100, scale)
+    return join_grid(random_grid(rng, side, side, {".": 0.65, "O": 0.2, "#": 0.15}))
+
+
+def generate_day15(rng: Random, scale: float) -> str:
+    labels = list(
+        {"".join(rng.choices(ascii_lowercase, k=rng.randint(2, 6))) for _ in range(500)}
+    )
+    steps = [
+        f"{rng.choice(labels)}={rng.randint(1, 9)}"
+        if rng.random() < 0.6
+        else f"{rng.choice(labels)}-"
+        for _ in range(scaled(4000, scale))
+    ]
+    return ",".join(steps) + "\n"
+
+
+def generate_day16(rng: Random, scale: float) -> str:
+    side = scaled_side(110, scale)
+    return join_grid(
+        random_grid(
+            rng,
+            side,
+            side,
+            {".": 0.88, "|": 0.03, "-": 0.03, "\\": 0.03, "/": 0.03},
+        )
+    )
+
+
+def generate_day17(rng: Random, scale: float) -> str:
+    side = scaled_side(141, scale)
+    return join_grid(random_grid(rng, side, side, {str(n): 1 for n in range(1, 10)}))
+
+
+def histogram_polygon(widths: list[int], heights: list[int]) -> list[tuple[str, int]]:
+    """trace the outline of a bar chart, starting at its bottom left corner"""
+    moves: list[tuple[str, int]] = [("U", heights[0])]
+    for column, width in enumerate(widths):
+        moves.append(("R", width))
+        if column + 1 < len(heights):
+            delta = heights[column + 1] - heights[column]
+            moves.append(("U" if delta > 0 else "D", abs(delta)))
+    moves.append(("D", heights[-1]))
+    moves.append(("L", sum(widths)))
+    return moves
+
+
+def generate_day18(rng: Random, scale: float) -> str:
+    def random_heights(n: int, max_height: int) -> list[int]:
+        heights = [rng.randint(1, max_height)]
+        while len(heights) < n:
+            h = rng.randint(1, max_height)
+            if h != heights[-1]:
+                heights.append(h)
+        return heights
+
+    columns = scaled(300, scale)
+    # the hex color encodes a second, much larger polygon with the same number of
+    # moves; its distances have to fit in five hex digits
+    max_hex_width = min(100000, 0xFFFFF // columns)
+    assert max_hex_width >= 1, "Too many columns for hex encoded distances"
+
+    plain = histogram_polygon(
+        [rng.randint(1, 10) for _ in range(columns)], random_heights(columns, 20)
+    )
+    hex_moves = histogram_polygon(
+        [rng.randint(1, max_hex_width) for _ in range(columns)],
+        random_heights(columns, 100000),
+    )
+    hex_direction = {"R": 0, "D": 1, "L": 2, "U": 3}
+    return "".join(
+        f"{d1} {n1} (#{n2:05x}{hex_direction[d2]})\n"
+        for (d1, n1), (d2, n2) in zip(plain, hex_moves)
+    )
+
+
+def generate_day19(rng: Random, scale: float) -> str:
+    workflow_count = scaled(550, scale)
+    names = iter(
+        rng.sample(
+            ["".join(p) for n in (2, 3) for p in product(ascii_lowercase, repeat=n)],
+            k=workflow_count + 1,
+        )
+    )
+
+    workflows: list[str] = []
+    pending: list[str] = ["in"]
+    remaining = workflow_count - 1
+    while pending:
+        # popping from a random position grows trees that are both wide and deep
+        name = pending.pop(rng.randrange(len(pending)))
+        targets: list[str] = []
+        for _ in range(rng.randint(2, 4)):
+            if remaining > 0 and rng.random() < 0.6:
+                child = next(names)
+                while child == "in":
+                    child = next(names)
+                pending.append(child)
+                targets.append(child)
+                remaining -= 1
+            else:
+                targets.append(rng.choice("AR"))
+        rules = [
+            f"{rng.choice(XMAS)}{rng.choice('<>')}{rng.randint(1, 4000)}:{target}"
+            for target in targets[:-1]
+        ]
+        workflows.append(f"{name}{{{','.join(rules + [targets[-1]])}}}")
+
+    parts = [
+        "{" + ",".join(f"{c}={rng.randint(1, 4000)}" for c in XMAS) + "}"
+        for _ in range(scaled(200, scale))
+    ]
+    return "\n".join(workflows) + "\n\n" + "\n".join(parts) + "\n"
+
+
+def generate_day20(rng: Random, scale: float) -> str:
+    # Every chain of flip-flops is a binary counter of button presses. Its
+    # conjunction module listens to the bits set in a random number m, so it
+    # first fires on press m and sends a high pulse to rm through an inverter.
+    bits = 12
+    chains = scaled(4, scale)
+    lines: list[str] = ["broadcaster -> " + ", ".join(f"f{c}x0" for c in range(chains))]
+    for c in range(chains):
+        m = rng.randrange(2 ** (bits - 1), 2**bits)
+        for bit in range(bits):
+            outputs = [f"f{c}x{bit + 1}"] if bit + 1 < bits else []
+            if m & (1 << bit):
+                outputs.append(f"c{c}")
+            if outputs:
+                lines.append(f"%f{c}x{bit} -> " + ", ".join(outputs))
+        lines.append(f"&c{c} -> v{c}")
+        lines.append(f"&v{c} -> rm")
+    lines.append("&rm -> rx")
+    rng.shuffle(lines)
+    return "".join(line + "\n" for line in lines)
+
+
+def generate_day21(rng: Random, scale: float) -> str:
+    side = scaled_side(131, scale) | 1
+    grid = random_grid(rng, side, side, {".": 0.9, "#": 0.1})
+    center = side // 2
+    for i in range(side):
+        grid[center][i] = "."
+        grid[i][center] = "."
+    grid[center][center] = "S"
+    return join_grid(grid)
+
+
+def generate_day22(rng: Random, scale: float) -> str:
+    lines: list[str] = []
+    z = 1
+    for _ in range(scaled(1200, scale)):
+        x, y = rng.randint(0, 9), rng.randint(0, 9)
+        length = rng.randint(0, 3)
+        axis = rng.choice("xyz")
+        if axis == "x":
+            x = min(x, 9 - length)
+            end = (x + length, y, z)
+        elif axis == "y":
+            y = min(y, 9 - length)
+            end = (x, y + length, z)
+        else:
+            end = (x, y, z + length)
+        lines.append(f"{x},{y},{z}~{end[0]},{end[1]},{end[2]}")
+        # every brick starts above all previous ones, so none of them overlap
+        z = end[2] + rng.randint(1, 3)
+    rng.shuffle(lines)
+    return "".join(line + "\n" for line in lines)
+
+
+GENERATORS: dict[str, Callable[[Random, float], str]] = {
+    "day01": generate_day01,
+    "day02": generate_day02,
+    "day03": generate_day03,
+    "day04": generate_day04,
+    "day05": generate_day05,
+    "day06": generate_day06,
+    "day07": generate_day07,
+    "day08": generate_day08,
+    "day09": generate_day09,
+    "day10": generate_day10,
+    "day11": generate_day11,
+    "day12": generate_day12,
+    "day13": generate_day13,
+    "day14": generate_day14,
+    "day15": generate_day15,
+    "day16": generate_day16,
+    "day17": generate_day17,
+    "day18": generate_day18,
+    "day19": generate_day19,
+    "day20": generate_day20,
+    "day21": generate_day21,
+    "day22": generate_day22,
+}
+
+
+def generate(day: str, scale: float = 1.0, seed: int = 0) -> str:
+    if day not in GENERATORS:
+        raise ValueError(f"No input generator for '{day}'")
+    if scale <= 0:
+        raise ValueError("scale must be positive")
+    return GENERATORS[day](Random(f"{day}:{seed}"), scale)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("day", choices=sorted(GENERATORS))
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    stdout.write(generate(args.day, args.scale, args.seed))
+
+
+if __name__ == "__main__":
+    main()
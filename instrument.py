@@ -0,0 +1,100 @@
+"""Opt-in counters and timers for the solvers' hot loops
+
+    AOC_INSTRUMENT=1 python day17.py < inputs/day17.txt
+    AOC_INSTRUMENT=stats.json python -m runner day16
+
+Instrumentation is off unless AOC_INSTRUMENT is set. When it is on, everything
+collected is written as JSON when the interpreter exits: to stderr for "1", or
+to the file the variable names otherwise.
+
+Solvers guard every hook with `if ENABLED:` (copied to a local before hot
+loops), and the timed decorator returns the function untouched when disabled,
+so instrumentation costs next to nothing when it is off.
+"""
+
+import atexit
+import json
+import os
+import sys
+from collections import Counter
+from dataclasses import asdict, dataclass
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any, Callable, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+TARGET = os.environ.get("AOC_INSTRUMENT", "")
+ENABLED = TARGET not in ("", "0")
+
+
+@dataclass
+class Timer:
+    calls: int = 0
+    total_ns: int = 0
+
+
+COUNTERS: Counter[str] = Counter()
+TIMERS: dict[str, Timer] = {}
+# gauges are read when a snapshot is taken, e.g. functools cache statistics
+GAUGES: dict[str, Callable[[], Any]] = {}
+
+
+def count(name: str, n: int = 1) -> None:
+    COUNTERS[name] += n
+
+
+def record_time(name: str, elapsed_ns: int) -> None:
+    timer = TIMERS.setdefault(name, Timer())
+    timer.calls += 1
+    timer.total_ns += elapsed_ns
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """decorator timing every call of the function, if instrumentation is on"""
+
+    def decorator(fn: F) -> F:
+        if not ENABLED:
+            return fn
+
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record_time(name, perf_counter_ns() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def gauge(name: str, read: Callable[[], Any]) -> None:
+    GAUGES[name] = read
+
+
+def snapshot() -> dict:
+    return {
+        "counters": dict(sorted(COUNTERS.items())),
+        "timers": {name: asdict(timer) for name, timer in sorted(TIMERS.items())},
+        "gauges": {name: read() for name, read in sorted(GAUGES.items())},
+    }
+
+
+def reset() -> None:
+    COUNTERS.clear()
+    TIMERS.clear()
+
+
+def dump(target: Optional[str] = None) -> None:
+    report = json.dumps(snapshot(), indent=2, default=str)
+    if target is None or target == "1":
+        print(report, file=sys.stderr)
+    else:
+        with open(target, "w") as f:
+            f.write(report + "\n")
+
+
+if ENABLED:
+    atexit.register(dump, TARGET)
@@ -1,95 +1,603 @@
+import functools
+import mmap
 from dataclasses import dataclass
-from typing import Iterable, TypeVar
+from os import PathLike, fstat
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
 
 T = TypeVar("T")
+GridBuffer = Union[bytearray, bytes, mmap.mmap]
 
 
-@dataclass(eq=True, frozen=True)
-class Point:
+class Point(NamedTuple):
+    # A NamedTuple rather than a frozen dataclass: construction skips the
+    # object.__setattr__ dance, and hashing, equality and ordering all happen in C,
+    # which matters for the grid days that do little else.
     x: int
     y: int
 
-    def __add__(self, rhs: "Point") -> "Point":
-        return Point(x=self.x + rhs.x, y=self.y + rhs.y)
+    def __add__(self, rhs: "Point") -> "Point":  # type: ignore[override]
+        return Point(self.x + rhs.x, self.y + rhs.y)
 
     def __sub__(self, rhs: "Point") -> "Point":
-        return Point(x=self.x - rhs.x, y=self.y - rhs.y)
+        return Point(self.x - rhs.x, self.y - rhs.y)
 
-    def __mul__(self, rhs: int) -> "Point":
-        return Point(x=self.x * rhs, y=self.y * rhs)
+    def __mul__(self, rhs: int) -> "Point":  # type: ignore[override]
+        return Point(self.x * rhs, self.y * rhs)
 
-    def __lt__(self, rhs: "Point") -> bool:
-        return (self.x, self.y) < (rhs.x, rhs.y)
+    def __rmul__(self, lhs: int) -> "Point":  # type: ignore[override]
+        # don't let tuple repetition sneak in through 3 * p
+        return Point(self.x * lhs, self.y * lhs)
 
     def reverse(self) -> "Point":
         return Point(-self.x, -self.y)
 
     @staticmethod
     def north() -> "Point":
-        return Point(0, -1)
+        return NORTH
 
     @staticmethod
     def south() -> "Point":
-        return Point(0, 1)
+        return SOUTH
 
     @staticmethod
     def west() -> "Point":
-        return Point(-1, 0)
+        return WEST
 
     @staticmethod
     def east() -> "Point":
-        return Point(1, 0)
+        return EAST
 
     @staticmethod
     def northwest() -> "Point":
-        return Point(-1, -1)
+        return NORTHWEST
 
     @staticmethod
     def northeast() -> "Point":
-        return Point(1, -1)
+        return NORTHEAST
 
     @staticmethod
     def southwest() -> "Point":
-        return Point(-1, 1)
+        return SOUTHWEST
 
     @staticmethod
     def southeast() -> "Point":
-        return Point(1, 1)
+        return SOUTHEAST
 
 
-def adjacent_directions() -> list[Point]:
-    return [
-        Point.northwest(),
-        Point.north(),
-        Point.northeast(),
-        Point.west(),
-        Point.east(),
-        Point.southwest(),
-        Point.south(),
-        Point.southeast(),
-    ]
+NORTH = Point(0, -1)
+SOUTH = Point(0, 1)
+WEST = Point(-1, 0)
+EAST = Point(1, 0)
+NORTHWEST = Point(-1, -1)
+NORTHEAST = Point(1, -1)
+SOUTHWEST = Point(-1, 1)
+SOUTHEAST = Point(1, 1)
+
+ADJACENT_DIRECTIONS: tuple[Point, ...] = (
+    NORTHWEST,
+    NORTH,
+    NORTHEAST,
+    WEST,
+    EAST,
+    SOUTHWEST,
+    SOUTH,
+    SOUTHEAST,
+)
+ORTHOGONAL_DIRECTIONS: tuple[Point, ...] = (NORTH, WEST, EAST, SOUTH)
+
+
+@dataclass(frozen=True)
+class Solver:
+    """How to solve one day: parse the raw input once, then answer each part"""
+
+    parse: Callable[[str], Any]
+    part1: Callable[[Any], Any]
+    part2: Callable[[Any], Any]
+
+
+def adjacent_directions() -> tuple[Point, ...]:
+    return ADJACENT_DIRECTIONS
 
 
 def neighborhood(p: Point) -> Iterable[Point]:
-    return (p + d for d in adjacent_directions())
+    x, y = p
+    return (Point(x + dx, y + dy) for dx, dy in ADJACENT_DIRECTIONS)
 
 
-def orthogonal_directions() -> list[Point]:
-    return [
-        Point.north(),
-        Point.west(),
-        Point.east(),
-        Point.south(),
-    ]
+def orthogonal_directions() -> tuple[Point, ...]:
+    return ORTHOGONAL_DIRECTIONS
 
 
 def orthogonal_neighborhood(p: Point) -> Iterable[Point]:
-    return (p + d for d in orthogonal_directions())
+    x, y = p
+    return (Point(x + dx, y + dy) for dx, dy in ORTHOGONAL_DIRECTIONS)
 
 
 def manhattan_distance(p1: Point, p2: Point) -> int:
     return abs(p1.x - p2.x) + abs(p1.y - p2.y)
 
 
+def iter_lines(source: Iterable[Union[str, bytes]]) -> Iterator[str]:
+    """lines of source without line endings, decoding bytes on the way
+
+    source can be anything that yields lines: a list of strings, or a file object
+    opened in either text or binary mode. Nothing is read ahead, so parsers built
+    on this handle arbitrarily large inputs in constant memory.
+    """
+    for line in source:
+        if isinstance(line, bytes):
+            line = line.decode()
+        yield line.rstrip("\r\n")
+
+
 def transpose(lst: Iterable[Iterable[T]]) -> list[tuple[T, ...]]:
     return list(zip(*lst))
+
+
+@functools.lru_cache(maxsize=16)
+def _transpose_masks(n: int) -> list[tuple[int, int]]:
+    # For an n x n bit matrix packed row-major into one int (cell (r, c) is bit
+    # r * n + c), every block size j swaps the top right and bottom left j x j
+    # blocks of each 2j x 2j block. Cell (r, c) trades places with (r + j, c - j),
+    # which is j * (n - 1) bits further up, so each level is one delta swap.
+    # The masks are repeated byte patterns, built in linear time: the columns
+    # with c & j set, in the rows without r & j.
+    row_bytes = n // 8
+    masks: list[tuple[int, int]] = []
+    j = n // 2
+    while j:
+        if j >= 8:
+            row = (bytes(j // 8) + b"\xff" * (j // 8)) * (n // (2 * j))
+        else:
+            row = bytes([sum(1 << c for c in range(8) if c & j)]) * row_bytes
+        block = row * j + bytes(row_bytes * j)
+        masks.append((j * (n - 1), int.from_bytes(block * (n // (2 * j)), "little")))
+        j //= 2
+    return masks
+
+
+def _transpose_block(rows: Sequence[bytes], n: int) -> bytes:
+    # at most n rows of n bits each in, n columns of n bits each out
+    row_bytes = n // 8
+    matrix = int.from_bytes(
+        b"".join(row.ljust(row_bytes, b"\0") for row in rows), "little"
+    )
+    for shift, mask in _transpose_masks(n):
+        swapped = (matrix ^ (matrix >> shift)) & mask
+        matrix ^= swapped ^ (swapped << shift)
+    return matrix.to_bytes(n * row_bytes, "little")
+
+
+def transpose_bits(rows: Sequence[int], width: int) -> list[int]:
+    """transpose a bit matrix given as one int per row, bit x being column x
+
+    Returns one int per column, bit y being row y. The matrix is cut into square
+    blocks as large as its shorter side (rounded up to a power of two), each of
+    which is packed into a single int and transposed with log2(n) whole-block
+    delta swaps, so the work is O(width * height / wordsize) big int operations
+    rather than a bit fiddle per cell.
+    """
+    height = len(rows)
+    n = 8
+    while n < min(width, height):
+        n *= 2
+    row_bytes = n // 8
+    data = [row.to_bytes((width + 7) // 8, "little") for row in rows]
+
+    if width >= height:
+        # blocks side by side, each giving the next n columns
+        columns: list[int] = []
+        for left in range(0, width, n):
+            first = left // 8
+            packed = _transpose_block(
+                [row[first : first + row_bytes] for row in data], n
+            )
+            columns.extend(
+                int.from_bytes(packed[x * row_bytes : (x + 1) * row_bytes], "little")
+                for x in range(min(n, width - left))
+            )
+        return columns
+
+    # blocks stacked on top of each other, each giving the next n bits of
+    # every column
+    pieces: list[list[bytes]] = [[] for _ in range(width)]
+    for top in range(0, height, n):
+        packed = _transpose_block(data[top : top + n], n)
+        for x, piece in enumerate(pieces):
+            piece.append(packed[x * row_bytes : (x + 1) * row_bytes])
+    return [int.from_bytes(b"".join(piece), "little") for piece in pieces]
+
+
+class Grid2D:
+    """Dense rectangular grid of single-byte cells stored in a flat buffer
+
+    Cells are addressed either with a Point or with a flat index into the
+    buffer, y * stride + x * step. Usually step is 1 and stride is the width,
+    but raw input has every row followed by its line ending, and a transposed
+    view just swaps the two. Reading outside the grid returns the default value
+    instead of raising.
+    """
+
+    __slots__ = ("width", "height", "stride", "step", "cells", "default")
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        cells: Optional[GridBuffer] = None,
+        default: int = ord("."),
+        stride: Optional[int] = None,
+        step: int = 1,
+    ):
+        if stride is None:
+            stride = width * step
+        if cells is None:
+            cells = bytearray([default]) * (stride * height)
+        if (
+            width
+            and height
+            and len(cells) <= (height - 1) * stride + (width - 1) * step
+        ):
+            raise ValueError(
+                f"{len(cells)} bytes is too small for a {width}x{height} grid"
+            )
+        self.width: int = width
+        self.height: int = height
+        self.stride: int = stride
+        self.step: int = step
+        self.cells: GridBuffer = cells
+        self.default: int = default
+
+    @staticmethod
+    def from_string(
+        data: str, *, default: str = ".", translate: Optional[bytes] = None
+    ) -> "Grid2D":
+        lines = [line for line in data.split("\n") if line]
+        width = len(lines[0]) if lines else 0
+        if any(len(line) != width for line in lines):
+            raise ValueError("All grid rows must have the same width")
+        cells = bytearray("".join(lines), "ascii")
+        if translate is not None:
+            cells = cells.translate(translate)
+        return Grid2D(width, len(lines), cells, default=ord(default))
+
+    @staticmethod
+    def from_buffer(buffer: GridBuffer, *, default: str = ".") -> "Grid2D":
+        """view raw grid input as a grid without copying it
+
+        The row stride is taken from the first line ending, which may be either
+        \\n or \\r\\n. The last row doesn't need a line ending.
+        """
+        first_newline = buffer.find(b"\n")
+        if first_newline < 0:
+            return Grid2D(len(buffer), 1 if buffer else 0, buffer, ord(default))
+
+        stride = first_newline + 1
+        width = first_newline
+        if width and buffer[width - 1] == ord("\r"):
+            width -= 1
+
+        height, rest = divmod(len(buffer), stride)
+        if rest == width:
+            height += 1
+        elif rest:
+            raise ValueError("All grid rows must have the same width")
+        line_ending = buffer[width:stride]
+        for y in range(1, height - 1 if rest else height):
+            end = y * stride + width
+            if buffer[end : end + len(line_ending)] != line_ending:
+                raise ValueError("All grid rows must have the same width")
+        # a last row without a line ending must not hide a shorter one
+        if rest and buffer.find(b"\n", len(buffer) - rest) >= 0:
+            raise ValueError("All grid rows must have the same width")
+
+        return Grid2D(width, height, buffer, ord(default), stride=stride)
+
+    @staticmethod
+    def from_file(
+        path: Union[str, PathLike],
+        *,
+        default: str = ".",
+        translate: Optional[bytes] = None,
+    ) -> "Grid2D":
+        """memory map a grid file and view it as a read-only grid
+
+        Nothing is copied: cells are read straight from the page cache, so even
+        huge grids only cost what the operating system decides to keep mapped.
+        With a translation table the cells need to change, so they are copied
+        into a single writable bytearray instead (line endings included).
+        """
+        with open(path, "rb") as f:
+            if fstat(f.fileno()).st_size == 0:
+                raise ValueError(f"Grid file {path} is empty")
+            # the mapping stays valid after the file is closed
+            buffer: GridBuffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if translate is not None:
+            buffer = bytearray(buffer).translate(translate)
+        return Grid2D.from_buffer(buffer, default=default)
+
+    def __str__(self) -> str:
+        return "".join(
+            f"{self.row(y).tobytes().decode()}\n" for y in range(self.height)
+        )
+
+    def __contains__(self, p: Point) -> bool:
+        return 0 <= p.x < self.width and 0 <= p.y < self.height
+
+    def __getitem__(self, p: Point) -> int:
+        x, y = p
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.cells[y * self.stride + x * self.step]
+        return self.default
+
+    def __setitem__(self, p: Point, value: int) -> None:
+        if p not in self:
+            raise IndexError(f"{p} is outside of the grid")
+        # raises TypeError for grids over read-only buffers
+        self.cells[p.y * self.stride + p.x * self.step] = value  # type: ignore[index]
+
+    def transposed(self) -> "Grid2D":
+        """view of the grid with x and y swapped, sharing the same cells"""
+        return Grid2D(
+            self.height,
+            self.width,
+            self.cells,
+            self.default,
+            stride=self.step,
+            step=self.stride,
+        )
+
+    def in_bounds(self, p: Point) -> bool:
+        return p in self
+
+    def index(self, p: Point) -> int:
+        return p.y * self.stride + p.x * self.step
+
+    def point(self, idx: int) -> Point:
+        # the larger of the two strides is the major axis of the buffer; they
+        # are only equal if the grid is one cell wide or tall, and then the
+        # longer side is the major axis
+        if self.stride > self.step or (self.stride == self.step and self.height > 1):
+            y, rest = divmod(idx, self.stride)
+            return Point(rest // self.step, y)
+        x, rest = divmod(idx, self.step)
+        return Point(x, rest // self.stride)
+
+    def find(self, value: int) -> Optional[Point]:
+        """position of some cell with the value, the first one in the buffer"""
+        idx = self.cells.find(bytes([value]))
+        return self.point(idx) if idx >= 0 else None
+
+    def orthogonal_neighbors(self, idx: int) -> Iterator[int]:
+        """flat indices of the in-bounds orthogonal neighbors of idx"""
+        x, y = self.point(idx)
+        if y > 0:
+            yield idx - self.stride
+        if x > 0:
+            yield idx - self.step
+        if x < self.width - 1:
+            yield idx + self.step
+        if y < self.height - 1:
+            yield idx + self.stride
+
+    def neighbors(self, idx: int) -> Iterator[int]:
+        """flat indices of all in-bounds neighbors of idx, diagonals included"""
+        x, y = self.point(idx)
+        for dy in (-1, 0, 1):
+            if not 0 <= y + dy < self.height:
+                continue
+            for dx in (-1, 0, 1):
+                if (dx or dy) and 0 <= x + dx < self.width:
+                    yield idx + dy * self.stride + dx * self.step
+
+    def shifted(self, direction: Point, *, wrap: bool = False) -> "Grid2D":
+        """copy of the grid with every cell moved by direction
+
+        Cells moved past an edge are lost and the vacated cells get the default
+        value, unless wrap is set, in which case they come back in on the
+        opposite side like on a torus.
+        """
+        dx, dy = direction
+        width, height = self.width, self.height
+        rows = [self.row(y).tobytes() for y in range(height)]
+        if not width or not height:
+            return Grid2D(width, height, bytearray(b"".join(rows)), self.default)
+
+        if wrap:
+            dx, dy = dx % width, dy % height
+            rows = rows[height - dy :] + rows[: height - dy]
+            rows = [row[width - dx :] + row[: width - dx] for row in rows]
+        else:
+            blank = bytes([self.default]) * width
+            rows = [
+                rows[y - dy] if 0 <= y - dy < height else blank for y in range(height)
+            ]
+            cut = min(abs(dx), width)
+            if dx >= 0:
+                rows = [blank[:cut] + row[: width - cut] for row in rows]
+            else:
+                rows = [row[cut:] + blank[:cut] for row in rows]
+        return Grid2D(width, height, bytearray(b"".join(rows)), self.default)
+
+    def row(self, y: int) -> memoryview:
+        start = y * self.stride
+        return memoryview(self.cells)[
+            start : start + self.width * self.step : self.step
+        ]
+
+    def column(self, x: int) -> memoryview:
+        start = x * self.step
+        return memoryview(self.cells)[
+            start : start + self.height * self.stride : self.stride
+        ]
+
+
+@functools.cache
+def _edge_masks(width: int, height: int) -> tuple[int, int, int]:
+    # every cell, the first column and the last column of a bitboard
+    cells = (1 << (width * height)) - 1
+    first_column = cells // ((1 << width) - 1) if width else 0
+    return cells, first_column, first_column << (width - 1) if width else 0
+
+
+@dataclass(frozen=True)
+class BitGrid:
+    """Boolean grid packed into a single int, cell (x, y) being bit y * width + x
+
+    Whole-grid operations -- shifting, dilating by a neighborhood, set algebra
+    and counting -- take a handful of big int operations each instead of a
+    Python loop over cells. Cells shifted past an edge are lost, or with
+    wrap=True come back in on the opposite side like on a torus.
+    """
+
+    width: int
+    height: int
+    bits: int = 0
+    wrap: bool = False
+
+    @staticmethod
+    def from_grid(
+        grid: Grid2D, values: Union[int, bytes], *, wrap: bool = False
+    ) -> "BitGrid":
+        """cells of grid holding value, or any of the byte values given"""
+        if isinstance(values, int):
+            values = bytes([values])
+        table = bytes(ord("1") if i in values else ord("0") for i in range(256))
+        digits = b"".join(grid.row(y).tobytes() for y in range(grid.height))
+        # int() wants the most significant digit, so the last cell, first
+        bits = int(digits.translate(table)[::-1] or b"0", 2)
+        return BitGrid(grid.width, grid.height, bits, wrap)
+
+    @staticmethod
+    def from_rows(rows: Iterable[int], width: int, *, wrap: bool = False) -> "BitGrid":
+        bits = 0
+        height = 0
+        for height, row in enumerate(rows, start=1):
+            bits |= row << ((height - 1) * width)
+        return BitGrid(width, height, bits, wrap)
+
+    @staticmethod
+    def from_points(
+        points: Iterable[Point], width: int, height: int, *, wrap: bool = False
+    ) -> "BitGrid":
+        bits = 0
+        for x, y in points:
+            bits |= 1 << (y * width + x)
+        return BitGrid(width, height, bits, wrap)
+
+    def rows(self) -> list[int]:
+        width, height = self.width, self.height
+        if not width:
+            return [0] * height
+        # Shifting the whole int once per row would be quadratic in its size;
+        # binary formatting is linear, and row y is then a slice of the digits
+        # counted from the end.
+        digits = f"{self.bits:0{width * height}b}"
+        end = len(digits)
+        return [
+            int(digits[end - (y + 1) * width : end - y * width], 2)
+            for y in range(height)
+        ]
+
+    def with_bits(self, bits: int) -> "BitGrid":
+        return BitGrid(self.width, self.height, bits, self.wrap)
+
+    def __contains__(self, p: Point) -> bool:
+        x, y = p
+        return (
+            0 <= x < self.width
+            and 0 <= y < self.height
+            and bool(self.bits >> (y * self.width + x) & 1)
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.bits)
+
+    def __or__(self, other: "BitGrid") -> "BitGrid":
+        return self.with_bits(self.bits | other.bits)
+
+    def __and__(self, other: "BitGrid") -> "BitGrid":
+        return self.with_bits(self.bits & other.bits)
+
+    def __sub__(self, other: "BitGrid") -> "BitGrid":
+        return self.with_bits(self.bits & ~other.bits)
+
+    def __invert__(self) -> "BitGrid":
+        cells, _, _ = _edge_masks(self.width, self.height)
+        return self.with_bits(self.bits ^ cells)
+
+    def count(self) -> int:
+        return bin(self.bits).count("1")
+
+    def points(self) -> Iterator[Point]:
+        for y, row in enumerate(self.rows()):
+            while row:
+                lowest = row & -row
+                yield Point(lowest.bit_length() - 1, y)
+                row ^= lowest
+
+    def shift(self, direction: Point) -> "BitGrid":
+        """every cell moved by direction"""
+        width, height = self.width, self.height
+        cells, first_column, last_column = _edge_masks(width, height)
+        bits = self.bits
+        dx, dy = direction
+
+        for _ in range(abs(dx)):
+            if dx > 0:
+                moved = (bits & ~last_column) << 1
+                if self.wrap:
+                    moved |= (bits & last_column) >> (width - 1)
+            else:
+                moved = (bits & ~first_column) >> 1
+                if self.wrap:
+                    moved |= (bits & first_column) << (width - 1)
+            bits = moved
+
+        # whole rows move at once, so only the wrap around needs masking
+        if dy:
+            rows = abs(dy) % height if self.wrap else min(abs(dy), height)
+            rest = (height - rows) * width
+            if dy > 0:
+                moved = (bits << (rows * width)) & cells
+                if self.wrap:
+                    moved |= bits >> rest
+            else:
+                moved = bits >> (rows * width)
+                if self.wrap:
+                    moved |= (bits & ((1 << (rows * width)) - 1)) << rest
+            bits = moved
+
+        return self.with_bits(bits)
+
+    def neighbors(self, *, diagonals: bool = False) -> "BitGrid":
+        """cells next to at least one set cell"""
+        horizontal = self.shift(EAST) | self.shift(WEST)
+        if diagonals:
+            row = self | horizontal
+            return horizontal | row.shift(NORTH) | row.shift(SOUTH)
+        return horizontal | self.shift(NORTH) | self.shift(SOUTH)
+
+    def dilate(self, *, diagonals: bool = False) -> "BitGrid":
+        return self | self.neighbors(diagonals=diagonals)
+
+    def tiled(self, across: int, down: int) -> "BitGrid":
+        """the grid repeated across x down times, as one bigger grid"""
+        width = self.width * across
+        row_copies = sum(1 << (i * self.width) for i in range(across))
+        block = 0
+        for y, row in enumerate(self.rows()):
+            block |= (row * row_copies) << (y * width)
+        block_size = width * self.height
+        bits = block * sum(1 << (i * block_size) for i in range(down))
+        return BitGrid(width, self.height * down, bits, self.wrap)
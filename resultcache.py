@@ -0,0 +1,210 @@
+"""Content-addressed on-disk cache of solver answers
+
+    python -m resultcache info
+    python -m resultcache clear
+
+Answers are keyed by a hash of the day, the part, the input bytes and the
+solver version, which is a hash of the day module's and lib's source code.
+Editing a solver therefore invalidates its answers without any bookkeeping.
+
+Entries are small JSON files in AOC_CACHE_DIR (default
+~/.cache/adventofcode2023). The directory is kept under AOC_CACHE_SIZE bytes by
+evicting the least recently used entries; a hit refreshes the entry's mtime.
+Set AOC_NO_CACHE=1 or pass --no-cache to the runner or a day script to bypass
+the cache entirely.
+"""
+
+import functools
+import json
+import os
+import sys
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Optional, Union
+
+from lib import Solver
+
+ROOT = Path(__file__).parent
+DEFAULT_DIR = Path(
+    os.environ.get("AOC_CACHE_DIR", Path.home() / ".cache" / "adventofcode2023")
+)
+DEFAULT_MAX_BYTES = int(os.environ.get("AOC_CACHE_SIZE", 16 * 2**20))
+# puts between full rescans of the directory, to notice other processes' writes
+RESCAN_EVERY = 256
+
+
+@functools.cache
+def solver_version(day: str) -> str:
+    digest = sha256()
+    for module in (day, "lib"):
+        digest.update((ROOT / f"{module}.py").read_bytes())
+    return digest.hexdigest()
+
+
+def cache_key(day: str, part: int, data: Union[str, bytes]) -> str:
+    if isinstance(data, str):
+        data = data.encode()
+    digest = sha256(f"{day}:{part}:{solver_version(day)}:".encode())
+    digest.update(data)
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    def __str__(self) -> str:
+        return f"{self.hits} hits, {self.misses} misses"
+
+
+class ResultCache:
+    """size-bounded LRU cache of JSON-serializable answers on local disk
+
+    None is never a valid answer, so get returns None for a miss. The size of
+    the directory is scanned once and then tracked as entries are written, so
+    a put only walks the directory when the limit is crossed or every
+    RESCAN_EVERY puts.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path] = DEFAULT_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        # None until the first scan of the directory
+        self.known_size: Optional[int] = None
+        self.puts = 0
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Any:
+        path = self.path(key)
+        try:
+            answer = json.loads(path.read_text())["answer"]
+            # mark as recently used for eviction
+            os.utime(path)
+        except (OSError, ValueError, KeyError):
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return answer
+
+    def put(self, key: str, answer: Any) -> None:
+        try:
+            entry = json.dumps({"answer": answer})
+        except TypeError:
+            # not worth caching what can't be stored faithfully
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # write and rename so concurrent readers never see half an entry
+        with NamedTemporaryFile(
+            "w", dir=self.directory, suffix=".tmp", delete=False
+        ) as f:
+            f.write(entry)
+        os.replace(f.name, self.path(key))
+
+        self.puts += 1
+        if self.known_size is None or self.puts % RESCAN_EVERY == 0:
+            self.evict()
+            return
+        # overwriting an entry overestimates, which at worst evicts a bit early
+        self.known_size += len(entry.encode())
+        if self.known_size > self.max_bytes:
+            self.evict()
+
+    def entries(self) -> list[Path]:
+        return list(self.directory.glob("*.json"))
+
+    def size(self) -> int:
+        return sum(path.stat().st_size for path in self.entries())
+
+    def evict(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # evicted by another process in the meantime
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self.known_size = total
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+        self.known_size = 0
+
+
+def default_cache(bypass: bool = False) -> Optional[ResultCache]:
+    """the shared on-disk cache, unless bypassed by flag or AOC_NO_CACHE"""
+    if bypass or os.environ.get("AOC_NO_CACHE", "") not in ("", "0"):
+        return None
+    return ResultCache()
+
+
+def solve_cached(
+    cache: Optional[ResultCache],
+    day: str,
+    solver: Solver,
+    data: str,
+    parts: tuple[int, ...] = (1, 2),
+) -> dict[int, Any]:
+    """answers for the requested parts, parsing only if one of them is missing"""
+    if cache is None:
+        answers: dict[int, Any] = {}
+    else:
+        answers = {part: cache.get(cache_key(day, part, data)) for part in parts}
+        answers = {
+            part: answer for part, answer in answers.items() if answer is not None
+        }
+
+    missing = [part for part in parts if part not in answers]
+    if missing:
+        parsed = solver.parse(data)
+        for part in missing:
+            answers[part] = (solver.part1 if part == 1 else solver.part2)(parsed)
+            if cache is not None:
+                cache.put(cache_key(day, part, data), answers[part])
+    return answers
+
+
+def solve_stdin(day: str, solver: Solver) -> None:
+    """what every day script's main does: solve stdin, consulting the cache"""
+    cache = default_cache(bypass="--no-cache" in sys.argv[1:])
+    answers = solve_cached(cache, day, solver, sys.stdin.read())
+    for part, answer in sorted(answers.items()):
+        print(f"Part {part}:", answer)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("command", choices=("info", "clear"))
+    args = parser.parse_args()
+
+    cache = ResultCache()
+    if args.command == "info":
+        entries = cache.entries()
+        print(f"{cache.directory}: {len(entries)} entries, {cache.size()} bytes")
+        print(f"limit {cache.max_bytes} bytes")
+    elif args.command == "clear":
+        cache.clear()
+        print(f"Cleared {cache.directory}")
+
+
+if __name__ == "__main__":
+    main()
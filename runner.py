@@ -0,0 +1,205 @@
+"""Run any day's solver with per-phase timings
+
+    python -m runner day05 inputs/day05.txt
+    python -m runner all --json
+
+Every day module exposes a SOLVER (see lib.Solver). The runner times the parse
+step and both parts separately with perf_counter_ns and, unless told otherwise,
+records the peak traced memory of each phase with tracemalloc. Answers are looked
+up in the on-disk result cache first (see resultcache) unless --no-cache is given.
+"""
+
+import json
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from dataclasses import asdict, dataclass
+from importlib import import_module
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, Callable, Optional
+
+from lib import Solver
+from resultcache import ResultCache, cache_key, default_cache
+
+ROOT = Path(__file__).parent
+DAYS: list[str] = sorted(p.stem for p in ROOT.glob("day[0-9][0-9].py"))
+
+
+@dataclass
+class PhaseResult:
+    phase: str
+    elapsed_ns: int
+    peak_memory: Optional[int] = None
+    answer: Any = None
+    cached: bool = False
+
+
+@dataclass
+class RunResult:
+    day: str
+    phases: list[PhaseResult]
+
+    def to_json(self) -> dict:
+        return asdict(self)
+
+    @staticmethod
+    def from_json(data: dict) -> "RunResult":
+        return RunResult(
+            day=data["day"], phases=[PhaseResult(**p) for p in data["phases"]]
+        )
+
+
+def load_solver(day: str) -> Solver:
+    if day not in DAYS:
+        raise ValueError(f"Unknown day '{day}'")
+    return import_module(day).SOLVER
+
+
+def default_input(day: str) -> Path:
+    return ROOT / "inputs" / f"{day}.txt"
+
+
+def timed(
+    phase: str, fn: Callable[[Any], Any], arg: Any, trace_memory: bool
+) -> PhaseResult:
+    if trace_memory:
+        tracemalloc.reset_peak()
+    start = perf_counter_ns()
+    answer = fn(arg)
+    elapsed = perf_counter_ns() - start
+    peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    return PhaseResult(phase=phase, elapsed_ns=elapsed, peak_memory=peak, answer=answer)
+
+
+def run_solver(
+    solver: Solver, data: str, *, parts: tuple[int, ...] = (1, 2), trace_memory=True
+) -> list[PhaseResult]:
+    """parse data and solve the requested parts, timing each phase"""
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        parse = timed("parse", solver.parse, data, trace_memory)
+        parsed = parse.answer
+        parse.answer = None
+        phases = [parse]
+        for part in parts:
+            fn = solver.part1 if part == 1 else solver.part2
+            phases.append(timed(f"part{part}", fn, parsed, trace_memory))
+        return phases
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def run_cached(
+    cache: ResultCache,
+    day: str,
+    data: str,
+    *,
+    parts: tuple[int, ...] = (1, 2),
+    trace_memory=True,
+) -> list[PhaseResult]:
+    """like run_solver, but answers found in the cache are not computed again
+
+    Cached parts are timed as the cache lookup. If every part is cached, the
+    input isn't even parsed.
+    """
+    by_phase: dict[str, PhaseResult] = {}
+    missing: list[int] = []
+    for part in parts:
+        start = perf_counter_ns()
+        answer = cache.get(cache_key(day, part, data))
+        if answer is None:
+            missing.append(part)
+            continue
+        elapsed = perf_counter_ns() - start
+        by_phase[f"part{part}"] = PhaseResult(
+            phase=f"part{part}", elapsed_ns=elapsed, answer=answer, cached=True
+        )
+
+    computed: list[PhaseResult] = []
+    if missing:
+        computed = run_solver(
+            load_solver(day), data, parts=tuple(missing), trace_memory=trace_memory
+        )
+        for part, result in zip(missing, computed[1:]):
+            cache.put(cache_key(day, part, data), result.answer)
+            by_phase[result.phase] = result
+
+    return computed[:1] + [by_phase[f"part{part}"] for part in parts]
+
+
+def run_day(
+    day: str,
+    input_path: Optional[Path] = None,
+    *,
+    parts: tuple[int, ...] = (1, 2),
+    trace_memory=True,
+    cache: Optional[ResultCache] = None,
+) -> RunResult:
+    path = input_path if input_path is not None else default_input(day)
+    data = path.read_text()
+    if cache is not None:
+        phases = run_cached(cache, day, data, parts=parts, trace_memory=trace_memory)
+    else:
+        phases = run_solver(
+            load_solver(day), data, parts=parts, trace_memory=trace_memory
+        )
+    return RunResult(day=day, phases=phases)
+
+
+def format_result(result: RunResult) -> str:
+    lines: list[str] = []
+    for phase in result.phases:
+        line = f"{result.day} {phase.phase:<6} {phase.elapsed_ns / 1e6:>10.3f} ms"
+        if phase.peak_memory is not None:
+            line += f" {phase.peak_memory / 2**20:>9.2f} MiB"
+        if phase.answer is not None:
+            line += f"  {phase.answer}"
+        if phase.cached:
+            line += " (cached)"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("day", help="day module to run, e.g. day05, or 'all'")
+    parser.add_argument("input", nargs="?", type=Path, help="defaults to inputs/")
+    parser.add_argument("--part", type=int, choices=(1, 2), action="append")
+    parser.add_argument("--json", action="store_true", help="emit JSON")
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip tracemalloc; it slows allocation-heavy days down noticeably",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="bypass the on-disk result cache"
+    )
+    args = parser.parse_args()
+
+    if args.day == "all" and args.input is not None:
+        parser.error("an input file can only be given for a single day")
+    days = DAYS if args.day == "all" else [args.day]
+    parts = tuple(args.part) if args.part else (1, 2)
+    cache = default_cache(bypass=args.no_cache)
+
+    results: list[RunResult] = []
+    for day in days:
+        result = run_day(
+            day, args.input, parts=parts, trace_memory=not args.no_memory, cache=cache
+        )
+        results.append(result)
+        if not args.json:
+            print(format_result(result), flush=True)
+
+    if args.json:
+        print(json.dumps([r.to_json() for r in results], indent=2, default=str))
+    if cache is not None:
+        print(f"Result cache: {cache.stats}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
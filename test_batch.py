@@ -0,0 +1,39 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from batch import run_batch, solve_file
+from generators import generate
+
+
+class BatchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.paths = []
+        for seed in range(5):
+            path = Path(self.tmp.name) / f"day09-{seed}.txt"
+            path.write_text(generate("day09", scale=0.02, seed=seed))
+            self.paths.append(str(path))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_batch_matches_sequential(self):
+        expected = {path: solve_file("day09", path).answers for path in self.paths}
+        results = list(run_batch("day09", self.paths, workers=2, chunksize=2))
+        self.assertEqual({result.path: result.answers for result in results}, expected)
+
+    def test_errors_are_reported_per_file(self):
+        missing = str(Path(self.tmp.name) / "missing.txt")
+        results = {
+            result.path: result
+            for result in run_batch("day09", [missing, self.paths[0]], parts=(1,))
+        }
+        self.assertIn("FileNotFoundError", results[missing].error)
+        self.assertEqual(list(results[self.paths[0]].answers), ["part1"])
+
+    def test_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            list(run_batch("day99", self.paths))
+        with self.assertRaises(ValueError):
+            list(run_batch("day09", self.paths, chunksize=0))
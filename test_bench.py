@@ -0,0 +1,92 @@
+import unittest
+
+from bench import (
+    BASELINE_VERSION,
+    DEFAULT_BASELINE,
+    DataclassPoint,
+    PhaseStats,
+    check_baseline,
+    compare_parsers,
+    compare_phase,
+    count_points,
+    dataclass_neighborhood,
+    fit_exponent,
+    load_baseline,
+    load_parsers,
+    measure_point_cost,
+    record_baseline,
+    run_ladder,
+)
+from generators import generate
+from lib import Point, neighborhood
+
+
+class BenchTestCase(unittest.TestCase):
+    def test_fit_exponent(self):
+        sizes = [10, 100, 1000]
+        self.assertAlmostEqual(fit_exponent(sizes, [3 * n for n in sizes]), 1)
+        self.assertAlmostEqual(fit_exponent(sizes, [n**2 for n in sizes]), 2)
+        with self.assertRaises(ValueError):
+            fit_exponent([10, 10], [1, 2])
+
+    def test_run_ladder(self):
+        ladder = run_ladder("day09", scales=(0.1, 0.2))
+        self.assertEqual(len(ladder.steps), 2)
+        self.assertLess(ladder.steps[0].input_size, ladder.steps[1].input_size)
+        self.assertIsNotNone(ladder.exponent("part1"))
+
+    def test_compare_phase(self):
+        baseline = PhaseStats(median_ns=10e6, iqr_ns=1e6, peak_memory=10**6)
+
+        same = PhaseStats(median_ns=10.5e6, iqr_ns=1e6, peak_memory=10**6)
+        self.assertEqual(compare_phase("day01", "parse", baseline, same, 0.2), [])
+
+        # slower by more than the threshold, but within the noise
+        noisy = PhaseStats(median_ns=12.5e6, iqr_ns=2e6, peak_memory=10**6)
+        self.assertEqual(compare_phase("day01", "parse", baseline, noisy, 0.2), [])
+
+        slower = PhaseStats(median_ns=20e6, iqr_ns=1e6, peak_memory=3 * 10**6)
+        regressions = compare_phase("day01", "parse", baseline, slower, 0.2)
+        self.assertEqual([r.metric for r in regressions], ["median_ns", "peak_memory"])
+
+    def test_record_and_check(self):
+        baseline = record_baseline(["day09"], scale=0.1, repeat=3)
+        self.assertEqual(baseline["version"], BASELINE_VERSION)
+        self.assertEqual(set(baseline["days"]["day09"]), {"parse", "part1", "part2"})
+        # nothing in the baseline is slow enough to clear the noise floor
+        self.assertEqual(check_baseline(baseline, threshold=0.5), [])
+
+    def test_committed_baseline(self):
+        baseline = load_baseline(DEFAULT_BASELINE)
+        self.assertEqual(baseline["version"], BASELINE_VERSION)
+        self.assertIn("day09", baseline["days"])
+        with self.assertRaisesRegex(ValueError, "bench record"):
+            load_baseline(DEFAULT_BASELINE.with_name("missing.json"))
+
+    def test_compare_parsers(self):
+        ladder = compare_parsers("day02", scales=(0.5, 1), repeat=1)
+        self.assertEqual(len(ladder.steps), 2)
+        self.assertEqual(set(ladder.steps[0].elapsed_ns), {"regex", "tokenizer"})
+        with self.assertRaises(ValueError):
+            compare_parsers("day99")
+
+    def test_load_parsers(self):
+        self.assertEqual(list(load_parsers("day02")), ["regex", "tokenizer"])
+        self.assertEqual(list(load_parsers("day03")), ["labels", "stream", "bitboard"])
+        with self.assertRaises(ValueError):
+            load_parsers("day09")
+
+    def test_point_benchmark(self):
+        reference = measure_point_cost(
+            DataclassPoint, dataclass_neighborhood, number=200
+        )
+        current = measure_point_cost(Point, neighborhood, number=200)
+        self.assertEqual(set(reference.ns_per_op), set(current.ns_per_op))
+        self.assertTrue(all(ns > 0 for ns in current.ns_per_op.values()))
+        # a NamedTuple of two ints has no instance dict to pay for
+        self.assertLess(current.bytes_per_point, reference.bytes_per_point)
+        self.assertEqual(
+            sorted(dataclass_neighborhood(DataclassPoint(0, 0))),
+            sorted(DataclassPoint(*p) for p in neighborhood(Point(0, 0))),
+        )
+        self.assertGreater(count_points("day16", generate("day16", 0.1, 0)), 0)
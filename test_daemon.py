@@ -0,0 +1,98 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from daemon import SolverClient, SolverServer, TracingLock, preload
+
+
+class DaemonTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.socket_path = Path(self.tmp.name) / "solver.sock"
+        self.server = SolverServer(self.socket_path, preload(["day04", "day09"]))
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.tmp.cleanup()
+
+    def test_solve_requests(self):
+        with SolverClient(self.socket_path) as client:
+            with self.subTest(msg="Inline data"):
+                response = client.solve("day09", data="0 3 6 9 12 15\n")
+                self.assertTrue(response["ok"])
+                phases = response["phases"]
+                self.assertEqual(
+                    [p["phase"] for p in phases], ["parse", "part1", "part2"]
+                )
+                self.assertEqual([p["answer"] for p in phases], [None, 18, -3])
+                self.assertTrue(all(p["elapsed_ns"] > 0 for p in phases))
+
+            with self.subTest(msg="Input path"):
+                response = client.solve("day04", path="inputs/day04.txt", parts=[2])
+                self.assertEqual(response["phases"][-1]["answer"], 5920640)
+
+            with self.subTest(msg="Errors don't drop the connection"):
+                response = client.solve("day05", data="")
+                self.assertFalse(response["ok"])
+                self.assertIn("day05", response["error"])
+                response = client.solve("day09", data="1 2 3\n", parts=[1])
+                self.assertEqual(response["phases"][-1]["answer"], 4)
+
+    def test_concurrent_clients(self):
+        with SolverClient(self.socket_path) as first:
+            first.socket.settimeout(10)
+            response = first.solve("day09", data="1 2 3\n", parts=[1])
+            self.assertEqual(response["phases"][-1]["answer"], 4)
+            # the first connection stays open while a second one is served
+            with SolverClient(self.socket_path) as second:
+                second.socket.settimeout(10)
+                response = second.solve("day09", data="0 3 6\n", parts=[1])
+                self.assertEqual(response["phases"][-1]["answer"], 9)
+            response = first.solve("day09", data="0 3 6\n", parts=[2])
+            self.assertEqual(response["phases"][-1]["answer"], -3)
+
+    def test_socket_is_removed_on_close(self):
+        self.assertTrue(self.socket_path.is_socket())
+        self.server.shutdown()
+        self.server.server_close()
+        self.assertFalse(self.socket_path.exists())
+
+
+class TracingLockTestCase(unittest.TestCase):
+    def test_tracing_runs_alone(self):
+        lock = TracingLock()
+        events = []
+        untraced_started = threading.Event()
+        release_untraced = threading.Event()
+
+        def untraced():
+            with lock.shared():
+                untraced_started.set()
+                release_untraced.wait(10)
+                events.append("untraced done")
+
+        def traced():
+            with lock.exclusive():
+                events.append("traced")
+
+        first = threading.Thread(target=untraced)
+        first.start()
+        untraced_started.wait(10)
+        tracer = threading.Thread(target=traced)
+        tracer.start()
+        tracer.join(0.2)
+        # the traced request waits for the untraced one in flight
+        self.assertTrue(tracer.is_alive())
+        release_untraced.set()
+        first.join(10)
+        tracer.join(10)
+        self.assertEqual(events, ["untraced done", "traced"])
+
+        # untraced requests still run side by side
+        with lock.shared(), lock.shared():
+            pass
@@ -1,6 +1,17 @@
+import tempfile
 import unittest
+from pathlib import Path
 
-from day01 import CalibrationDocument, CorrectedCalibrationDocument
+from day01 import (
+    CalibrationDocument,
+    CorrectedCalibrationDocument,
+    calibration_values_from_file,
+    calibration_values_of_line,
+    chunk_offsets,
+    digit_generator,
+    first_and_last_digits,
+    sum_of_calibration_values,
+)
 
 
 class Day01TestCase(unittest.TestCase):
@@ -26,6 +37,32 @@ class Day01TestCase(unittest.TestCase):
         document = CorrectedCalibrationDocument.from_string("2eighthree")
         self.assertEqual(document.calibration_value(), 23)
 
+    def test_digit_generator(self):
+        table = CorrectedCalibrationDocument.translation_table
+        self.assertEqual(list(digit_generator("eightwo", table=table)), [8, 2])
+        self.assertEqual(
+            list(digit_generator("7oneightwone", table=table)), [7, 1, 8, 2, 1]
+        )
+        self.assertEqual(list(digit_generator("xyz", table=table)), [])
+        # the first matching name in table order wins at each position
+        self.assertEqual(list(digit_generator("a.b", table={"a.": 1, "a": 2})), [1])
+        self.assertEqual(list(digit_generator("axb", table={"a.": 1, "a": 2})), [2])
+
+    def test_first_and_last_digits(self):
+        table = CorrectedCalibrationDocument.translation_table
+        self.assertEqual(first_and_last_digits("eightwo", table=table), (8, 2))
+        self.assertEqual(first_and_last_digits("2eighthree", table=table), (2, 3))
+        self.assertEqual(first_and_last_digits("xsevenx", table=table), (7, 7))
+        with self.assertRaises(ValueError):
+            first_and_last_digits("xyz", table=table)
+
+    def test_calibration_values_of_line(self):
+        self.assertEqual(calibration_values_of_line("two1nine"), (11, 29))
+        self.assertEqual(calibration_values_of_line("7pqrstsixteen"), (77, 76))
+        self.assertEqual(calibration_values_of_line("a1b2c3d4e5f"), (15, 15))
+        with self.assertRaises(ValueError):
+            calibration_values_of_line("xyz")
+
     def test_real_input(self):
         with open("inputs/day01.txt", "r") as f:
             data: str = f.read()
@@ -35,3 +72,36 @@ class Day01TestCase(unittest.TestCase):
                 self.assertEqual(document.calibration_value(), 55123)
             with self.subTest(msg="Part 2"):
                 self.assertEqual(correct_document.calibration_value(), 55260)
+
+    def test_streaming_input(self):
+        with open("inputs/day01.txt", "rb") as f:
+            lines = CorrectedCalibrationDocument.iter_lines(f)
+            self.assertEqual(sum_of_calibration_values(lines), 55260)
+        with open("inputs/day01.txt", "rb") as f:
+            document = CalibrationDocument.from_lines(f)
+            self.assertEqual(document.calibration_value(), 55123)
+        with open("inputs/day01.txt", "rb") as f:
+            self.assertEqual(
+                CorrectedCalibrationDocument.calibration_value_from_lines(f), 55260
+            )
+
+    def test_chunk_offsets(self):
+        data = b"ab\ncd\nefgh\ni\n"
+        for chunks in range(1, 8):
+            with self.subTest(chunks=chunks):
+                offsets = chunk_offsets(data, chunks)
+                self.assertLessEqual(len(offsets), chunks)
+                self.assertEqual(b"".join(data[a:b] for a, b in offsets), data)
+                self.assertTrue(all(data[b - 1 : b] == b"\n" for _, b in offsets))
+        self.assertEqual(chunk_offsets(b"ab\ncd", 2), [(0, 3), (3, 5)])
+
+    def test_parallel_chunks(self):
+        with self.subTest(msg="Real input"):
+            self.assertEqual(
+                calibration_values_from_file("inputs/day01.txt", workers=2, chunks=7),
+                (55123, 55260),
+            )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "empty.txt"
+            path.write_bytes(b"")
+            self.assertEqual(calibration_values_from_file(str(path)), (0, 0))
@@ -1,6 +1,16 @@
+import random
 import unittest
+from unittest import mock
 
-from day02 import CubeCounts, games_from_string, power_sum, sum_of_possible_games
+import day02
+from day02 import (
+    CubeCounts,
+    GameTable,
+    games_from_lines,
+    games_from_string,
+    power_sum,
+    sum_of_possible_games,
+)
 
 
 class Day02TestCase(unittest.TestCase):
@@ -27,3 +37,54 @@ class Day02TestCase(unittest.TestCase):
                 self.assertEqual(sum_of_possible_games(games, bag), 2156)
             with self.subTest(msg="Part 2"):
                 self.assertEqual(power_sum(games), 66909)
+
+    def test_streaming_input(self):
+        bag = CubeCounts(red_count=12, green_count=13, blue_count=14)
+        with open("inputs/day02.txt", "rb") as f:
+            self.assertEqual(sum_of_possible_games(games_from_lines(f), bag), 2156)
+        with open("inputs/day02.txt", "rb") as f:
+            self.assertEqual(power_sum(games_from_lines(f)), 66909)
+
+    def test_game_table(self):
+        with open("inputs/day02.txt", "r") as f:
+            games = games_from_string(f.read())
+        table = GameTable.from_games(games)
+        self.assertEqual(len(table), 100)
+        self.assertEqual(power_sum(games), table.power_sum())
+
+        bags = [
+            CubeCounts(red_count=r, green_count=g, blue_count=b)
+            for r in range(0, 22, 3)
+            for g in range(0, 22, 4)
+            for b in range(0, 22, 5)
+        ]
+        self.assertEqual(
+            table.sums_of_possible_games(bags),
+            [sum_of_possible_games(games, bag) for bag in bags],
+        )
+        self.assertEqual(table.sum_of_possible_games(CubeCounts(12, 13, 14)), 2156)
+
+    def test_tokenizer(self):
+        with open("inputs/day02.txt", "r") as f:
+            expected = GameTable.from_games(games_from_string(f.read()))
+        with open("inputs/day02.txt", "r") as f:
+            self.assertEqual(GameTable.from_lines(f), expected)
+        with open("inputs/day02.txt", "rb") as f:
+            table = GameTable.from_lines(f)
+        self.assertEqual(table, expected)
+        self.assertEqual(table.sum_of_possible_games(CubeCounts(12, 13, 14)), 2156)
+        self.assertEqual(table.power_sum(), 66909)
+
+    def test_sums_of_possible_games_wide_counts(self):
+        rng = random.Random(2)
+        table = GameTable()
+        for game_id in range(1, 301):
+            table.append(game_id, *(rng.randint(0, 10**6) for _ in range(3)))
+        bags = [
+            CubeCounts(*(rng.randint(0, 10**6) for _ in range(3))) for _ in range(200)
+        ]
+        expected = [table.sum_of_possible_games(bag) for bag in bags]
+        self.assertEqual(table.sums_of_possible_games(bags), expected)
+        with mock.patch.object(day02, "MAX_FENWICK_CELLS", 100):
+            self.assertEqual(table.sums_of_possible_games(bags), expected)
+        self.assertEqual(GameTable().sums_of_possible_games(bags[:3]), [0, 0, 0])
@@ -1,6 +1,17 @@
 import unittest
 
-from day03 import Schematic, sum_of_gear_ratios, sum_of_part_numbers
+from day03 import (
+    ENGINES,
+    NumberLabels,
+    NumberSpan,
+    Schematic,
+    stream_parts,
+    sum_of_gear_ratios,
+    sum_of_part_numbers,
+    sums_from_lines,
+)
+from generators import generate
+from lib import Grid2D, Point
 
 
 class Day03TestCase(unittest.TestCase):
@@ -23,6 +34,24 @@ class Day03TestCase(unittest.TestCase):
         with self.subTest(msg="Part 2"):
             self.assertEqual(sum_of_gear_ratios(schematic), 467835)
 
+    def test_line_endings_and_ragged_rows(self):
+        # the line ending next to a number is not a symbol
+        schematic = Schematic.from_string("..5\r\n...\r\n")
+        self.assertEqual(sum_of_part_numbers(schematic), 0)
+        schematic = Schematic.from_string("467..\r\n...*.\r\n..35.\r\n")
+        self.assertEqual(sum_of_part_numbers(schematic), 467 + 35)
+        schematic = Schematic.from_string("467\n...*\n\n..35\n")
+        self.assertEqual([part.numbers for part in schematic.parts], [[467]])
+
+    def test_number_labels(self):
+        grid = Grid2D.from_string("12.3\n.*..\n45.6\n")
+        labels = NumberLabels.from_grid(grid)
+        self.assertEqual(labels.labels, [0, 0, -1, 1, -1, -1, -1, -1, 2, 2, -1, 3])
+        self.assertEqual(labels.numbers[2], NumberSpan(value=45, y=2, start=0, end=2))
+        # 12 and 45 touch the symbol with both digits but count once each
+        adjacent = labels.adjacent_numbers(grid, grid.index(Point(1, 1)))
+        self.assertEqual([n.value for n in adjacent], [12, 45])
+
     def test_real_data(self):
         with open("inputs/day03.txt", "r") as f:
             data = f.read()
@@ -31,3 +60,46 @@ class Day03TestCase(unittest.TestCase):
                 self.assertEqual(sum_of_part_numbers(schematic), 539713)
             with self.subTest(msg="Part 2"):
                 self.assertEqual(sum_of_gear_ratios(schematic), 84159075)
+
+    def test_streaming_input(self):
+        with open("inputs/day03.txt", "r") as f:
+            schematic = Schematic.from_string(f.read())
+        with open("inputs/day03.txt", "rb") as f:
+            self.assertEqual(list(stream_parts(f)), schematic.parts)
+        with open("inputs/day03.txt", "rb") as f:
+            self.assertEqual(sums_from_lines(f), (539713, 84159075))
+
+    def test_streaming_edges(self):
+        # numbers touching symbols only diagonally, on the first and last line
+        lines = ["1..2", ".*#.", "3..4"]
+        self.assertEqual(
+            [part.numbers for part in stream_parts(lines)], [[1, 3], [2, 4]]
+        )
+        self.assertEqual(list(stream_parts([])), [])
+
+    def test_engines_agree(self):
+        with open("inputs/day03.txt", "r") as f:
+            data = f.read()
+        for name, engine in ENGINES.items():
+            with self.subTest(engine=name):
+                self.assertEqual(engine(data), (539713, 84159075))
+            with self.subTest(engine=name, line_endings="CRLF"):
+                crlf = data.replace("\n", "\r\n")
+                self.assertEqual(engine(crlf), (539713, 84159075))
+                self.assertEqual(engine("..5\r\n...\r\n"), (0, 0))
+
+        # generated schematics have numbers next to several symbols, and
+        # non-gear symbols with two numbers
+        # blank rows keep rows apart, and surrounding whitespace is no symbol
+        for data, expected in (
+            ("467\n...*\n\n..35\n", (467, 0)),
+            (" 12\n*..\n", (12, 0)),
+            ("\n\n1.\n.*\n\n", (1, 0)),
+        ):
+            for name, engine in ENGINES.items():
+                with self.subTest(engine=name, data=data):
+                    self.assertEqual(engine(data), expected)
+
+        data = generate("day03", scale=0.5, seed=1)
+        answers = {name: engine(data) for name, engine in ENGINES.items()}
+        self.assertEqual(len(set(answers.values())), 1, answers)
@@ -1,6 +1,13 @@
 import unittest
 
-from day04 import Card, count_scratch_cards, parse_cards, total_score
+from day04 import (
+    Card,
+    count_scratch_cards,
+    iter_cards,
+    parse_cards,
+    scratch_cards_of_matches,
+    total_score,
+)
 
 
 class Day04TestCase(unittest.TestCase):
@@ -27,3 +34,36 @@ class Day04TestCase(unittest.TestCase):
                 self.assertEqual(total_score(cards), 23235)
             with self.subTest(msg="Part 2"):
                 self.assertEqual(count_scratch_cards(cards), 5920640)
+
+    def test_streaming_input(self):
+        with open("inputs/day04.txt", "rb") as f:
+            self.assertEqual(total_score(iter_cards(f)), 23235)
+        with open("inputs/day04.txt", "rb") as f:
+            self.assertEqual(count_scratch_cards(iter_cards(f)), 5920640)
+
+    def test_bitmask_cards(self):
+        card = next(iter_cards(["Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53"]))
+        self.assertEqual(card.winning, sum(1 << n for n in (41, 48, 83, 86, 17)))
+        self.assertEqual(card.match_count, 4)
+
+    def test_scratch_card_propagation(self):
+        def naive(counts):
+            copies = [1] * len(counts)
+            for i, m in enumerate(counts):
+                for j in range(i + 1, i + m + 1):
+                    copies[j] += copies[i]
+            return sum(copies)
+
+        for counts in (
+            [],
+            [0],
+            [4, 2, 2, 1, 0, 0],
+            [3, 3, 3, 2, 1, 0],
+            [1] * 199 + [0],
+        ):
+            with self.subTest(counts=counts):
+                self.assertEqual(scratch_cards_of_matches(counts), naive(counts))
+                self.assertEqual(
+                    scratch_cards_of_matches(iter(counts), modulus=1000),
+                    naive(counts) % 1000,
+                )
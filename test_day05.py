@@ -1,6 +1,7 @@
+import random
 import unittest
 
-from day05 import Almanac, lowest_location
+from day05 import Almanac, CategoryMap, CategoryRange, PiecewiseMap, lowest_location
 
 
 class Day05TestCase(unittest.TestCase):
@@ -56,3 +57,80 @@ class Day05TestCase(unittest.TestCase):
             with self.subTest(msg="Part 2"):
                 almanac = Almanac.from_string(data, seeds_as_ranges=True)
                 self.assertEqual(lowest_location(almanac), 9622622)
+
+    def test_piecewise_map(self):
+        table = PiecewiseMap.from_ranges(
+            [
+                CategoryRange(source=range(98, 100), target=range(50, 52)),
+                CategoryRange(source=range(50, 98), target=range(52, 100)),
+            ]
+        )
+        self.assertEqual(table.starts, [0, 50, 98, 100])
+        self.assertEqual(
+            [table(v) for v in (-1, 0, 49, 50, 97, 98, 99, 100)],
+            [-1, 0, 49, 52, 99, 50, 51, 100],
+        )
+        self.assertEqual(
+            table.map_range(range(40, 110)),
+            [range(40, 50), range(52, 100), range(50, 52), range(100, 110)],
+        )
+        self.assertEqual(table.map_range(range(5, 5)), [])
+        with self.assertRaises(ValueError):
+            PiecewiseMap.from_ranges(
+                [
+                    CategoryRange(source=range(0, 10), target=range(5, 15)),
+                    CategoryRange(source=range(5, 8), target=range(0, 3)),
+                ]
+            )
+
+    def test_composed_table(self):
+        with open("inputs/day05.txt", "r") as f:
+            almanac = Almanac.from_string(f.read())
+        table = almanac.seed_to_location
+        self.assertIs(table, almanac.seed_to_location)
+
+        def naive(value):
+            category = "seed"
+            while category in almanac.maps:
+                category_map = almanac.maps[category]
+                for c in category_map.maps:
+                    if value in c.source:
+                        value += c.offset()
+                        break
+                category = category_map.target
+            return value
+
+        rng = random.Random(5)
+        seeds = [rng.randrange(2**32) for _ in range(500)]
+        # every breakpoint of the composed table, and its neighbors
+        seeds += [s + d for s in table.starts for d in (-1, 0, 1)]
+        seeds += [seed for r in almanac.seeds for seed in r]
+        for seed in seeds:
+            self.assertEqual(table(seed), naive(seed), seed)
+
+        for _ in range(20):
+            start = rng.randrange(2**32)
+            r = range(start, start + rng.randrange(1, 200))
+            self.assertEqual(
+                sorted(v for m in table.map_range(r) for v in m),
+                sorted(map(naive, r)),
+            )
+
+    def test_category_map_range(self):
+        category_map = CategoryMap.from_string(
+            "a-to-b map:\n30 10 5\n0 20 3\n7 15 5\n100 50 10\n"
+        )
+        self.assertEqual([c.source.start for c in category_map.maps], [10, 15, 20, 50])
+        self.assertEqual(category_map.pieces.starts, [0, 10, 15, 20, 23, 50, 60])
+
+        def naive(value):
+            for c in category_map.maps:
+                if value in c.source:
+                    return value + c.offset()
+            return value
+
+        for r in (range(0, 70), range(12, 13), range(14, 21), range(22, 55)):
+            with self.subTest(r=r):
+                mapped = category_map.map_range(r)
+                self.assertEqual(sum(len(m) for m in mapped), len(r))
+                self.assertEqual([v for m in mapped for v in m], list(map(naive, r)))
@@ -1,6 +1,12 @@
 import unittest
 
-from day07 import parse_hands, parse_hands_with_jokers, winnings
+from day07 import (
+    iter_hands,
+    iter_hands_with_jokers,
+    parse_hands,
+    parse_hands_with_jokers,
+    winnings,
+)
 
 
 class Day07TestCase(unittest.TestCase):
@@ -25,3 +31,9 @@ class Day07TestCase(unittest.TestCase):
             with self.subTest(msg="Part 2"):
                 hands = parse_hands_with_jokers(data)
                 self.assertEqual(winnings(hands), 250825971)
+
+    def test_streaming_input(self):
+        with open("inputs/day07.txt", "rb") as f:
+            self.assertEqual(winnings(iter_hands(f)), 251216224)
+        with open("inputs/day07.txt", "rb") as f:
+            self.assertEqual(winnings(iter_hands_with_jokers(f)), 250825971)
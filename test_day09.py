@@ -1,6 +1,11 @@
 import unittest
 
-from day09 import parse_histories, sum_of_next_values, sum_of_previous_values
+from day09 import (
+    iter_histories,
+    parse_histories,
+    sum_of_next_values,
+    sum_of_previous_values,
+)
 
 
 class Day09TestCase(unittest.TestCase):
@@ -21,3 +26,7 @@ class Day09TestCase(unittest.TestCase):
                 self.assertEqual(sum_of_next_values(histories), 1757008019)
             with self.subTest(msg="Part 2"):
                 self.assertEqual(sum_of_previous_values(histories), 995)
+
+    def test_streaming_input(self):
+        with open("inputs/day09.txt", "rb") as f:
+            self.assertEqual(sum_of_next_values(iter_histories(f)), 1757008019)
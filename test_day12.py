@@ -3,6 +3,7 @@ import unittest
 from day12 import (
     SpringRow,
     count_arrangements,
+    iter_spring_rows,
     parse_spring_rows,
     unfold_row,
     unfold_rows,
@@ -50,3 +51,8 @@ class Day12TestCase(unittest.TestCase):
                 rows = unfold_rows(rows)
                 total = sum(count_arrangements(row) for row in rows)
                 self.assertEqual(total, 33992866292225)
+
+    def test_streaming_input(self):
+        with open("inputs/day12.txt", "rb") as f:
+            total = sum(count_arrangements(row) for row in iter_spring_rows(f))
+            self.assertEqual(total, 7195)
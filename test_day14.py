@@ -1,6 +1,7 @@
 import unittest
 
 from day14 import Grid
+from lib import Point
 
 
 class Day14TestCase(unittest.TestCase):
@@ -23,7 +24,6 @@ class Day14TestCase(unittest.TestCase):
         with self.subTest(msg="Part 2"):
             self.assertEqual(grid.n_cycles(1000000000).load, 64)
 
-    @unittest.skip("Too slow; takes 10 seconds")
     def test_real_data(self):
         with open("inputs/day14.txt", "r") as f:
             data = f.read()
@@ -32,3 +32,14 @@ class Day14TestCase(unittest.TestCase):
                 self.assertEqual(grid.tilt().load, 108889)
             with self.subTest(msg="Part 2"):
                 self.assertEqual(grid.n_cycles(1000000000).load, 104671)
+
+    def test_tilt(self):
+        grid = Grid.from_string("O.#\n.O.\n..O\n")
+        self.assertEqual(str(grid.tilt()), "OO#\n..O\n...\n")
+        self.assertEqual(str(grid.tilt(Point.south())), "..#\n...\nOOO\n")
+        self.assertEqual(str(grid.tilt(Point.west())), "O.#\nO..\nO..\n")
+        self.assertEqual(str(grid.tilt(Point.east())), ".O#\n..O\n..O\n")
+
+    def test_from_file(self):
+        grid = Grid.from_file("inputs/day14.txt")
+        self.assertEqual(grid.tilt().load, 108889)
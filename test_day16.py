@@ -41,3 +41,8 @@ class Day16TestCase(unittest.TestCase):
 
             with self.subTest(msg="Part 2"):
                 self.assertEqual(most_energized_configuration(grid), 7831)
+
+    def test_from_file(self):
+        grid = Grid.from_file("inputs/day16.txt")
+        start_beam = Beam(pos=Point(-1, 0), v=Point(1, 0))
+        self.assertEqual(count_energized_tiles(grid, start_beam), 7111)
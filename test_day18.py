@@ -1,6 +1,6 @@
 import unittest
 
-from day18 import lagoon_size, parse_instruction, swap_instructions
+from day18 import iter_instructions, lagoon_size, parse_instruction, swap_instructions
 
 
 class Day18TestCase(unittest.TestCase):
@@ -41,3 +41,10 @@ class Day18TestCase(unittest.TestCase):
             with self.subTest(msg="Part 2"):
                 swapped_instructions = swap_instructions(dig_instructions)
                 self.assertEqual(lagoon_size(swapped_instructions), 102000662718092)
+
+    def test_streaming_input(self):
+        with open("inputs/day18.txt", "rb") as f:
+            self.assertEqual(lagoon_size(iter_instructions(f)), 46334)
+        with open("inputs/day18.txt", "rb") as f:
+            swapped = (inst.swap() for inst in iter_instructions(f))
+            self.assertEqual(lagoon_size(swapped), 102000662718092)
@@ -1,6 +1,6 @@
 import unittest
 
-from day19 import accepted_rating, count_distinct_combinations, parse_input
+from day19 import accepted_rating, count_distinct_combinations, parse_input, read_input
 
 
 class Day19TestCase(unittest.TestCase):
@@ -44,3 +44,8 @@ class Day19TestCase(unittest.TestCase):
                 self.assertEqual(
                     count_distinct_combinations(workflows), 131619440296497
                 )
+
+    def test_streaming_input(self):
+        with open("inputs/day19.txt", "rb") as f:
+            workflows, parts = read_input(f)
+            self.assertEqual(accepted_rating(workflows, parts), 287054)
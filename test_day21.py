@@ -30,7 +30,6 @@ class Day21TestCase(unittest.TestCase):
         # no example data tests for part 2 -- the example data has rocks in
         # the same rows and columns as S, which breaks my way of interpolation.
 
-    @unittest.skip("Waaaaay too slow; takes 5 minutes")
     def test_real_data(self):
         with open("inputs/day21.txt", "r") as f:
             data = f.read()
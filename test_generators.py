@@ -0,0 +1,33 @@
+import unittest
+
+from generators import GENERATORS, generate
+from runner import DAYS, load_solver, run_solver
+
+
+class GeneratorsTestCase(unittest.TestCase):
+    def test_every_day_has_a_generator(self):
+        self.assertEqual(sorted(GENERATORS), DAYS)
+
+    def test_deterministic(self):
+        self.assertEqual(generate("day17", 0.1, seed=3), generate("day17", 0.1, seed=3))
+        self.assertNotEqual(generate("day17", 0.1, seed=3), generate("day17", 0.1))
+
+    def test_input_grows_with_scale(self):
+        for day in ("day01", "day14", "day22"):
+            with self.subTest(day=day):
+                small, large = len(generate(day, 0.5)), len(generate(day, 2))
+                self.assertAlmostEqual(large / small, 4, delta=1)
+
+    def test_generated_inputs_are_solvable(self):
+        for day in DAYS:
+            with self.subTest(day=day):
+                phases = run_solver(
+                    load_solver(day), generate(day, 0.05), trace_memory=False
+                )
+                self.assertTrue(all(p.answer is not None for p in phases[1:]))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            generate("day99")
+        with self.assertRaises(ValueError):
+            generate("day01", scale=0)
@@ -0,0 +1,52 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import instrument
+
+
+class InstrumentTestCase(unittest.TestCase):
+    def tearDown(self):
+        instrument.reset()
+
+    def test_counters_and_timers(self):
+        instrument.count("test.loops")
+        instrument.count("test.loops", 2)
+        instrument.record_time("test.phase", 10)
+        instrument.record_time("test.phase", 5)
+        snapshot = instrument.snapshot()
+        self.assertEqual(snapshot["counters"]["test.loops"], 3)
+        self.assertEqual(snapshot["timers"]["test.phase"], {"calls": 2, "total_ns": 15})
+
+    def test_solvers_report_when_enabled(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            target = Path(tmp) / "stats.json"
+            # generated inputs; day12 and day14 are slow on the real data
+            script = (
+                "from generators import generate\n"
+                "from runner import load_solver, run_solver\n"
+                "for day in ('day12', 'day14', 'day16', 'day17', 'day20'):\n"
+                "    run_solver(load_solver(day), generate(day, 0.05))\n"
+            )
+            env = dict(os.environ, AOC_INSTRUMENT=str(target))
+            subprocess.run([sys.executable, "-c", script], env=env, check=True)
+            stats = json.loads(target.read_text())
+
+        for counter in (
+            "day14.cycle_probes",
+            "day16.beam_steps",
+            "day17.heap_pops",
+            "day17.heap_pushes",
+            "day20.button_presses",
+            "day20.pulses",
+        ):
+            with self.subTest(counter=counter):
+                self.assertGreater(stats["counters"][counter], 0)
+        for timer in ("day14.n_cycles", "day16.count_energized_tiles"):
+            with self.subTest(timer=timer):
+                self.assertGreater(stats["timers"][timer]["calls"], 0)
+        self.assertGreater(stats["gauges"]["day12.count_arrangements"]["misses"], 0)
@@ -0,0 +1,240 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from lib import (
+    BitGrid,
+    Grid2D,
+    Point,
+    adjacent_directions,
+    manhattan_distance,
+    neighborhood,
+    orthogonal_neighborhood,
+    transpose_bits,
+)
+
+
+class PointTestCase(unittest.TestCase):
+    def test_arithmetic(self):
+        self.assertEqual(Point(1, 2) + Point(3, 4), Point(4, 6))
+        self.assertEqual(Point(1, 2) - Point(3, 4), Point(-2, -2))
+        self.assertEqual(Point(1, -2) * 3, Point(3, -6))
+        self.assertEqual(3 * Point(1, -2), Point(3, -6))
+        self.assertEqual(Point.north().reverse(), Point.south())
+
+    def test_ordering_and_hashing(self):
+        self.assertLess(Point(0, 5), Point(1, 0))
+        self.assertLess(Point(1, 0), Point(1, 1))
+        self.assertEqual(len({Point(1, 1), Point(1, 1), Point(x=1, y=1)}), 1)
+
+    def test_directions_are_interned(self):
+        self.assertIs(Point.north(), Point.north())
+        self.assertIs(adjacent_directions(), adjacent_directions())
+
+    def test_neighborhood(self):
+        self.assertEqual(len(set(neighborhood(Point(5, 5)))), 8)
+        self.assertTrue(
+            all(
+                manhattan_distance(Point(5, 5), p) <= 2
+                for p in neighborhood(Point(5, 5))
+            )
+        )
+
+
+class Grid2DTestCase(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid2D.from_string("#..\n.S.\n..#\n.#.\n")
+
+    def test_dimensions_and_access(self):
+        self.assertEqual((self.grid.width, self.grid.height), (3, 4))
+        self.assertEqual(self.grid[Point(1, 1)], ord("S"))
+        self.assertEqual(self.grid[Point(-1, 0)], ord("."))
+        self.assertEqual(self.grid[Point(3, 0)], ord("."))
+        self.assertIn(Point(2, 3), self.grid)
+        self.assertNotIn(Point(2, 4), self.grid)
+        self.assertEqual(self.grid.find(ord("S")), Point(1, 1))
+        self.assertEqual(str(self.grid), "#..\n.S.\n..#\n.#.\n")
+
+    def test_setitem(self):
+        self.grid[Point(1, 1)] = ord(".")
+        self.assertIsNone(self.grid.find(ord("S")))
+        with self.assertRaises(IndexError):
+            self.grid[Point(5, 5)] = ord("#")
+
+    def test_neighbors(self):
+        corner = self.grid.index(Point(0, 0))
+        self.assertEqual(
+            [self.grid.point(i) for i in self.grid.orthogonal_neighbors(corner)],
+            [Point(1, 0), Point(0, 1)],
+        )
+        center = self.grid.index(Point(1, 1))
+        self.assertEqual(len(list(self.grid.neighbors(center))), 8)
+        self.assertEqual(len(list(self.grid.neighbors(corner))), 3)
+
+    def test_row_and_column_views(self):
+        self.assertEqual(self.grid.row(2).tobytes(), b"..#")
+        self.assertEqual(self.grid.column(1).tobytes(), b".S.#")
+
+    def test_ragged_rows(self):
+        with self.assertRaises(ValueError):
+            Grid2D.from_string("...\n..\n")
+
+    def test_from_buffer(self):
+        for data in (
+            b"#..\n.S.\n..#\n.#.\n",
+            b"#..\r\n.S.\r\n..#\r\n.#.",
+            b"#..\n.S.\n..#\n.#.",
+        ):
+            with self.subTest(data=data):
+                grid = Grid2D.from_buffer(data)
+                self.assertEqual((grid.width, grid.height), (3, 4))
+                self.assertEqual(str(grid), str(self.grid))
+                self.assertEqual(grid.find(ord("S")), Point(1, 1))
+                self.assertEqual(grid[Point(3, 0)], ord("."))
+                self.assertEqual(grid.column(1).tobytes(), b".S.#")
+                self.assertEqual(
+                    sorted(grid.orthogonal_neighbors(grid.index(Point(1, 1)))),
+                    sorted(
+                        grid.index(p)
+                        for p in (Point(1, 0), Point(0, 1), Point(2, 1), Point(1, 2))
+                    ),
+                )
+
+        for ragged in (
+            b"...\n..\n...\n",
+            b"#..\n..\n",
+            b"#..\n...\n..\n",
+            b"#..\n.\n.",
+        ):
+            with self.subTest(ragged=ragged), self.assertRaises(ValueError):
+                Grid2D.from_buffer(ragged)
+
+    def test_from_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "grid.txt"
+            path.write_bytes(b"#..\n.S.\n..#\n.#.\n")
+            grid = Grid2D.from_file(path)
+            self.assertEqual(str(grid), str(self.grid))
+            with self.assertRaises(TypeError):
+                grid[Point(0, 0)] = ord(".")
+
+            translated = Grid2D.from_file(path, translate=bytes.maketrans(b"#", b"X"))
+            self.assertEqual(translated[Point(0, 0)], ord("X"))
+            translated[Point(1, 1)] = ord(".")
+            self.assertEqual(str(translated), "X..\n...\n..X\n.X.\n")
+
+            path.write_bytes(b"")
+            with self.assertRaisesRegex(ValueError, "empty"):
+                Grid2D.from_file(path)
+
+    def test_transposed_view(self):
+        transposed = self.grid.transposed()
+        self.assertEqual((transposed.width, transposed.height), (4, 3))
+        self.assertEqual(str(transposed), "#...\n.S.#\n..#.\n")
+        self.assertEqual(transposed.find(ord("S")), Point(1, 1))
+        self.assertEqual(transposed.row(1).tobytes(), self.grid.column(1).tobytes())
+        self.assertEqual(
+            sorted(transposed.point(i) for i in transposed.neighbors(0)),
+            [Point(0, 1), Point(1, 0), Point(1, 1)],
+        )
+        self.assertEqual(str(transposed.transposed()), str(self.grid))
+
+        # views share the cells
+        transposed[Point(3, 1)] = ord("X")
+        self.assertEqual(self.grid[Point(1, 3)], ord("X"))
+
+        raw = Grid2D.from_buffer(b"#..\r\n.S.\r\n..#\r\n.#.\r\n").transposed()
+        self.assertEqual(str(raw), "#...\n.S.#\n..#.\n")
+
+    def test_degenerate_shapes(self):
+        # one cell wide or tall, both strides can be 1
+        column = Grid2D.from_string("a\nb\nc\n")
+        row = column.transposed()
+        self.assertEqual((row.width, row.height), (3, 1))
+        self.assertEqual(row.point(2), Point(2, 0))
+        self.assertEqual(row.find(ord("c")), Point(2, 0))
+        self.assertEqual(column.find(ord("c")), Point(0, 2))
+        self.assertEqual(row.transposed().point(2), Point(0, 2))
+
+        shifted = column.shifted(Point(0, 1), wrap=True)
+        self.assertEqual(shifted.find(ord("a")), Point(0, 1))
+        shifted = row.shifted(Point(1, 0), wrap=True)
+        self.assertEqual(str(shifted), "cab\n")
+        self.assertEqual(shifted.find(ord("a")), Point(1, 0))
+        single = Grid2D.from_string("x\n")
+        self.assertEqual(single.transposed().find(ord("x")), Point(0, 0))
+
+    def test_shifted(self):
+        self.assertEqual(str(self.grid.shifted(Point(1, -1))), "..S\n...\n..#\n...\n")
+        self.assertEqual(
+            str(self.grid.shifted(Point(1, -1), wrap=True)), "..S\n#..\n..#\n.#.\n"
+        )
+
+
+class BitGridTestCase(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid2D.from_string("#..\n.S.\n..#\n.#.\n")
+        self.rocks = BitGrid.from_grid(self.grid, ord("#"))
+
+    def test_conversions(self):
+        self.assertEqual(self.rocks.rows(), [0b001, 0b000, 0b100, 0b010])
+        self.assertEqual(BitGrid.from_rows(self.rocks.rows(), 3), self.rocks)
+        self.assertEqual(
+            set(self.rocks.points()), {Point(0, 0), Point(2, 2), Point(1, 3)}
+        )
+        self.assertEqual(BitGrid.from_points(self.rocks.points(), 3, 4), self.rocks)
+        self.assertEqual(BitGrid.from_grid(self.grid, b"#S").count(), 4)
+        self.assertIn(Point(2, 2), self.rocks)
+        self.assertNotIn(Point(3, 2), self.rocks)
+        self.assertEqual((~self.rocks).count(), 9)
+
+    def test_shift(self):
+        self.assertEqual(self.rocks.shift(Point(1, 0)).rows(), [0b010, 0, 0, 0b100])
+        self.assertEqual(self.rocks.shift(Point(0, -1)).rows(), [0, 0b100, 0b010, 0])
+        torus = BitGrid.from_grid(self.grid, ord("#"), wrap=True)
+        self.assertEqual(torus.shift(Point(1, 0)).rows(), [0b010, 0, 0b001, 0b100])
+        self.assertEqual(torus.shift(Point(0, -1)).rows(), [0, 0b100, 0b010, 0b001])
+
+    def test_neighborhoods_match_point_neighborhoods(self):
+        for diagonals, neighbors in (
+            (False, orthogonal_neighborhood),
+            (True, neighborhood),
+        ):
+            with self.subTest(diagonals=diagonals):
+                expected = {
+                    n
+                    for p in self.rocks.points()
+                    for n in neighbors(p)
+                    if n in self.grid
+                }
+                self.assertEqual(
+                    set(self.rocks.neighbors(diagonals=diagonals).points()), expected
+                )
+                self.assertEqual(
+                    set(self.rocks.dilate(diagonals=diagonals).points()),
+                    expected | set(self.rocks.points()),
+                )
+
+    def test_tiled(self):
+        tiled = self.rocks.tiled(2, 2)
+        self.assertEqual((tiled.width, tiled.height), (6, 8))
+        self.assertEqual(tiled.rows(), [0b001001, 0, 0b100100, 0b010010] * 2)
+
+
+class TransposeTestCase(unittest.TestCase):
+    def test_transpose_bits(self):
+        shapes = ((1, 1), (3, 5), (8, 8), (9, 17), (40, 3), (0, 4), (5, 0))
+        # tall and narrow or short and wide, cut into many square blocks
+        shapes += ((2, 3000), (3000, 2), (70, 1000))
+        for width, height in shapes:
+            with self.subTest(width=width, height=height):
+                rows = [
+                    (y * 0x9E3779B97F4A7C15 * (y + width) >> 3) % (1 << width)
+                    for y in range(1, height + 1)
+                ]
+                # one column per x even without rows
+                expected = [
+                    sum(((row >> x) & 1) << y for y, row in enumerate(rows))
+                    for x in range(width)
+                ]
+                self.assertEqual(transpose_bits(rows, width), expected)
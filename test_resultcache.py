@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from lib import Solver
+from resultcache import ResultCache, cache_key, solve_cached
+from runner import run_cached
+
+
+class ResultCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ResultCache(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_cache_key(self):
+        key = cache_key("day09", 1, "1 2 3\n")
+        self.assertEqual(key, cache_key("day09", 1, b"1 2 3\n"))
+        self.assertNotEqual(key, cache_key("day09", 2, "1 2 3\n"))
+        self.assertNotEqual(key, cache_key("day10", 1, "1 2 3\n"))
+        self.assertNotEqual(key, cache_key("day09", 1, "1 2 4\n"))
+
+    def test_get_and_put(self):
+        self.assertIsNone(self.cache.get("a"))
+        self.cache.put("a", 42)
+        self.assertEqual(self.cache.get("a"), 42)
+        self.assertEqual((self.cache.stats.hits, self.cache.stats.misses), (1, 1))
+
+        # answers that can't round-trip through JSON aren't cached
+        self.cache.put("b", object())
+        self.assertIsNone(self.cache.get("b"))
+
+    def test_least_recently_used_are_evicted(self):
+        self.cache.max_bytes = 3 * len('{"answer": 1}')
+        for mtime, key in enumerate("abc"):
+            self.cache.put(key, 1)
+            os.utime(self.cache.path(key), (mtime, mtime))
+        # a hit makes "a" the most recently used entry
+        self.assertEqual(self.cache.get("a"), 1)
+        self.cache.put("d", 1)
+        self.assertEqual(sorted(p.stem for p in self.cache.entries()), ["a", "c", "d"])
+
+    def test_puts_only_scan_when_needed(self):
+        entry_size = len('{"answer": 1}')
+        self.cache.max_bytes = 10 * entry_size
+        with mock.patch.object(self.cache, "evict", wraps=self.cache.evict) as evict:
+            for key in range(8):
+                self.cache.put(str(key), 1)
+            # the first put learns the size, the others just add to it
+            self.assertEqual(evict.call_count, 1)
+            for key in range(8, 20):
+                self.cache.put(str(key), 1)
+            self.assertGreater(evict.call_count, 1)
+        self.assertLessEqual(self.cache.size(), self.cache.max_bytes)
+        self.assertEqual(self.cache.known_size, self.cache.size())
+
+    def test_solve_cached_skips_parsing_on_hits(self):
+        calls = []
+
+        def parse(data):
+            calls.append(data)
+            return data.split()
+
+        solver = Solver(parse=parse, part1=len, part2=lambda words: words[0])
+        self.assertEqual(
+            solve_cached(self.cache, "day01", solver, "b a"), {1: 2, 2: "b"}
+        )
+        self.assertEqual(
+            solve_cached(self.cache, "day01", solver, "b a"), {1: 2, 2: "b"}
+        )
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(solve_cached(None, "day01", solver, "b a"), {1: 2, 2: "b"})
+        self.assertEqual(len(calls), 2)
+
+    def test_run_cached(self):
+        data = "0 3 6 9 12 15\n"
+        self.cache.put(cache_key("day09", 2, data), -3)
+        phases = run_cached(self.cache, "day09", data, trace_memory=False)
+        self.assertEqual([p.phase for p in phases], ["parse", "part1", "part2"])
+        self.assertEqual([p.answer for p in phases], [None, 18, -3])
+        self.assertEqual([p.cached for p in phases], [False, False, True])
+
+        phases = run_cached(self.cache, "day09", data, parts=(2, 1))
+        self.assertEqual([p.phase for p in phases], ["part2", "part1"])
+        self.assertTrue(all(p.cached for p in phases))
@@ -0,0 +1,29 @@
+import unittest
+from importlib import import_module
+
+from lib import Solver
+from runner import DAYS, load_solver, run_day, run_solver
+
+
+class RunnerTestCase(unittest.TestCase):
+    def test_every_day_has_a_solver(self):
+        self.assertEqual(len(DAYS), 22)
+        for day in DAYS:
+            with self.subTest(day=day):
+                self.assertIsInstance(import_module(day).SOLVER, Solver)
+
+    def test_unknown_day(self):
+        with self.assertRaises(ValueError):
+            load_solver("day99")
+
+    def test_run_solver_phases(self):
+        phases = run_solver(load_solver("day09"), "0 3 6 9 12 15\n", trace_memory=False)
+        self.assertEqual([p.phase for p in phases], ["parse", "part1", "part2"])
+        self.assertEqual([p.answer for p in phases], [None, 18, -3])
+        self.assertTrue(all(p.peak_memory is None for p in phases))
+
+    def test_run_day(self):
+        result = run_day("day04", parts=(2,))
+        self.assertEqual([p.phase for p in result.phases], ["parse", "part2"])
+        self.assertEqual(result.phases[-1].answer, 5920640)
+        self.assertTrue(all(p.peak_memory for p in result.phases))